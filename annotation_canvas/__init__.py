@@ -28,10 +28,6 @@ __author__ = "KY"
 __email__ = "1980983959@qq.com"
 __license__ = "GPL-3.0"
 
-# 导入主要组件
-from .ui.annotation_canvas import AnnotationCanvas
-from .ui.annotation_controller import AnnotationController
-
 # 导入核心类
 from .core.enums import DrawType, DrawColor, PenWidth, ControlPointType
 from .models.shape import BaseShape
@@ -63,8 +59,29 @@ from .operations.import_operation import ImportOperation
 from .factories.shape_factory import ShapeFactory
 from .services.shape_creation_service import ShapeCreationService
 
-# 导入渲染策略
-from .render.optimized_render_factory import OptimizedRenderFactory as RenderStrategyFactory
+# 延迟导入的组件（依赖 PySide6.QtWidgets 与 PyQtGraph，首次访问时才加载）
+_LAZY_ATTRS = {
+    "AnnotationCanvas": (".ui.annotation_canvas", "AnnotationCanvas"),
+    "AnnotationController": (".ui.annotation_controller", "AnnotationController"),
+    "RenderStrategyFactory": (".render.optimized_render_factory", "OptimizedRenderFactory"),
+}
+
+
+def __getattr__(name):
+    """按需导入重量级组件（PEP 562）"""
+    target = _LAZY_ATTRS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    module_name, attr_name = target
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    globals()[name] = value  # 缓存，后续访问不再经过 __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 # 定义公开的API
 __all__ = [
@@ -134,6 +151,7 @@ def create_canvas(parent=None):
     Returns:
         AnnotationCanvas: 配置好的画布实例
     """
+    from .ui.annotation_canvas import AnnotationCanvas
     return AnnotationCanvas()
 
 def create_demo_app():
@@ -5,11 +5,17 @@
 from .enums import (
     DrawType, DrawColor, PenWidth, ControlPointType,
     OperationState, InteractionMode, MouseLocation,
-    MouseButtonState, ScaleMode
+    MouseButtonState, ScaleMode,
+    DT_NONE, DT_POINT, DT_RECTANGLE, DT_ELLIPSE, DT_POLYGON,
+    DRAW_TYPE_BY_VALUE, DRAW_COLOR_BY_VALUE, PEN_WIDTH_BY_VALUE,
+    CPT_CENTER, CPT_CORNER, CPT_EDGE, CPT_VERTEX, CPT_CUSTOM
 )
 
 __all__ = [
     'DrawType', 'DrawColor', 'PenWidth', 'ControlPointType',
     'OperationState', 'InteractionMode', 'MouseLocation',
-    'MouseButtonState', 'ScaleMode'
+    'MouseButtonState', 'ScaleMode',
+    'DT_NONE', 'DT_POINT', 'DT_RECTANGLE', 'DT_ELLIPSE', 'DT_POLYGON',
+    'DRAW_TYPE_BY_VALUE', 'DRAW_COLOR_BY_VALUE', 'PEN_WIDTH_BY_VALUE',
+    'CPT_CENTER', 'CPT_CORNER', 'CPT_EDGE', 'CPT_VERTEX', 'CPT_CUSTOM'
 ]
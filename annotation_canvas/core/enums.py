@@ -14,6 +14,13 @@ class DrawType(IntEnum):
     ELLIPSE = 3    # 椭圆：矩形内接椭圆，只需要两个对角点
     POLYGON = 4    # 多边形：需要多个点
 
+# 热路径使用的原始整数常量（与DrawType取值一致，比较时避免枚举开销）
+DT_NONE = int(DrawType.NONE)
+DT_POINT = int(DrawType.POINT)
+DT_RECTANGLE = int(DrawType.RECTANGLE)
+DT_ELLIPSE = int(DrawType.ELLIPSE)
+DT_POLYGON = int(DrawType.POLYGON)
+
 class DrawColor(IntEnum):
     """颜色枚举"""
     NONE = 0
@@ -35,6 +42,11 @@ class PenWidth(IntEnum):
     ULTRA_THIN = 4
     ULTRA_THICK = 5
 
+# 取值 -> 枚举成员（反序列化热路径使用，避免每次调用 Enum 构造）
+DRAW_TYPE_BY_VALUE = {member.value: member for member in DrawType}
+DRAW_COLOR_BY_VALUE = {member.value: member for member in DrawColor}
+PEN_WIDTH_BY_VALUE = {member.value: member for member in PenWidth}
+
 class ControlPointType(IntEnum):
     """控制点类型枚举"""
     CENTER = 0     # 中心点
@@ -43,6 +55,13 @@ class ControlPointType(IntEnum):
     VERTEX = 3     # 顶点
     CUSTOM = 4     # 自定义控制点
 
+# 热路径使用的原始整数常量（与ControlPointType取值一致）
+CPT_CENTER = int(ControlPointType.CENTER)
+CPT_CORNER = int(ControlPointType.CORNER)
+CPT_EDGE = int(ControlPointType.EDGE)
+CPT_VERTEX = int(ControlPointType.VERTEX)
+CPT_CUSTOM = int(ControlPointType.CUSTOM)
+
 class OperationState(IntEnum):
     """操作状态枚举"""
     IDLE = 0           # 空闲状态
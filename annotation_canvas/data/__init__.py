@@ -3,5 +3,6 @@
 """
 
 from .data_manager import DataManager
+from .shape_snapshot import ShapeListSnapshot
 
-__all__ = ['DataManager']
+__all__ = ['DataManager', 'ShapeListSnapshot']
@@ -2,17 +2,22 @@
 数据管理器 - 负责图形数据的CRUD操作
 """
 
+import time
 from typing import List, Optional, Dict, Any
-from PySide6.QtCore import QPointF
+from PySide6.QtCore import QPointF, QRectF
 
 from ..events import EventBus, Event, EventType
 from ..core import DrawType, DrawColor, PenWidth
-from ..models import BaseShape
+from ..models import BaseShape, PolygonShape, ShapeStore
+from ..models.shape import next_shape_id
 from ..factories import ShapeFactory
 from ..operations import ImportOperation
+from ..services.spatial_index import SpatialIndex
 from ..utils.constants import InteractionConstants
 from ..utils.logger import get_logger
 from ..utils.exceptions import DataManagerError, ShapeCreationError
+from ..utils.serialization import pack_points
+from .shape_snapshot import ShapeListSnapshot
 
 logger = get_logger(__name__)
 
@@ -29,6 +34,12 @@ class DataManager:
         """
         self.event_bus = event_bus
         self._shapes: List[BaseShape] = []
+        # _shapes 被快照共享时为True，下次增删图形前先复制（写时复制）
+        self._shapes_shared = False
+        self._shapes_by_id: Dict[int, BaseShape] = {}  # 图形编号 -> 图形
+        self._spatial_index = SpatialIndex()  # 网格空间索引，用于命中检测
+        # 与_shapes同序的SoA边界存储，几何变化同步时顺带更新空间索引
+        self._shape_store = ShapeStore(on_sync=self._spatial_index.update)
         self._selected_shape: Optional[BaseShape] = None
         self._hovered_shape: Optional[BaseShape] = None
         self._temp_shape: Optional[BaseShape] = None
@@ -51,12 +62,16 @@ class DataManager:
         Args:
             shape: 要添加的图形
         """
-        # 检查是否已经存在相同的图形（防止重复添加）
-        if shape in self._shapes:
+        # 检查是否已经存在相同的图形（防止重复添加，按编号查找无需遍历列表）
+        if self._shapes_by_id.get(shape.shape_id) is shape:
             logger.warning(f"图形已存在，跳过添加: {shape}")
             return
         
+        self._own_shapes()
         self._shapes.append(shape)
+        self._register_shape_id(shape)
+        self._shape_store.add(shape)
+        self._spatial_index.insert(shape)
         self._update_modified_time()
         
         # 发布事件
@@ -65,6 +80,14 @@ class DataManager:
             {'shape': shape, 'index': len(self._shapes) - 1}
         ))
     
+    def _register_shape_id(self, shape: BaseShape) -> None:
+        """登记图形编号；与场景中其他图形编号冲突时（如加载了编号重复的数据）为其重新分配编号"""
+        if shape.shape_id in self._shapes_by_id:
+            old_id = shape.shape_id
+            shape.shape_id = next_shape_id()
+            logger.warning(f"图形编号 {old_id} 已被占用，重新分配为 {shape.shape_id}")
+        self._shapes_by_id[shape.shape_id] = shape
+    
     def remove_shape(self, shape: BaseShape) -> bool:
         """
         移除图形
@@ -75,9 +98,13 @@ class DataManager:
         Returns:
             是否成功移除
         """
-        if shape in self._shapes:
+        if self._shapes_by_id.get(shape.shape_id) is shape:
             index = self._shapes.index(shape)
-            self._shapes.remove(shape)
+            self._own_shapes()
+            del self._shapes[index]
+            del self._shapes_by_id[shape.shape_id]
+            self._shape_store.remove(shape)
+            self._spatial_index.remove(shape)
             self._update_modified_time()
             
             # 如果移除的是选中的图形，清除选择
@@ -98,8 +125,13 @@ class DataManager:
     
     def clear_all_shapes(self) -> None:
         """清空所有图形"""
-        removed_shapes = self._shapes.copy()
-        self._shapes.clear()
+        # 换用新列表而非原地清空，旧列表可能仍被快照共享
+        removed_shapes = self._shapes
+        self._shapes = []
+        self._shapes_shared = False
+        self._shapes_by_id = {}
+        self._shape_store.clear()
+        self._spatial_index.clear()
         self._selected_shape = None
         self._hovered_shape = None
         self._temp_shape = None
@@ -112,6 +144,47 @@ class DataManager:
                 {'shape': shape, 'index': -1}
             ))
     
+    def _own_shapes(self) -> None:
+        """原地修改图形列表前调用：列表被快照共享时先复制一份"""
+        if self._shapes_shared:
+            self._shapes = list(self._shapes)
+            self._shapes_shared = False
+    
+    def snapshot_shapes(self) -> ShapeListSnapshot:
+        """
+        获取当前图形列表的快照（O(1)，不复制列表）
+        
+        Returns:
+            共享当前图形列表的快照
+        """
+        self._shapes_shared = True
+        return ShapeListSnapshot(self._shapes)
+    
+    def restore_shapes(self, snapshot: ShapeListSnapshot) -> None:
+        """
+        以快照替换当前全部图形
+        
+        直接共享快照的列表，不逐个查重添加；存储与空间索引仍需按图形重建
+        
+        Args:
+            snapshot: 由 snapshot_shapes 获取的快照
+        """
+        self.clear_all_shapes()
+        self._shapes = snapshot.shapes
+        self._shapes_shared = True
+        for shape in self._shapes:
+            self._shapes_by_id[shape.shape_id] = shape
+            self._shape_store.add(shape)
+            self._spatial_index.insert(shape)
+        self._update_modified_time()
+        
+        # 发布事件
+        for index, shape in enumerate(self._shapes):
+            self.event_bus.publish(Event(
+                EventType.SHAPE_ADDED,
+                {'shape': shape, 'index': index}
+            ))
+    
     def get_shapes(self) -> List[BaseShape]:
         """
         获取所有图形列表（直接引用，请勿修改）
@@ -121,10 +194,38 @@ class DataManager:
         """
         return self._shapes
     
+    def get_shape_by_id(self, shape_id: int) -> Optional[BaseShape]:
+        """
+        按编号获取图形
+        
+        Args:
+            shape_id: 图形编号（BaseShape.shape_id）
+            
+        Returns:
+            图形，不存在时返回None
+        """
+        return self._shapes_by_id.get(shape_id)
+    
     def get_shape_count(self) -> int:
         """获取图形数量"""
         return len(self._shapes)
     
+    def get_shapes_in_rect(self, rect: QRectF) -> List[BaseShape]:
+        """
+        获取边界与指定矩形相交的图形（向量化查询，按层叠顺序）
+        
+        Args:
+            rect: 查询矩形
+            
+        Returns:
+            图形列表
+        """
+        return self._shape_store.query_rect(rect.left(), rect.top(), rect.right(), rect.bottom())
+    
+    def get_shape_store(self) -> ShapeStore:
+        """获取SoA图形存储"""
+        return self._shape_store
+    
     # 选择管理
     def select_shape(self, shape: Optional[BaseShape]) -> None:
         """
@@ -170,10 +271,10 @@ class DataManager:
             self._hovered_shape = shape
             
             # 发布悬停变化事件
-            self.event_bus.publish(Event(
+            self.event_bus.publish_transient(
                 EventType.HOVER_CHANGED,
                 {'old_shape': old_hovered, 'new_shape': shape}
-            ))
+            )
     
     def get_hovered_shape(self) -> Optional[BaseShape]:
         """获取悬停的图形"""
@@ -245,45 +346,65 @@ class DataManager:
     
     def _get_control_point_at(self, pos: QPointF, shape: BaseShape, pixel_size: float) -> Optional[Any]:
         """获取指定位置的控制点"""
-        from ..utils.geometry import GeometryUtils
-        
         pixel_tolerance = InteractionConstants.CONTROL_POINT_TOLERANCE
         tolerance = pixel_tolerance * pixel_size if pixel_size > 0 else pixel_tolerance
         
-        for cp in shape.get_control_points():
-            # 使用距离计算而不是简单的坐标差比较
-            distance = GeometryUtils.distance_between_points(pos, cp.position)
-            if distance <= tolerance:
-                return cp
-        return None
+        return shape.find_control_point(pos, tolerance)
     
     def _get_shape_at(self, pos: QPointF, pixel_size: float) -> Optional[BaseShape]:
         """获取指定位置的图形"""
         pixel_tolerance = InteractionConstants.PIXEL_TOLERANCE
         tolerance = pixel_tolerance * pixel_size if pixel_size > 0 else pixel_tolerance
+        return self.get_shape_at_position(pos, tolerance)
+    
+    def get_shape_at_position(self, pos: QPointF, tolerance: float = None) -> Optional[BaseShape]:
+        """
+        获取指定位置（边界命中）的最上层图形
         
-        # 从后往前检查，优先选择最上层的图形
-        for shape in reversed(self._shapes):
+        Args:
+            pos: 位置
+            tolerance: 容差（世界坐标），为None时使用默认像素容差
+        """
+        if tolerance is None:
+            tolerance = InteractionConstants.PIXEL_TOLERANCE
+        
+        # 先用空间索引筛选候选，再按层叠顺序从后往前精确检查，优先选择最上层的图形
+        self._shape_store.sync()
+        candidates = self._spatial_index.query_point(pos.x(), pos.y(), tolerance)
+        if not candidates:
+            return None
+        for shape in sorted(candidates, key=lambda s: s._store_index, reverse=True):
             if shape.contains_point_on_boundary(pos, tolerance):
                 return shape
         return None
     
     # 数据导入导出
-    def export_data(self) -> Dict[str, Any]:
+    def export_data(self, compact: bool = False) -> Dict[str, Any]:
         """
         导出数据
         
+        Args:
+            compact: 是否将多边形顶点编码为 base64 字符串（体积更小、解析更快）
+        
         Returns:
             导出的数据字典
         """
+        shapes = []
+        for shape in self._shapes:
+            shape_dict = shape.to_dict()
+            if compact and isinstance(shape, PolygonShape):
+                shape_dict['vertices'] = pack_points(shape.get_vertex_array())
+            shapes.append(shape_dict)
+        
+        # settings 写在 shapes 之前，流式导入时只需读取文件开头即可取得设置
         return {
-            'shapes': [shape.to_dict() for shape in self._shapes],
-            'metadata': self._metadata.copy(),
             'settings': {
                 'current_tool': self._current_tool.value,
                 'current_color': self._current_color.value,
                 'current_width': self._current_width.value
-            }
+            },
+            'shapes': shapes,
+            'metadata': self._metadata.copy()
         }
     
     def import_data(self, data: Dict[str, Any]) -> bool:
@@ -305,6 +426,9 @@ class DataManager:
                 shape = self._create_shape_from_dict(shape_data)
                 if shape:
                     self._shapes.append(shape)
+                    self._register_shape_id(shape)
+                    self._shape_store.add(shape)
+                    self._spatial_index.insert(shape)
             
             # 导入元数据
             self._metadata.update(data.get('metadata', {}))
@@ -356,13 +480,39 @@ class DataManager:
             logger.error(error_msg)
             raise DataManagerError(error_msg, operation="import_data_with_undo") from e
     
+    def import_file_with_undo(self, file_path: str, operation_manager) -> bool:
+        """
+        从JSON文件导入数据（支持撤销，安装 ijson 时流式解析图形）
+        
+        Args:
+            file_path: JSON文件路径
+            operation_manager: 操作管理器
+            
+        Returns:
+            是否成功导入
+        """
+        try:
+            import_operation = ImportOperation.from_path(file_path, self, operation_manager)
+            success = operation_manager.execute_operation(import_operation)
+            
+            if success:
+                logger.info(f"成功导入 {import_operation.get_imported_count()} 个图形（支持撤销）")
+            else:
+                logger.error("导入操作执行失败")
+            
+            return success
+            
+        except Exception as e:
+            error_msg = f"导入文件失败: {e}"
+            logger.error(error_msg)
+            raise DataManagerError(error_msg, operation="import_file_with_undo") from e
+    
     def _create_shape_from_dict(self, shape_data: Dict[str, Any]) -> Optional[BaseShape]:
         """从字典数据创建图形"""
         return ShapeFactory.create_from_dict(shape_data)
     
     def _update_modified_time(self) -> None:
         """更新修改时间"""
-        import time
         self._metadata['modified_time'] = time.time()
         if not self._metadata.get('created_time'):
             self._metadata['created_time'] = time.time()
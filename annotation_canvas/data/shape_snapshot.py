@@ -0,0 +1,41 @@
+"""
+图形列表快照 - 写时复制方式保存某一时刻的图形列表
+"""
+
+from typing import Iterator, List
+
+from ..models import BaseShape
+
+
+class ShapeListSnapshot:
+    """
+    图形列表快照
+    
+    创建时只引用数据管理器当前的图形列表，不复制；数据管理器在快照存在期间
+    首次增删图形时才复制列表（或直接换用新列表），快照引用的列表保持不变
+    """
+    
+    __slots__ = ('_shapes',)
+    
+    def __init__(self, shapes: List[BaseShape]):
+        """
+        初始化快照
+        
+        Args:
+            shapes: 被共享的图形列表（调用方此后不得原地修改）
+        """
+        self._shapes = shapes
+    
+    @property
+    def shapes(self) -> List[BaseShape]:
+        """快照中的图形列表（共享引用，请勿修改）"""
+        return self._shapes
+    
+    def __len__(self) -> int:
+        return len(self._shapes)
+    
+    def __iter__(self) -> Iterator[BaseShape]:
+        return iter(self._shapes)
+    
+    def __repr__(self) -> str:
+        return f"ShapeListSnapshot(count={len(self._shapes)})"
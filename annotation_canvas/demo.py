@@ -11,19 +11,51 @@ from PySide6.QtWidgets import (
     QWidget, QPushButton, QLabel, QComboBox, QGroupBox,
     QMenuBar, QMenu, QStatusBar, QMessageBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QPointF
 from PySide6.QtGui import QAction, QKeySequence
 
 # 处理相对导入问题
 try:
     from .ui.annotation_canvas import AnnotationCanvas
     from .core.enums import DrawType, DrawColor, PenWidth
+    from .models import PointShape, RectangleShape, EllipseShape, PolygonShape
+    from .utils.serialization import load_json, save_json
 except ImportError:
     # 如果相对导入失败，尝试绝对导入
     import os
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from annotation_canvas.ui.annotation_canvas import AnnotationCanvas
     from annotation_canvas.core.enums import DrawType, DrawColor, PenWidth
+    from annotation_canvas.models import PointShape, RectangleShape, EllipseShape, PolygonShape
+    from annotation_canvas.utils.serialization import load_json, save_json
+
+
+def _make_test_point(x, y, color, width):
+    return PointShape(QPointF(x, y), color, width)
+
+
+def _make_test_rectangle(x, y, color, width):
+    return RectangleShape(QPointF(x, y), QPointF(x + 30, y + 20), color, width)
+
+
+def _make_test_ellipse(x, y, color, width):
+    return EllipseShape(QPointF(x, y), QPointF(x + 30, y + 20), color, width)
+
+
+def _make_test_polygon(x, y, color, width):
+    vertices = [QPointF(x, y), QPointF(x + 30, y), QPointF(x + 15, y + 25)]
+    shape = PolygonShape(vertices, color, width)
+    shape.close_polygon()
+    return shape
+
+
+# 绘图工具 -> 测试图形构造函数（表查找代替逐个比较工具类型）
+_SHAPE_CTORS = {
+    DrawType.POINT: _make_test_point,
+    DrawType.RECTANGLE: _make_test_rectangle,
+    DrawType.ELLIPSE: _make_test_ellipse,
+    DrawType.POLYGON: _make_test_polygon,
+}
 
 
 class AnnotationCanvasDemo(QMainWindow):
@@ -444,32 +476,18 @@ class AnnotationCanvasDemo(QMainWindow):
             """
         )
     
-    def _add_test_shape_with_undo(self):
-        """添加测试图形（支持撤销）"""
-        from annotation_canvas.models import PointShape, RectangleShape
-        from PySide6.QtCore import QPointF
-        
-        # 创建随机位置的测试图形
+    def _create_test_shape(self):
+        """按当前工具、颜色和线宽在随机位置创建测试图形（未知工具时创建点）"""
         x = random.randint(-100, 100)
         y = random.randint(-100, 100)
         
-        # 获取当前设置
-        current_tool = self.canvas.controller.data_manager.get_current_tool()
-        current_color = self.canvas.controller.data_manager.get_current_color()
-        current_width = self.canvas.controller.data_manager.get_current_width()
-        
-        if current_tool == DrawType.POINT:
-            shape = PointShape(QPointF(x, y), current_color, current_width)
-        elif current_tool == DrawType.RECTANGLE:
-            shape = RectangleShape(
-                QPointF(x, y), 
-                QPointF(x + 30, y + 20), 
-                current_color, 
-                current_width
-            )
-        else:
-            # 默认创建点
-            shape = PointShape(QPointF(x, y), current_color, current_width)
+        data_manager = self.canvas.controller.data_manager
+        ctor = _SHAPE_CTORS.get(data_manager.get_current_tool(), _make_test_point)
+        return ctor(x, y, data_manager.get_current_color(), data_manager.get_current_width())
+    
+    def _add_test_shape_with_undo(self):
+        """添加测试图形（支持撤销）"""
+        shape = self._create_test_shape()
         
         # 使用支持撤销的添加方法
         success = self.canvas.add_shape(shape)
@@ -481,30 +499,7 @@ class AnnotationCanvasDemo(QMainWindow):
     
     def _add_test_shape_no_undo(self):
         """添加测试图形（不支持撤销）"""
-        from annotation_canvas.models import PointShape, RectangleShape
-        from PySide6.QtCore import QPointF
-        
-        # 创建随机位置的测试图形
-        x = random.randint(-100, 100)
-        y = random.randint(-100, 100)
-        
-        # 获取当前设置
-        current_tool = self.canvas.controller.data_manager.get_current_tool()
-        current_color = self.canvas.controller.data_manager.get_current_color()
-        current_width = self.canvas.controller.data_manager.get_current_width()
-        
-        if current_tool == DrawType.POINT:
-            shape = PointShape(QPointF(x, y), current_color, current_width)
-        elif current_tool == DrawType.RECTANGLE:
-            shape = RectangleShape(
-                QPointF(x, y), 
-                QPointF(x + 30, y + 20), 
-                current_color, 
-                current_width
-            )
-        else:
-            # 默认创建点
-            shape = PointShape(QPointF(x, y), current_color, current_width)
+        shape = self._create_test_shape()
         
         # 使用不支持撤销的添加方法
         self.canvas.add_shape(shape)
@@ -513,7 +508,6 @@ class AnnotationCanvasDemo(QMainWindow):
     def _import_data(self):
         """导入数据"""
         from PySide6.QtWidgets import QFileDialog, QMessageBox
-        import json
         
         # 选择文件
         file_path, _ = QFileDialog.getOpenFileName(
@@ -523,8 +517,7 @@ class AnnotationCanvasDemo(QMainWindow):
         if file_path:
             try:
                 # 读取文件
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = load_json(file_path)
                 
                 # 使用导入方法
                 success = self.canvas.import_data(data)
@@ -545,7 +538,6 @@ class AnnotationCanvasDemo(QMainWindow):
     def _export_data(self):
         """导出数据"""
         from PySide6.QtWidgets import QFileDialog, QMessageBox
-        import json
         
         # 选择文件
         file_path, _ = QFileDialog.getSaveFileName(
@@ -558,8 +550,7 @@ class AnnotationCanvasDemo(QMainWindow):
                 data = self.canvas.export_data()
                 
                 # 保存文件
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                save_json(file_path, data)
                 
                 shape_count = len(data.get('shapes', []))
                 QMessageBox.information(
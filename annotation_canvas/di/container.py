@@ -4,13 +4,25 @@
 提供完善的依赖注入功能，用于管理模块之间的依赖关系。
 """
 
-from typing import Any, Dict, Type, TypeVar, Callable, Optional, List, Set
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, Dict, Iterator, Type, TypeVar, Callable, Optional, List, Set, Tuple
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 T = TypeVar('T')
 
+# 注册项类型标记
+_INSTANCE = 0  # 已有实例（含已创建的单例服务）
+_FACTORY = 1   # 工厂函数
+_SERVICE = 2   # 单例服务（尚未创建）
+_SCOPED = 3    # 作用域服务（实例保存在当前作用域中）
+
+_MISSING = object()
+
 
 class DIContainer:
     """依赖注入容器"""
@@ -19,77 +31,175 @@ class DIContainer:
         self._services: Dict[Type, Type] = {}  # 接口 -> 实现类
         self._factories: Dict[Type, Callable] = {}  # 接口 -> 工厂函数
         self._singletons: Dict[Type, Any] = {}  # 接口 -> 单例实例
-        self._scoped: Dict[Type, Any] = {}  # 接口 -> 作用域实例
+        # 当前作用域的实例表（接口 -> 作用域实例），由 scope() 设置，各线程/上下文互不影响
+        self._scope_var = ContextVar('di_scope', default=None)
         self._dependencies: Dict[Type, List[Type]] = {}  # 接口 -> 依赖列表
         self._initialization_order: List[Type] = []  # 初始化顺序
         self._initialized: Set[Type] = set()  # 已初始化的服务
+        # 接口 -> (类型标记, 实例/工厂/实现类)，get 只需一次字典查找
+        self._entries: Dict[Type, Tuple[int, Any]] = {}
+        # 基类 -> 实现了该基类的已注册接口（注册时按实现类的MRO建立，供 get_all 查询）
+        self._impls_by_base: Dict[Type, List[Type]] = defaultdict(list)
+        # 接口 -> 依赖解析函数列表（build() 时生成，创建实例时按顺序调用）
+        self._resolve_plan: Dict[Type, List[Callable[[], Any]]] = {}
+        self._building: Set[Type] = set()  # 正在创建的服务（检测循环依赖）
     
     def register_singleton(self, interface: Type[T], implementation: Type[T], dependencies: List[Type] = None) -> None:
         """注册单例服务"""
+        self._index_implementation(interface, implementation)
         self._services[interface] = implementation
         self._dependencies[interface] = dependencies or []
+        self._entries[interface] = (_SERVICE, implementation)
+        self._resolve_plan.pop(interface, None)
     
     def register_factory(self, interface: Type[T], factory: Callable[[], T]) -> None:
         """注册工厂函数"""
         self._factories[interface] = factory
+        self._entries[interface] = (_FACTORY, factory)
     
     def register_instance(self, interface: Type[T], instance: T) -> None:
         """注册实例"""
         self._singletons[interface] = instance
         self._initialized.add(interface)
+        self._entries[interface] = (_INSTANCE, instance)
     
     def register_scoped(self, interface: Type[T], implementation: Type[T], dependencies: List[Type] = None) -> None:
-        """注册作用域服务（每次请求都创建新实例）"""
+        """注册作用域服务（同一作用域内共享实例，作用域外每次获取都创建新实例）"""
+        self._index_implementation(interface, implementation)
         self._services[interface] = implementation
         self._dependencies[interface] = dependencies or []
+        self._entries[interface] = (_SCOPED, implementation)
+        self._resolve_plan.pop(interface, None)
+    
+    def _index_implementation(self, interface: Type, implementation: Type) -> None:
+        """按实现类的MRO登记接口（重复注册时先移除旧实现的登记）"""
+        previous = self._services.get(interface)
+        if previous is not None:
+            for base in previous.__mro__:
+                interfaces = self._impls_by_base.get(base)
+                if interfaces and interface in interfaces:
+                    interfaces.remove(interface)
+        for base in implementation.__mro__:
+            self._impls_by_base[base].append(interface)
     
     def get(self, interface: Type[T]) -> T:
         """获取服务实例"""
-        # 首先检查单例实例
-        if interface in self._singletons:
-            return self._singletons[interface]
+        entry = self._entries.get(interface, _MISSING)
+        if entry is _MISSING:
+            raise ValueError(f"未找到服务: {interface.__name__}")
+        tag, value = entry
+        if tag == _INSTANCE:
+            return value
+        if tag == _FACTORY:
+            return value()
+        if tag == _SCOPED:
+            return self._get_scoped(interface)
+        return self._build(interface)
+    
+    @contextmanager
+    def scope(self) -> Iterator[Dict[Type, Any]]:
+        """
+        进入新的服务作用域（如一次请求或一帧）
         
-        # 检查作用域实例
-        if interface in self._scoped:
-            return self._scoped[interface]
+        作用域内获取的作用域服务保存在该作用域的实例表中，退出时随之释放；
+        作用域基于 contextvars，各线程与异步上下文互不共享
         
-        # 检查工厂函数
-        if interface in self._factories:
-            instance = self._factories[interface]()
-            return instance
+        Yields:
+            Dict[Type, Any]: 当前作用域的实例表
+        """
+        instances: Dict[Type, Any] = {}
+        token = self._scope_var.set(instances)
+        try:
+            yield instances
+        finally:
+            self._scope_var.reset(token)
+    
+    def build(self) -> List[Type]:
+        """
+        校验依赖关系并生成解析计划（在全部注册完成后调用）
         
-        # 检查服务类
-        if interface in self._services:
-            # 检查是否已经初始化
-            if interface in self._initialized:
-                return self._singletons.get(interface) or self._scoped.get(interface)
-            
-            # 创建实例
-            instance = self._create_instance(interface)
-            
-            # 根据注册类型决定存储方式
-            if interface in self._services and interface not in self._factories:
-                # 单例服务
-                self._singletons[interface] = instance
-            else:
-                # 作用域服务
-                self._scoped[interface] = instance
+        按拓扑顺序（Kahn算法）排列服务，结果保存在初始化顺序中；
+        每个服务的依赖预先绑定为解析函数，创建实例时无需再查找依赖列表
+        
+        Returns:
+            List[Type]: 服务初始化顺序（依赖在前）
             
-            self._initialized.add(interface)
-            return instance
+        Raises:
+            ValueError: 存在未注册的依赖或循环依赖
+        """
+        services = [interface for interface in self._services if interface in self._entries]
+        dependents: Dict[Type, List[Type]] = defaultdict(list)
+        indegree: Dict[Type, int] = {}
+        for interface in services:
+            count = 0
+            for dep in self._dependencies.get(interface, []):
+                if dep not in self._entries:
+                    raise ValueError(f"服务 {interface.__name__} 的依赖未注册: {dep.__name__}")
+                if dep in self._services:
+                    dependents[dep].append(interface)
+                    count += 1
+            indegree[interface] = count
+        
+        order: List[Type] = []
+        ready = deque(interface for interface in services if indegree[interface] == 0)
+        while ready:
+            interface = ready.popleft()
+            order.append(interface)
+            for dependent in dependents.get(interface, ()):
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+        
+        if len(order) != len(services):
+            cyclic = ", ".join(interface.__name__ for interface in services if indegree[interface] > 0)
+            raise ValueError(f"存在循环依赖: {cyclic}")
         
-        raise ValueError(f"未找到服务: {interface.__name__}")
+        self._initialization_order = order
+        self._resolve_plan = {
+            interface: [partial(self.get, dep) for dep in self._dependencies.get(interface, [])]
+            for interface in order
+        }
+        return list(order)
+    
+    def _build(self, interface: Type[T]) -> T:
+        """首次获取单例服务时创建实例，之后该注册项直接返回实例"""
+        instance = self._create_checked(interface)
+        self._singletons[interface] = instance
+        self._initialized.add(interface)
+        self._entries[interface] = (_INSTANCE, instance)
+        return instance
+    
+    def _get_scoped(self, interface: Type[T]) -> T:
+        """获取作用域服务：优先返回当前作用域中的实例，没有则创建并保存到作用域"""
+        scope = self._scope_var.get()
+        if scope is None:
+            return self._create_checked(interface)
+        instance = scope.get(interface, _MISSING)
+        if instance is _MISSING:
+            instance = self._create_checked(interface)
+            scope[interface] = instance
+        return instance
+    
+    def _create_checked(self, interface: Type[T]) -> T:
+        """创建实例并检测循环依赖"""
+        if interface in self._building:
+            raise ValueError(f"存在循环依赖: {interface.__name__}")
+        self._building.add(interface)
+        try:
+            return self._create_instance(interface)
+        finally:
+            self._building.discard(interface)
     
     def _create_instance(self, interface: Type[T]) -> T:
         """创建服务实例"""
         implementation = self._services[interface]
-        dependencies = self._dependencies.get(interface, [])
         
-        # 解析依赖
-        resolved_dependencies = []
-        for dep in dependencies:
-            resolved_dep = self.get(dep)
-            resolved_dependencies.append(resolved_dep)
+        # 解析依赖（已 build() 时使用预先绑定的解析函数）
+        plan = self._resolve_plan.get(interface)
+        if plan is not None:
+            resolved_dependencies = [resolve() for resolve in plan]
+        else:
+            resolved_dependencies = [self.get(dep) for dep in self._dependencies.get(interface, [])]
         
         # 创建实例
         try:
@@ -104,27 +214,24 @@ class DIContainer:
     
     def get_all(self, interface: Type[T]) -> List[T]:
         """获取所有实现指定接口的服务"""
-        instances = []
-        for service_interface, implementation in self._services.items():
-            if issubclass(implementation, interface):
-                instances.append(self.get(service_interface))
-        return instances
+        return [self.get(service_interface) for service_interface in self._impls_by_base.get(interface, ())]
     
     def is_registered(self, interface: Type[T]) -> bool:
         """检查服务是否已注册"""
-        return (interface in self._services or 
-                interface in self._factories or 
-                interface in self._singletons)
+        return interface in self._entries
     
     def clear(self) -> None:
         """清空容器"""
         self._services.clear()
         self._factories.clear()
         self._singletons.clear()
-        self._scoped.clear()
         self._dependencies.clear()
         self._initialization_order.clear()
         self._initialized.clear()
+        self._entries.clear()
+        self._impls_by_base.clear()
+        self._resolve_plan.clear()
+        self._building.clear()
     
     def get_registration_info(self) -> Dict[str, Any]:
         """获取注册信息"""
@@ -6,9 +6,12 @@ from .event_bus import EventBus
 from .event import Event, EventType
 from .event_handler_base import EventHandlerBase, SimpleEventHandler, BatchEventHandler, ConditionalEventHandler
 from .event_data_access import EventDataAccess, EventDataProvider
+from .event_payloads import EventPayload, MouseMoveData, MouseButtonData
+from .query_registry import QueryRegistry
 
 __all__ = [
     'EventBus', 'Event', 'EventType',
     'EventHandlerBase', 'SimpleEventHandler', 'BatchEventHandler', 'ConditionalEventHandler',
-    'EventDataAccess', 'EventDataProvider'
+    'EventDataAccess', 'EventDataProvider', 'QueryRegistry',
+    'EventPayload', 'MouseMoveData', 'MouseButtonData'
 ]
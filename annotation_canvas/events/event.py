@@ -2,68 +2,96 @@
 事件定义模块
 """
 
+import threading
 import time
-from enum import Enum
-from typing import Any, Dict
+from enum import IntEnum, auto
+from typing import Any, Dict, List
 
 
-class EventType(Enum):
-    """事件类型枚举"""
+class EventType(IntEnum):
+    """事件类型枚举（整数取值，作为字典键时哈希和比较更快；日志中使用小写名称）"""
     # 鼠标事件
-    MOUSE_PRESS = "mouse_press"
-    MOUSE_MOVE = "mouse_move"
-    MOUSE_RELEASE = "mouse_release"
+    MOUSE_PRESS = auto()
+    MOUSE_MOVE = auto()
+    MOUSE_RELEASE = auto()
     
     # 数据事件
-    SHAPE_ADDED = "shape_added"
-    SHAPE_REMOVED = "shape_removed"
-    SHAPE_SELECTED = "shape_selected"
-    SHAPE_DESELECTED = "shape_deselected"
-    SHAPE_UPDATED = "shape_updated"
-    
-    # 数据查询事件
-    REQUEST_SHAPE_AT_POSITION = "request_shape_at_position"
-    REQUEST_ALL_SHAPES = "request_all_shapes"
-    REQUEST_SELECTED_SHAPE = "request_selected_shape"
-    REQUEST_HOVERED_SHAPE = "request_hovered_shape"
-    REQUEST_SHAPE_BOUNDS = "request_shape_bounds"
-    REQUEST_SHAPE_CONTAINS_POINT = "request_shape_contains_point"
-    
-    # 数据响应事件
-    RESPONSE_SHAPE_AT_POSITION = "response_shape_at_position"
-    RESPONSE_ALL_SHAPES = "response_all_shapes"
-    RESPONSE_SELECTED_SHAPE = "response_selected_shape"
-    RESPONSE_HOVERED_SHAPE = "response_hovered_shape"
-    RESPONSE_SHAPE_BOUNDS = "response_shape_bounds"
-    RESPONSE_SHAPE_CONTAINS_POINT = "response_shape_contains_point"
+    SHAPE_ADDED = auto()
+    SHAPE_REMOVED = auto()
+    SHAPE_SELECTED = auto()
+    SHAPE_DESELECTED = auto()
+    SHAPE_UPDATED = auto()
     
     # 状态事件
-    STATE_CHANGED = "state_changed"
-    MODE_CHANGED = "mode_changed"
+    STATE_CHANGED = auto()
+    MODE_CHANGED = auto()
     
     # 渲染事件
-    DISPLAY_UPDATE_REQUESTED = "display_update_requested"
-    HOVER_CHANGED = "hover_changed"
-    CONTROL_POINT_HOVER_CHANGED = "control_point_hover_changed"
+    DISPLAY_UPDATE_REQUESTED = auto()
+    HOVER_CHANGED = auto()
+    CONTROL_POINT_HOVER_CHANGED = auto()
     
     # 确认事件
-    CONFIRM_CANCEL_POLYGON = "confirm_cancel_polygon"
-    CANCEL_POLYGON_CONFIRMED = "cancel_polygon_confirmed"
+    CONFIRM_CANCEL_POLYGON = auto()
+    CANCEL_POLYGON_CONFIRMED = auto()
     
     # 操作事件
-    OPERATION_EXECUTED = "operation_executed"
-    OPERATION_UNDONE = "operation_undone"
-    OPERATION_REDONE = "operation_redone"
+    OPERATION_EXECUTED = auto()
+    OPERATION_UNDONE = auto()
+    OPERATION_REDONE = auto()
     
     # 工具设置事件
-    TOOL_CHANGED = "tool_changed"
-    COLOR_CHANGED = "color_changed"
-    WIDTH_CHANGED = "width_changed"
+    TOOL_CHANGED = auto()
+    COLOR_CHANGED = auto()
+    WIDTH_CHANGED = auto()
+
+
+# 预先缓存各成员的小写名称（用于日志与异常信息），避免每次访问 Enum.name 描述符
+for _member in EventType:
+    _member._cached_name = _member.name.lower()
+del _member
+
+
+class _EventPool:
+    """事件对象池（每个线程一个），供高频事件复用，避免每次发布都分配新对象"""
+    
+    __slots__ = ('pool',)
+    
+    MAX_SIZE = 32
+    
+    def __init__(self):
+        self.pool: List['Event'] = []
+    
+    def acquire(self, event_type: 'EventType', data: Dict[str, Any] = None) -> 'Event':
+        """取出一个事件（池为空时新建）"""
+        pool = self.pool
+        if pool:
+            return pool.pop().reset(event_type, data)
+        return Event(event_type, data)
+    
+    def release(self, event: 'Event') -> None:
+        """归还事件"""
+        event.data = None  # 释放对事件数据的引用
+        if len(self.pool) < self.MAX_SIZE:
+            self.pool.append(event)
+
+
+_pool_local = threading.local()
+
+
+def _get_event_pool() -> _EventPool:
+    """获取当前线程的事件对象池"""
+    pool = getattr(_pool_local, 'pool', None)
+    if pool is None:
+        pool = _pool_local.pool = _EventPool()
+    return pool
 
 
 class Event:
     """基础事件类"""
     
+    __slots__ = ('type', 'data', 'timestamp', '_type_name')
+    
     def __init__(self, event_type: EventType, data: Dict[str, Any] = None):
         """
         初始化事件
@@ -73,13 +101,48 @@ class Event:
             data: 事件数据字典
         """
         self.type = event_type
+        self._type_name = event_type._cached_name
         self.data = data or {}
-        self.timestamp = time.time()
+        self.timestamp = time.monotonic()
     
-    def __str__(self) -> str:
-        """字符串表示"""
-        return f"Event({self.type.value}, {self.data})"
+    def reset(self, event_type: EventType, data: Dict[str, Any] = None) -> 'Event':
+        """
+        重置事件内容（复用对象时使用）
+        
+        Args:
+            event_type: 事件类型
+            data: 事件数据字典
+            
+        Returns:
+            Event: 自身
+        """
+        self.type = event_type
+        self._type_name = event_type._cached_name
+        self.data = data or {}
+        self.timestamp = time.monotonic()
+        return self
+    
+    @classmethod
+    def acquire(cls, event_type: EventType, data: Dict[str, Any] = None) -> 'Event':
+        """
+        从对象池获取事件（池为空时新建）
+        
+        Note:
+            获取的事件须在分发结束后通过 release() 归还，处理器不得保留事件对象本身
+        """
+        return _get_event_pool().acquire(event_type, data)
+    
+    @classmethod
+    def release(cls, event: 'Event') -> None:
+        """归还事件到对象池"""
+        _get_event_pool().release(event)
+    
+    def describe(self) -> str:
+        """完整描述（含事件数据，仅在需要时调用）"""
+        return f"Event(type={self._type_name}, data={self.data}, timestamp={self.timestamp})"
     
     def __repr__(self) -> str:
-        """调试表示"""
-        return f"Event(type={self.type}, data={self.data}, timestamp={self.timestamp})"
+        """简短表示（不格式化事件数据，避免日志中意外展开大量数据）"""
+        return f"Event({self._type_name})"
+    
+    __str__ = __repr__
@@ -2,38 +2,108 @@
 事件总线模块
 """
 
-from typing import Any, Dict, List, Callable
+import threading
+import traceback
+import weakref
+from typing import Any, Dict, Iterable, List, Tuple, Callable, Optional
+from PySide6.QtCore import QTimer, QCoreApplication
 from .event import Event, EventType
 from ..utils.logger import get_logger
 from ..utils.exceptions import EventHandlerError
 
 logger = get_logger(__name__)
 
+_WeakMethod = weakref.WeakMethod
+_EMPTY: Tuple = ()
+
+
+def _resolve(entry) -> Optional[Callable]:
+    """取出订阅项对应的回调（弱引用的绑定方法已被回收时返回None）"""
+    return entry() if type(entry) is _WeakMethod else entry
+
+
+# 合并分发的高频事件类型 -> 合并键函数
+# 同一轮事件循环内键相同的事件只分发最后一个（悬停按图形区分）
+# 鼠标移动已由 InputHandler 按时间间隔合并，此处不再重复合并
+_COALESCE_KEYS: Dict[EventType, Callable[[Dict[str, Any]], Any]] = {
+    EventType.HOVER_CHANGED: lambda data: data.get('shape'),
+    EventType.DISPLAY_UPDATE_REQUESTED: lambda data: None,
+}
+
+# 合并时保留所有已置位标志的事件类型（如 clear_temp/force_cleanup）
+_MERGE_FLAG_TYPES = frozenset((EventType.DISPLAY_UPDATE_REQUESTED,))
+
 
 class EventBus:
     """事件总线 - 负责事件的发布和订阅"""
     
     def __init__(self):
         """初始化事件总线"""
-        self._subscribers: Dict[EventType, List[Callable]] = {}
+        # 订阅者以不可变元组保存（写时复制）：订阅/取消订阅时重建元组，
+        # 发布时直接遍历，回调中修改订阅也不影响本次分发
+        # 绑定方法默认以弱引用保存，订阅者对象被回收后自动失效并在下次发布时清理
+        self._subscribers: Dict[EventType, Tuple[Callable, ...]] = {}
+        # 只有修改订阅时加锁（防止并发修改丢失更新），发布路径不加锁
+        self._write_lock = threading.Lock()
+        self._has_dead_subscribers = False
+        # 等待合并分发的事件：(事件类型, 合并键) -> 事件数据
+        self._pending_coalesced: Dict[Tuple[EventType, Any], Dict[str, Any]] = {}
+        self._flush_scheduled = False
         self._debug_mode = False
     
-    def subscribe(self, event_type: EventType, callback: Callable):
+    def subscribe(self, event_type: EventType, callback: Callable, hold_strong: bool = False):
         """
         订阅事件
         
         Args:
             event_type: 要订阅的事件类型
             callback: 事件处理回调函数
+            hold_strong: 是否强引用回调；为False时绑定方法以弱引用保存，
+                不会因订阅而延长订阅者对象的生命周期
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
+        with self._write_lock:
+            callbacks = self._subscribers.get(event_type, _EMPTY)
+            if not any(_resolve(entry) == callback for entry in callbacks):
+                self._subscribers[event_type] = callbacks + (self._make_entry(callback, hold_strong),)
+    
+    def batch_subscribe(self, subscriptions: Iterable[Tuple[EventType, Callable]], hold_strong: bool = False):
+        """
+        批量订阅事件（每个事件类型的订阅元组只重建一次）
         
-        if callback not in self._subscribers[event_type]:
-            self._subscribers[event_type].append(callback)
-            
-            if self._debug_mode:
-                pass
+        Args:
+            subscriptions: (事件类型, 回调函数) 序列
+            hold_strong: 是否强引用回调，含义同 subscribe
+        """
+        additions: Dict[EventType, List[Callable]] = {}
+        for event_type, callback in subscriptions:
+            additions.setdefault(event_type, []).append(callback)
+        
+        with self._write_lock:
+            for event_type, callbacks in additions.items():
+                existing = self._subscribers.get(event_type, _EMPTY)
+                entries = list(existing)
+                for callback in callbacks:
+                    if not any(_resolve(entry) == callback for entry in entries):
+                        entries.append(self._make_entry(callback, hold_strong))
+                if len(entries) != len(existing):
+                    self._subscribers[event_type] = tuple(entries)
+    
+    def subscribe_many(self, event_types: Iterable[EventType], callback: Callable, hold_strong: bool = False):
+        """
+        以同一个回调订阅多个事件类型
+        
+        Args:
+            event_types: 事件类型序列
+            callback: 事件处理回调函数
+            hold_strong: 是否强引用回调，含义同 subscribe
+        """
+        self.batch_subscribe(((event_type, callback) for event_type in event_types), hold_strong)
+    
+    def _make_entry(self, callback: Callable, hold_strong: bool):
+        """生成订阅项（绑定方法默认以弱引用保存）"""
+        if not hold_strong and hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            return _WeakMethod(callback, self._on_subscriber_collected)
+        return callback
     
     def unsubscribe(self, event_type: EventType, callback: Callable):
         """
@@ -43,41 +113,143 @@ class EventBus:
             event_type: 要取消订阅的事件类型
             callback: 事件处理回调函数
         """
-        if event_type in self._subscribers:
-            if callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
-                
-                if self._debug_mode:
-                    pass
+        with self._write_lock:
+            callbacks = self._subscribers.get(event_type, _EMPTY)
+            remaining = tuple(entry for entry in callbacks if _resolve(entry) != callback)
+            if len(remaining) != len(callbacks):
+                self._subscribers[event_type] = remaining
     
     def publish(self, event: Event):
         """
         发布事件
         
+        悬停变化、显示更新请求在下一轮事件循环合并分发；
+        其他事件同步分发，分发前先送出已合并的事件以保持先后顺序
+        
         Args:
             event: 要发布的事件
         """
-        if self._debug_mode:
-            pass
+        if event.type in _COALESCE_KEYS:
+            self._queue_coalesced(event.type, event.data)
+            return
+        if self._pending_coalesced:
+            self.flush_coalesced()
+        self._dispatch(event)
+    
+    def _dispatch(self, event: Event):
+        """将事件同步分发给订阅者"""
+        if self._has_dead_subscribers:
+            self._prune_dead_subscribers()
         
-        if event.type in self._subscribers:
-            # 创建回调列表的副本，避免在回调中修改订阅列表
-            callbacks = self._subscribers[event.type].copy()
+        # 订阅元组不可变，无需复制
+        callbacks = self._subscribers.get(event.type)
+        if not callbacks:
+            return
+        
+        weak_method = _WeakMethod
+        failures = None
+        for callback in callbacks:
+            if type(callback) is weak_method:
+                callback = callback()
+                if callback is None:
+                    continue
+            try:
+                callback(event)
+            except Exception as e:
+                # 单个处理器出错不中断其余处理器，分发结束后统一抛出
+                logger.error(f"事件处理错误: {getattr(callback, '__name__', callback)} -> {e}")
+                logger.error(traceback.format_exc())
+                if failures is None:
+                    failures = []
+                failures.append((callback, e))
+        
+        if failures:
+            error_msg = "事件处理错误: " + "; ".join(
+                f"{getattr(callback, '__name__', callback)} -> {e}" for callback, e in failures
+            )
+            raise EventHandlerError(
+                error_msg,
+                event_type=event._type_name
+            ) from failures[0][1]
+    
+    def _queue_coalesced(self, event_type: EventType, data: Dict[str, Any]):
+        """登记待合并分发的事件，并安排在下一轮事件循环送出"""
+        data = data or {}
+        key = (event_type, _COALESCE_KEYS[event_type](data))
+        pending = self._pending_coalesced
+        previous = pending.get(key)
+        if previous is not None and event_type in _MERGE_FLAG_TYPES:
+            merged = dict(previous)
+            for name, value in data.items():
+                if value or name not in merged:
+                    merged[name] = value
+            data = merged
+        pending[key] = data
+        
+        if not self._flush_scheduled:
+            if QCoreApplication.instance() is None:
+                # 没有事件循环（如脚本中直接使用）时立即分发
+                self.flush_coalesced()
+                return
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self.flush_coalesced)
+    
+    def flush_coalesced(self):
+        """立即分发所有等待合并的事件"""
+        self._flush_scheduled = False
+        pending = self._pending_coalesced
+        if not pending:
+            return
+        self._pending_coalesced = {}
+        
+        error = None
+        for (event_type, _), data in pending.items():
+            event = Event.acquire(event_type, data)
+            try:
+                self._dispatch(event)
+            except EventHandlerError as e:
+                if error is None:
+                    error = e
+            finally:
+                Event.release(event)
+        if error is not None:
+            raise error
+    
+    def _on_subscriber_collected(self, ref):
+        """弱引用的订阅者被回收（仅做标记，清理推迟到下次发布）"""
+        self._has_dead_subscribers = True
+    
+    def _prune_dead_subscribers(self):
+        """移除已失效的弱引用订阅项"""
+        with self._write_lock:
+            self._has_dead_subscribers = False
+            for event_type, callbacks in list(self._subscribers.items()):
+                alive = tuple(entry for entry in callbacks if _resolve(entry) is not None)
+                if len(alive) != len(callbacks):
+                    self._subscribers[event_type] = alive
+    
+    def publish_transient(self, event_type: EventType, data: Dict[str, Any] = None):
+        """
+        使用对象池中的事件发布（适用于鼠标移动、悬停、显示更新等高频事件）
+        
+        Args:
+            event_type: 事件类型
+            data: 事件数据字典
             
-            for callback in callbacks:
-                try:
-                    callback(event)
-                except Exception as e:
-                    error_msg = f"事件处理错误: {callback.__name__} -> {e}"
-                    logger.error(error_msg)
-                    import traceback
-                    logger.error(traceback.format_exc())
-                    
-                    # 重新抛出为自定义异常
-                    raise EventHandlerError(
-                        error_msg, 
-                        event_type=event.type.value if hasattr(event.type, 'value') else str(event.type)
-                    ) from e
+        Note:
+            事件对象在分发结束后即被回收，处理器只能在回调内使用事件，
+            需要保留的内容应从 event.data 中取出
+        """
+        if event_type in _COALESCE_KEYS:
+            self._queue_coalesced(event_type, data)
+            return
+        if self._pending_coalesced:
+            self.flush_coalesced()
+        event = Event.acquire(event_type, data)
+        try:
+            self._dispatch(event)
+        finally:
+            Event.release(event)
     
     def set_debug_mode(self, enabled: bool):
         """
@@ -88,6 +260,15 @@ class EventBus:
         """
         self._debug_mode = enabled
     
+    def has_subscribers(self, event_type: EventType) -> bool:
+        """
+        检查事件类型是否有订阅者（发布方可据此跳过构造事件数据）
+        
+        Args:
+            event_type: 事件类型
+        """
+        return bool(self._subscribers.get(event_type))
+    
     def get_subscriber_count(self, event_type: EventType) -> int:
         """
         获取指定事件类型的订阅者数量
@@ -98,7 +279,7 @@ class EventBus:
         Returns:
             订阅者数量
         """
-        return len(self._subscribers.get(event_type, []))
+        return len(self._subscribers.get(event_type, _EMPTY))
     
     def clear_subscribers(self, event_type: EventType = None):
         """
@@ -107,7 +288,8 @@ class EventBus:
         Args:
             event_type: 指定的事件类型，如果为None则清除所有
         """
-        if event_type is None:
-            self._subscribers.clear()
-        elif event_type in self._subscribers:
-            self._subscribers[event_type].clear()
+        with self._write_lock:
+            if event_type is None:
+                self._subscribers.clear()
+            elif event_type in self._subscribers:
+                self._subscribers[event_type] = _EMPTY
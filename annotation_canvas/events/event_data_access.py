@@ -1,67 +1,90 @@
 """
-事件驱动的数据访问接口
+数据访问接口 - 通过查询注册表直接调用数据查询，结果按数据变化事件失效
 """
 
-from typing import Optional, List, Any, Callable
+from typing import Optional, List, Any, Dict
 from PySide6.QtCore import QPointF, QRectF
 from .event import Event, EventType
 from .event_bus import EventBus
+from .query_registry import QueryRegistry
 from ..models import BaseShape
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 查询名称
+QUERY_SHAPE_AT_POSITION = 'shape_at_position'
+QUERY_ALL_SHAPES = 'all_shapes'
+QUERY_SELECTED_SHAPE = 'selected_shape'
+QUERY_HOVERED_SHAPE = 'hovered_shape'
+QUERY_SHAPE_BOUNDS = 'shape_bounds'
+QUERY_SHAPE_CONTAINS_POINT = 'shape_contains_point'
+
 
 class EventDataAccess:
-    """事件驱动的数据访问类"""
+    """数据访问类"""
+    
+    # 会改变查询结果的事件
+    _INVALIDATING_EVENTS = (
+        EventType.SHAPE_ADDED, EventType.SHAPE_REMOVED, EventType.SHAPE_UPDATED,
+        EventType.SHAPE_SELECTED, EventType.SHAPE_DESELECTED,
+        EventType.OPERATION_EXECUTED, EventType.OPERATION_UNDONE, EventType.OPERATION_REDONE,
+    )
+    _CACHE_MAX_SIZE = 64
     
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, registry: QueryRegistry):
         """
-        初始化事件数据访问
+        初始化数据访问
         
         Args:
-            event_bus: 事件总线
+            event_bus: 事件总线（用于订阅数据变化事件）
+            registry: 查询注册表
         """
         self.event_bus = event_bus
-        self._response_handlers = {}
-        self._pending_requests = {}
-        self._request_id_counter = 0
+        self.registry = registry
         
-        # 注册响应处理器
-        self._register_response_handlers()
-    
-    def _register_response_handlers(self):
-        """注册响应事件处理器"""
-        self._response_handlers = {
-            EventType.RESPONSE_SHAPE_AT_POSITION: self._handle_shape_at_position_response,
-            EventType.RESPONSE_ALL_SHAPES: self._handle_all_shapes_response,
-            EventType.RESPONSE_SELECTED_SHAPE: self._handle_selected_shape_response,
-            EventType.RESPONSE_HOVERED_SHAPE: self._handle_hovered_shape_response,
-            EventType.RESPONSE_SHAPE_BOUNDS: self._handle_shape_bounds_response,
-            EventType.RESPONSE_SHAPE_CONTAINS_POINT: self._handle_shape_contains_point_response,
-        }
+        # 查询结果缓存：数据变化事件使版本号递增并清空缓存
+        self._cache: Dict[tuple, Any] = {}
+        self._data_version = 0
         
-        for event_type, handler in self._response_handlers.items():
-            self.event_bus.subscribe(event_type, handler)
+        self._register_invalidation_handlers()
     
-    def _generate_request_id(self) -> str:
-        """生成请求ID"""
-        self._request_id_counter += 1
-        return f"req_{self._request_id_counter}"
+    def _register_invalidation_handlers(self):
+        """订阅会使查询结果失效的数据事件"""
+        for event_type in self._INVALIDATING_EVENTS:
+            self.event_bus.subscribe(event_type, self._on_data_changed)
+    
+    def _on_data_changed(self, event: Event):
+        """数据变化，缓存失效"""
+        self.invalidate()
+    
+    def invalidate(self):
+        """
+        使查询缓存失效
+        
+        数据在不发布事件的情况下被修改时（如直接导入数据）需要手动调用
+        """
+        self._data_version += 1
+        self._cache.clear()
     
-    def _wait_for_response(self, request_id: str, timeout: float = 1.0) -> Any:
-        """等待响应"""
-        import time
-        start_time = time.time()
+    def _memoize(self, key: tuple, query: str, *args) -> Any:
+        """
+        返回缓存的查询结果，未命中时调用查询并缓存
         
-        while time.time() - start_time < timeout:
-            if request_id in self._pending_requests:
-                response = self._pending_requests.pop(request_id)
-                return response
-            time.sleep(0.01)  # 避免忙等待
+        Note:
+            查询期间若数据发生变化（版本号改变），结果不写入缓存
+        """
+        cache = self._cache
+        if key in cache:
+            return cache[key]
         
-        logger.warning(f"请求 {request_id} 超时")
-        return None
+        version = self._data_version
+        result = self.registry.call(query, *args)
+        if version == self._data_version:
+            if len(cache) >= self._CACHE_MAX_SIZE:
+                cache.clear()  # 悬停在空白区域时位置查询各不相同，限制缓存规模
+            cache[key] = result
+        return result
     
     def get_shape_at_position(self, position: QPointF, tolerance: float = None) -> Optional[BaseShape]:
         """
@@ -70,22 +93,12 @@ class EventDataAccess:
         Args:
             position: 位置
             tolerance: 容差
-            
+        
         Returns:
             BaseShape: 图形对象，如果没有则返回None
         """
-        request_id = self._generate_request_id()
-        
-        # 发布请求事件
-        self.event_bus.publish(Event(EventType.REQUEST_SHAPE_AT_POSITION, {
-            'request_id': request_id,
-            'position': position,
-            'tolerance': tolerance
-        }))
-        
-        # 等待响应
-        response = self._wait_for_response(request_id)
-        return response.get('shape') if response else None
+        key = ('at', position.x(), position.y(), tolerance)
+        return self._memoize(key, QUERY_SHAPE_AT_POSITION, position, tolerance)
     
     def get_all_shapes(self) -> List[BaseShape]:
         """
@@ -94,16 +107,7 @@ class EventDataAccess:
         Returns:
             List[BaseShape]: 图形列表
         """
-        request_id = self._generate_request_id()
-        
-        # 发布请求事件
-        self.event_bus.publish(Event(EventType.REQUEST_ALL_SHAPES, {
-            'request_id': request_id
-        }))
-        
-        # 等待响应
-        response = self._wait_for_response(request_id)
-        return response.get('shapes', []) if response else []
+        return self._memoize(('all',), QUERY_ALL_SHAPES)
     
     def get_selected_shape(self) -> Optional[BaseShape]:
         """
@@ -112,16 +116,7 @@ class EventDataAccess:
         Returns:
             BaseShape: 选中的图形，如果没有则返回None
         """
-        request_id = self._generate_request_id()
-        
-        # 发布请求事件
-        self.event_bus.publish(Event(EventType.REQUEST_SELECTED_SHAPE, {
-            'request_id': request_id
-        }))
-        
-        # 等待响应
-        response = self._wait_for_response(request_id)
-        return response.get('shape') if response else None
+        return self._memoize(('selected',), QUERY_SELECTED_SHAPE)
     
     def get_hovered_shape(self) -> Optional[BaseShape]:
         """
@@ -130,16 +125,8 @@ class EventDataAccess:
         Returns:
             BaseShape: 悬停的图形，如果没有则返回None
         """
-        request_id = self._generate_request_id()
-        
-        # 发布请求事件
-        self.event_bus.publish(Event(EventType.REQUEST_HOVERED_SHAPE, {
-            'request_id': request_id
-        }))
-        
-        # 等待响应
-        response = self._wait_for_response(request_id)
-        return response.get('shape') if response else None
+        # 悬停变化事件合并后延迟分发，无法及时使缓存失效，因此不缓存
+        return self.registry.call(QUERY_HOVERED_SHAPE)
     
     def get_shape_bounds(self, shape: BaseShape) -> Optional[QRectF]:
         """
@@ -147,21 +134,11 @@ class EventDataAccess:
         
         Args:
             shape: 图形对象
-            
+        
         Returns:
             QRectF: 边界矩形
         """
-        request_id = self._generate_request_id()
-        
-        # 发布请求事件
-        self.event_bus.publish(Event(EventType.REQUEST_SHAPE_BOUNDS, {
-            'request_id': request_id,
-            'shape': shape
-        }))
-        
-        # 等待响应
-        response = self._wait_for_response(request_id)
-        return response.get('bounds') if response else None
+        return self._memoize(('bounds', shape), QUERY_SHAPE_BOUNDS, shape)
     
     def shape_contains_point(self, shape: BaseShape, point: QPointF, tolerance: float = None) -> bool:
         """
@@ -171,159 +148,47 @@ class EventDataAccess:
             shape: 图形对象
             point: 点
             tolerance: 容差
-            
+        
         Returns:
             bool: 是否包含
         """
-        request_id = self._generate_request_id()
-        
-        # 发布请求事件
-        self.event_bus.publish(Event(EventType.REQUEST_SHAPE_CONTAINS_POINT, {
-            'request_id': request_id,
-            'shape': shape,
-            'point': point,
-            'tolerance': tolerance
-        }))
-        
-        # 等待响应
-        response = self._wait_for_response(request_id)
-        return response.get('contains', False) if response else False
-    
-    # 响应处理器
-    def _handle_shape_at_position_response(self, event: Event):
-        """处理位置图形响应"""
-        request_id = event.data.get('request_id')
-        if request_id:
-            self._pending_requests[request_id] = event.data
-    
-    def _handle_all_shapes_response(self, event: Event):
-        """处理所有图形响应"""
-        request_id = event.data.get('request_id')
-        if request_id:
-            self._pending_requests[request_id] = event.data
-    
-    def _handle_selected_shape_response(self, event: Event):
-        """处理选中图形响应"""
-        request_id = event.data.get('request_id')
-        if request_id:
-            self._pending_requests[request_id] = event.data
-    
-    def _handle_hovered_shape_response(self, event: Event):
-        """处理悬停图形响应"""
-        request_id = event.data.get('request_id')
-        if request_id:
-            self._pending_requests[request_id] = event.data
-    
-    def _handle_shape_bounds_response(self, event: Event):
-        """处理图形边界响应"""
-        request_id = event.data.get('request_id')
-        if request_id:
-            self._pending_requests[request_id] = event.data
-    
-    def _handle_shape_contains_point_response(self, event: Event):
-        """处理图形包含点响应"""
-        request_id = event.data.get('request_id')
-        if request_id:
-            self._pending_requests[request_id] = event.data
+        key = ('contains', shape, point.x(), point.y(), tolerance)
+        return self._memoize(key, QUERY_SHAPE_CONTAINS_POINT, shape, point, tolerance)
 
 
 class EventDataProvider:
-    """事件数据提供者"""
+    """数据提供者 - 把数据管理器的查询登记到查询注册表"""
     
-    def __init__(self, event_bus: EventBus, data_manager):
+    def __init__(self, registry: QueryRegistry, data_manager):
         """
-        初始化事件数据提供者
+        初始化数据提供者
         
         Args:
-            event_bus: 事件总线
+            registry: 查询注册表
             data_manager: 数据管理器
         """
-        self.event_bus = event_bus
+        self.registry = registry
         self.data_manager = data_manager
         
-        # 注册请求处理器
-        self._register_request_handlers()
-    
-    def _register_request_handlers(self):
-        """注册请求事件处理器"""
-        self.event_bus.subscribe(EventType.REQUEST_SHAPE_AT_POSITION, self._handle_shape_at_position_request)
-        self.event_bus.subscribe(EventType.REQUEST_ALL_SHAPES, self._handle_all_shapes_request)
-        self.event_bus.subscribe(EventType.REQUEST_SELECTED_SHAPE, self._handle_selected_shape_request)
-        self.event_bus.subscribe(EventType.REQUEST_HOVERED_SHAPE, self._handle_hovered_shape_request)
-        self.event_bus.subscribe(EventType.REQUEST_SHAPE_BOUNDS, self._handle_shape_bounds_request)
-        self.event_bus.subscribe(EventType.REQUEST_SHAPE_CONTAINS_POINT, self._handle_shape_contains_point_request)
-    
-    def _handle_shape_at_position_request(self, event: Event):
-        """处理位置图形请求"""
-        request_id = event.data.get('request_id')
-        position = event.data.get('position')
-        tolerance = event.data.get('tolerance')
-        
-        shape = self.data_manager.get_shape_at_position(position, tolerance)
-        
-        # 发布响应事件
-        self.event_bus.publish(Event(EventType.RESPONSE_SHAPE_AT_POSITION, {
-            'request_id': request_id,
-            'shape': shape
-        }))
-    
-    def _handle_all_shapes_request(self, event: Event):
-        """处理所有图形请求"""
-        request_id = event.data.get('request_id')
-        shapes = self.data_manager.get_shapes()
-        
-        # 发布响应事件
-        self.event_bus.publish(Event(EventType.RESPONSE_ALL_SHAPES, {
-            'request_id': request_id,
-            'shapes': shapes
-        }))
-    
-    def _handle_selected_shape_request(self, event: Event):
-        """处理选中图形请求"""
-        request_id = event.data.get('request_id')
-        shape = self.data_manager.get_selected_shape()
-        
-        # 发布响应事件
-        self.event_bus.publish(Event(EventType.RESPONSE_SELECTED_SHAPE, {
-            'request_id': request_id,
-            'shape': shape
-        }))
-    
-    def _handle_hovered_shape_request(self, event: Event):
-        """处理悬停图形请求"""
-        request_id = event.data.get('request_id')
-        shape = self.data_manager.get_hovered_shape()
-        
-        # 发布响应事件
-        self.event_bus.publish(Event(EventType.RESPONSE_HOVERED_SHAPE, {
-            'request_id': request_id,
-            'shape': shape
-        }))
-    
-    def _handle_shape_bounds_request(self, event: Event):
-        """处理图形边界请求"""
-        request_id = event.data.get('request_id')
-        shape = event.data.get('shape')
-        
-        bounds = shape.get_bounds() if shape else None
-        
-        # 发布响应事件
-        self.event_bus.publish(Event(EventType.RESPONSE_SHAPE_BOUNDS, {
-            'request_id': request_id,
-            'bounds': bounds
-        }))
-    
-    def _handle_shape_contains_point_request(self, event: Event):
-        """处理图形包含点请求"""
-        request_id = event.data.get('request_id')
-        shape = event.data.get('shape')
-        point = event.data.get('point')
-        tolerance = event.data.get('tolerance')
-        
-        contains = shape.contains_point(point, tolerance) if shape else False
-        
-        # 发布响应事件
-        self.event_bus.publish(Event(EventType.RESPONSE_SHAPE_CONTAINS_POINT, {
-            'request_id': request_id,
-            'contains': contains
-        }))
+        # 注册查询
+        self._register_queries()
+    
+    def _register_queries(self):
+        """注册数据查询"""
+        data_manager = self.data_manager
+        self.registry.register(QUERY_SHAPE_AT_POSITION, data_manager.get_shape_at_position)
+        self.registry.register(QUERY_ALL_SHAPES, data_manager.get_shapes)
+        self.registry.register(QUERY_SELECTED_SHAPE, data_manager.get_selected_shape)
+        self.registry.register(QUERY_HOVERED_SHAPE, data_manager.get_hovered_shape)
+        self.registry.register(QUERY_SHAPE_BOUNDS, self._get_shape_bounds)
+        self.registry.register(QUERY_SHAPE_CONTAINS_POINT, self._shape_contains_point)
+    
+    @staticmethod
+    def _get_shape_bounds(shape: BaseShape) -> Optional[QRectF]:
+        """获取图形边界"""
+        return shape.get_bounds() if shape else None
+    
+    @staticmethod
+    def _shape_contains_point(shape: BaseShape, point: QPointF, tolerance: float = None) -> bool:
+        """检查图形是否包含点"""
+        return shape.contains_point(point, tolerance) if shape else False
@@ -3,7 +3,7 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Callable, Any, Optional, List
+from typing import Dict, Callable, Any, Optional, List, Set, Tuple
 from .event_bus import EventBus
 from .event import Event, EventType
 from ..utils.logger import get_logger
@@ -23,7 +23,7 @@ class EventHandlerBase(ABC):
         """
         self.event_bus = event_bus
         self._event_handlers: Dict[EventType, Callable] = {}
-        self._subscribed_events: List[EventType] = []
+        self._subscribed_events: Set[EventType] = set()
         
         # 注册事件处理器
         self._register_event_handlers()
@@ -38,9 +38,8 @@ class EventHandlerBase(ABC):
     
     def _subscribe_events(self) -> None:
         """订阅事件"""
-        for event_type, handler in self._event_handlers.items():
-            self.event_bus.subscribe(event_type, handler)
-            self._subscribed_events.append(event_type)
+        self.event_bus.batch_subscribe(self._event_handlers.items())
+        self._subscribed_events.update(self._event_handlers)
     
     def _unsubscribe_events(self) -> None:
         """取消订阅事件"""
@@ -59,7 +58,7 @@ class EventHandlerBase(ABC):
         """
         self._event_handlers[event_type] = handler
         self.event_bus.subscribe(event_type, handler)
-        self._subscribed_events.append(event_type)
+        self._subscribed_events.add(event_type)
     
     def unregister_handler(self, event_type: EventType) -> None:
         """
@@ -72,12 +71,11 @@ class EventHandlerBase(ABC):
             handler = self._event_handlers[event_type]
             self.event_bus.unsubscribe(event_type, handler)
             del self._event_handlers[event_type]
-            if event_type in self._subscribed_events:
-                self._subscribed_events.remove(event_type)
+            self._subscribed_events.discard(event_type)
     
     def get_subscribed_events(self) -> List[EventType]:
         """获取已订阅的事件列表"""
-        return self._subscribed_events.copy()
+        return list(self._subscribed_events)
     
     def is_subscribed(self, event_type: EventType) -> bool:
         """检查是否已订阅指定事件"""
@@ -90,26 +88,57 @@ class EventHandlerBase(ABC):
     
     def __del__(self):
         """析构函数 - 确保清理资源"""
-        try:
+        if getattr(self, '_event_handlers', None):
             self.cleanup()
-        except:
-            pass  # 忽略析构时的错误
 
 
 class SimpleEventHandler(EventHandlerBase):
-    """简单事件处理器 - 使用装饰器模式"""
+    """
+    简单事件处理器 - 使用装饰器模式
+    
+    子类在类体中以 @SimpleEventHandler.handles(event_type) 标记处理方法，
+    实例化时统一绑定并一次完成订阅；运行期可用实例方法 event_handler 追加处理器
+    """
+    
+    # 类体中标记的处理方法 (事件类型, 方法名)，由 __init_subclass__ 汇总
+    _pending_subs: Tuple[Tuple[EventType, str], ...] = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        pending = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                event_type = getattr(attr, '_handles_event', None)
+                if event_type is not None:
+                    pending[event_type] = name
+        cls._pending_subs = tuple(pending.items())
     
     def __init__(self, event_bus: EventBus):
-        super().__init__(event_bus)
         self._handler_map: Dict[EventType, str] = {}
+        super().__init__(event_bus)
+    
+    @staticmethod
+    def handles(event_type: EventType):
+        """
+        类体中使用的处理方法标记（只记录事件类型，不访问事件总线）
+        
+        Args:
+            event_type: 事件类型
+        """
+        def decorator(func):
+            func._handles_event = event_type
+            return func
+        return decorator
     
     def _register_event_handlers(self) -> None:
-        """注册事件处理器 - 子类重写此方法"""
-        pass
+        """绑定类体中标记的处理方法（订阅由 _subscribe_events 批量完成）"""
+        for event_type, name in self._pending_subs:
+            self._event_handlers[event_type] = getattr(self, name)
+            self._handler_map[event_type] = name
     
     def event_handler(self, event_type: EventType):
         """
-        事件处理器装饰器
+        事件处理器装饰器（运行期追加，立即订阅）
         
         Args:
             event_type: 事件类型
@@ -144,12 +173,17 @@ class BatchEventHandler(EventHandlerBase):
         for event_type in self._target_event_types:
             self._event_handlers[event_type] = self._handle_batch_event
     
+    def _subscribe_events(self) -> None:
+        """订阅事件（所有事件类型共用同一个处理函数，一次完成订阅）"""
+        self.event_bus.subscribe_many(self._target_event_types, self._handle_batch_event)
+        self._subscribed_events.update(self._target_event_types)
+    
     def _handle_batch_event(self, event: Event) -> None:
         """处理批量事件"""
         try:
             self.on_batch_event(event)
         except Exception as e:
-            logger.error(f"批量事件处理失败: {event.event_type.name}, 错误: {e}")
+            logger.error(f"批量事件处理失败: {event._type_name}, 错误: {e}")
     
     @abstractmethod
     def on_batch_event(self, event: Event) -> None:
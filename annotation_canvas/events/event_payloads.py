@@ -0,0 +1,99 @@
+"""
+事件数据载荷定义
+
+固定字段的高频事件使用带 __slots__ 的载荷对象作为 event.data，
+处理器以属性访问字段，发布方无需构造字典。
+"""
+
+from typing import Any
+
+from ..utils.constants import InteractionConstants
+
+
+class EventPayload:
+    """事件载荷基类"""
+    
+    __slots__ = ()
+    
+    @classmethod
+    def from_data(cls, data: Any) -> 'EventPayload':
+        """
+        将事件数据转换为载荷对象（兼容以字典发布的旧事件）
+        
+        Args:
+            data: 载荷对象或数据字典
+        """
+        if isinstance(data, cls):
+            return data
+        # 缺少的字段使用构造函数的默认值
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """按字段名取值（与字典接口兼容）"""
+        return getattr(self, key, default)
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class MouseMoveData(EventPayload):
+    """
+    鼠标移动事件载荷
+    
+    输入处理器复用同一实例发布移动事件，处理器只能在回调内读取，不得保留该对象
+    """
+    
+    __slots__ = (
+        'position', 'last_position',
+        'left_button_pressed', 'right_button_pressed', 'middle_button_pressed', 'dragging',
+        'modifiers', 'ctrl_pressed', 'shift_pressed', 'alt_pressed', 'pixel_size',
+    )
+    
+    def __init__(self, position=None, last_position=None,
+                 left_button_pressed: bool = False, right_button_pressed: bool = False,
+                 middle_button_pressed: bool = False, dragging: bool = False,
+                 modifiers=None, ctrl_pressed: bool = False, shift_pressed: bool = False,
+                 alt_pressed: bool = False, pixel_size: float = InteractionConstants.DEFAULT_PIXEL_SIZE):
+        self.position = position
+        self.last_position = last_position
+        self.left_button_pressed = left_button_pressed
+        self.right_button_pressed = right_button_pressed
+        self.middle_button_pressed = middle_button_pressed
+        self.dragging = dragging
+        self.modifiers = modifiers
+        self.ctrl_pressed = ctrl_pressed
+        self.shift_pressed = shift_pressed
+        self.alt_pressed = alt_pressed
+        self.pixel_size = pixel_size
+
+
+class MouseButtonData(EventPayload):
+    """
+    鼠标按下/释放事件载荷
+    
+    输入处理器为按下、释放各复用一个实例（同步分发），处理器只能在回调内读取，不得保留该对象
+    """
+    
+    __slots__ = (
+        'position', 'button',
+        'left_button_pressed', 'right_button_pressed', 'middle_button_pressed', 'dragging',
+        'modifiers', 'ctrl_pressed', 'shift_pressed', 'alt_pressed', 'pixel_size',
+    )
+    
+    def __init__(self, position=None, button=None,
+                 left_button_pressed: bool = False, right_button_pressed: bool = False,
+                 middle_button_pressed: bool = False, dragging: bool = False,
+                 modifiers=None, ctrl_pressed: bool = False, shift_pressed: bool = False,
+                 alt_pressed: bool = False, pixel_size: float = InteractionConstants.DEFAULT_PIXEL_SIZE):
+        self.position = position
+        self.button = button
+        self.left_button_pressed = left_button_pressed
+        self.right_button_pressed = right_button_pressed
+        self.middle_button_pressed = middle_button_pressed
+        self.dragging = dragging
+        self.modifiers = modifiers
+        self.ctrl_pressed = ctrl_pressed
+        self.shift_pressed = shift_pressed
+        self.alt_pressed = alt_pressed
+        self.pixel_size = pixel_size
@@ -0,0 +1,55 @@
+"""
+数据查询注册表
+"""
+
+from typing import Any, Callable, Dict
+
+
+class QueryRegistry:
+    """数据查询注册表 - 按名称登记查询函数，调用方直接同步调用"""
+    
+    def __init__(self):
+        """初始化查询注册表"""
+        self._queries: Dict[str, Callable] = {}
+    
+    def register(self, name: str, query: Callable) -> None:
+        """
+        注册查询函数（同名查询会被覆盖）
+        
+        Args:
+            name: 查询名称
+            query: 查询函数
+        """
+        self._queries[name] = query
+    
+    def unregister(self, name: str) -> None:
+        """
+        注销查询函数
+        
+        Args:
+            name: 查询名称
+        """
+        self._queries.pop(name, None)
+    
+    def has(self, name: str) -> bool:
+        """检查查询是否已注册"""
+        return name in self._queries
+    
+    def call(self, name: str, *args, **kwargs) -> Any:
+        """
+        调用查询函数
+        
+        Args:
+            name: 查询名称
+            *args, **kwargs: 查询参数
+        
+        Returns:
+            查询结果
+        
+        Raises:
+            ValueError: 查询未注册
+        """
+        query = self._queries.get(name)
+        if query is None:
+            raise ValueError(f"未注册的查询: {name}")
+        return query(*args, **kwargs)
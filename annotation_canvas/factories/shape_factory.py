@@ -5,12 +5,92 @@
 from typing import Optional, Dict, Any
 from PySide6.QtCore import QPointF
 
-from ..core import DrawType, DrawColor, PenWidth
+from ..core import (
+    DrawType, DrawColor, PenWidth,
+    DRAW_COLOR_BY_VALUE, PEN_WIDTH_BY_VALUE
+)
 from ..models import BaseShape, PointShape, RectangleShape, EllipseShape, PolygonShape
 from ..utils.logger import get_logger
+from ..utils.serialization import unpack_points
 
 logger = get_logger(__name__)
 
+# 缺省坐标（模块级单例，图形修改坐标时整体替换 QPointF，不会原地修改它）
+_ZERO = QPointF(0, 0)
+_NO_VERTICES = ()
+# 反序列化时缺少坐标字段的缺省值（不可变元组，避免每次调用都新建空字典/列表）
+_ZERO_XY = (0, 0)
+
+# 图形类型 -> 构造函数
+_CTOR = {
+    DrawType.POINT: PointShape,
+    DrawType.RECTANGLE: RectangleShape,
+    DrawType.ELLIPSE: EllipseShape,
+    DrawType.POLYGON: PolygonShape,
+}
+
+# 图形类型 -> 从关键字参数提取几何参数（按构造函数的参数顺序）
+_ARGS = {
+    DrawType.POINT: lambda kwargs: (kwargs.get('position', _ZERO),),
+    DrawType.RECTANGLE: lambda kwargs: (kwargs.get('start_point', _ZERO), kwargs.get('end_point', _ZERO)),
+    DrawType.ELLIPSE: lambda kwargs: (kwargs.get('start_point', _ZERO), kwargs.get('end_point', _ZERO)),
+    DrawType.POLYGON: lambda kwargs: (kwargs.get('vertices', _NO_VERTICES),),
+}
+
+# 缺省样式
+_DEFAULT_COLOR = DrawColor.RED
+_DEFAULT_WIDTH = PenWidth.MEDIUM
+
+
+def _to_qpointf(data) -> QPointF:
+    """将坐标数据转换为 QPointF（兼容元组格式 (x, y) 和字典格式 {'x': x, 'y': y}）"""
+    if isinstance(data, (list, tuple)):
+        return QPointF(data[0], data[1])
+    return QPointF(data.get('x', 0), data.get('y', 0))
+
+
+def _parse_point(shape_data: Dict[str, Any], color, pen_width, z_order) -> PointShape:
+    """从字典数据创建点图形"""
+    return PointShape(_to_qpointf(shape_data.get('position', _ZERO_XY)), color, pen_width, z_order)
+
+
+def _parse_rectangle(shape_data: Dict[str, Any], color, pen_width, z_order) -> RectangleShape:
+    """从字典数据创建矩形图形"""
+    get = shape_data.get
+    return RectangleShape(
+        _to_qpointf(get('start_point', _ZERO_XY)), _to_qpointf(get('end_point', _ZERO_XY)),
+        color, pen_width, z_order
+    )
+
+
+def _parse_ellipse(shape_data: Dict[str, Any], color, pen_width, z_order) -> EllipseShape:
+    """从字典数据创建椭圆图形"""
+    get = shape_data.get
+    return EllipseShape(
+        _to_qpointf(get('start_point', _ZERO_XY)), _to_qpointf(get('end_point', _ZERO_XY)),
+        color, pen_width, z_order
+    )
+
+
+def _parse_polygon(shape_data: Dict[str, Any], color, pen_width, z_order) -> PolygonShape:
+    """从字典数据创建多边形图形（兼容 base64 压缩格式）"""
+    vertices_data = shape_data.get('vertices', _NO_VERTICES)
+    if isinstance(vertices_data, str):
+        vertices = unpack_points(vertices_data)  # 多边形直接接收坐标数组
+    else:
+        to_qpointf = _to_qpointf
+        vertices = [to_qpointf(v) for v in vertices_data]
+    return PolygonShape(vertices, color, pen_width, z_order)
+
+
+# 图形类型取值 -> 字典解析函数
+_PARSERS = {
+    DrawType.POINT: _parse_point,
+    DrawType.RECTANGLE: _parse_rectangle,
+    DrawType.ELLIPSE: _parse_ellipse,
+    DrawType.POLYGON: _parse_polygon,
+}
+
 
 class ShapeFactory:
     """图形工厂类 - 负责创建各种类型的图形"""
@@ -27,65 +107,22 @@ class ShapeFactory:
         Returns:
             创建的图形对象，如果类型不支持则返回None
         """
+        ctor = _CTOR.get(shape_type)
+        if ctor is None:
+            logger.warning(f"不支持的图形类型: {shape_type}")
+            return None
+        
         try:
-            if shape_type == DrawType.POINT:
-                return ShapeFactory._create_point(**kwargs)
-            elif shape_type == DrawType.RECTANGLE:
-                return ShapeFactory._create_rectangle(**kwargs)
-            elif shape_type == DrawType.ELLIPSE:
-                return ShapeFactory._create_ellipse(**kwargs)
-            elif shape_type == DrawType.POLYGON:
-                return ShapeFactory._create_polygon(**kwargs)
-            else:
-                logger.warning(f"不支持的图形类型: {shape_type}")
-                return None
-                
+            return ctor(
+                *_ARGS[shape_type](kwargs),
+                kwargs.get('color', _DEFAULT_COLOR),
+                kwargs.get('pen_width', _DEFAULT_WIDTH),
+                kwargs.get('z_order')
+            )
         except Exception as e:
             logger.error(f"创建图形失败: {e}")
             return None
     
-    @staticmethod
-    def _create_point(**kwargs) -> PointShape:
-        """创建点图形"""
-        position = kwargs.get('position', QPointF(0, 0))
-        color = kwargs.get('color', DrawColor.RED)
-        pen_width = kwargs.get('pen_width', PenWidth.MEDIUM)
-        z_order = kwargs.get('z_order', None)
-        
-        return PointShape(position, color, pen_width, z_order)
-    
-    @staticmethod
-    def _create_rectangle(**kwargs) -> RectangleShape:
-        """创建矩形图形"""
-        start_point = kwargs.get('start_point', QPointF(0, 0))
-        end_point = kwargs.get('end_point', QPointF(0, 0))
-        color = kwargs.get('color', DrawColor.RED)
-        pen_width = kwargs.get('pen_width', PenWidth.MEDIUM)
-        z_order = kwargs.get('z_order', None)
-        
-        return RectangleShape(start_point, end_point, color, pen_width, z_order)
-    
-    @staticmethod
-    def _create_ellipse(**kwargs) -> EllipseShape:
-        """创建椭圆图形"""
-        start_point = kwargs.get('start_point', QPointF(0, 0))
-        end_point = kwargs.get('end_point', QPointF(0, 0))
-        color = kwargs.get('color', DrawColor.RED)
-        pen_width = kwargs.get('pen_width', PenWidth.MEDIUM)
-        z_order = kwargs.get('z_order', None)
-        
-        return EllipseShape(start_point, end_point, color, pen_width, z_order)
-    
-    @staticmethod
-    def _create_polygon(**kwargs) -> PolygonShape:
-        """创建多边形图形"""
-        vertices = kwargs.get('vertices', [])
-        color = kwargs.get('color', DrawColor.RED)
-        pen_width = kwargs.get('pen_width', PenWidth.MEDIUM)
-        z_order = kwargs.get('z_order', None)
-        
-        return PolygonShape(vertices, color, pen_width, z_order)
-    
     @staticmethod
     def create_from_dict(shape_data: Dict[str, Any]) -> Optional[BaseShape]:
         """
@@ -98,78 +135,33 @@ class ShapeFactory:
             创建的图形对象
         """
         try:
-            shape_type = DrawType(shape_data.get('shape_type'))
-            
-            # 提取通用属性
-            color = DrawColor(shape_data.get('color', DrawColor.RED.value))
-            pen_width = PenWidth(shape_data.get('pen_width', PenWidth.MEDIUM.value))
-            z_order = shape_data.get('z_order', None)
-            
-            # 创建图形对象
-            shape = None
-            
-            # 根据类型提取特定参数
-            if shape_type == DrawType.POINT:
-                position_data = shape_data.get('position', {})
-                # 兼容元组格式 (x, y) 和字典格式 {'x': x, 'y': y}
-                if isinstance(position_data, (list, tuple)) and len(position_data) >= 2:
-                    position = QPointF(position_data[0], position_data[1])
-                else:
-                    position = QPointF(position_data.get('x', 0), position_data.get('y', 0))
-                shape = ShapeFactory._create_point(position=position, color=color, pen_width=pen_width, z_order=z_order)
-                
-            elif shape_type == DrawType.RECTANGLE:
-                start_data = shape_data.get('start_point', {})
-                end_data = shape_data.get('end_point', {})
-                # 兼容元组格式 (x, y) 和字典格式 {'x': x, 'y': y}
-                if isinstance(start_data, (list, tuple)) and len(start_data) >= 2:
-                    start_point = QPointF(start_data[0], start_data[1])
-                else:
-                    start_point = QPointF(start_data.get('x', 0), start_data.get('y', 0))
-                
-                if isinstance(end_data, (list, tuple)) and len(end_data) >= 2:
-                    end_point = QPointF(end_data[0], end_data[1])
-                else:
-                    end_point = QPointF(end_data.get('x', 0), end_data.get('y', 0))
-                
-                shape = ShapeFactory._create_rectangle(
-                    start_point=start_point, end_point=end_point, 
-                    color=color, pen_width=pen_width, z_order=z_order
-                )
-                
-            elif shape_type == DrawType.ELLIPSE:
-                start_data = shape_data.get('start_point', {})
-                end_data = shape_data.get('end_point', {})
-                # 兼容元组格式 (x, y) 和字典格式 {'x': x, 'y': y}
-                if isinstance(start_data, (list, tuple)) and len(start_data) >= 2:
-                    start_point = QPointF(start_data[0], start_data[1])
-                else:
-                    start_point = QPointF(start_data.get('x', 0), start_data.get('y', 0))
-                
-                if isinstance(end_data, (list, tuple)) and len(end_data) >= 2:
-                    end_point = QPointF(end_data[0], end_data[1])
-                else:
-                    end_point = QPointF(end_data.get('x', 0), end_data.get('y', 0))
-                
-                shape = ShapeFactory._create_ellipse(
-                    start_point=start_point, end_point=end_point, 
-                    color=color, pen_width=pen_width, z_order=z_order
-                )
-                
-            elif shape_type == DrawType.POLYGON:
-                vertices_data = shape_data.get('vertices', [])
-                vertices = [QPointF(v.get('x', 0), v.get('y', 0)) for v in vertices_data]
-                shape = ShapeFactory._create_polygon(vertices=vertices, color=color, pen_width=pen_width, z_order=z_order)
-            
-            else:
+            get = shape_data.get  # 场景加载时逐图形调用，字典方法绑定为局部变量
+            shape_type = get('shape_type')
+            parse = _PARSERS.get(shape_type)
+            if parse is None:
                 logger.warning(f"不支持的图形类型: {shape_type}")
                 return None
             
+            # 提取通用属性（缺省时使用默认样式，未知取值拒绝创建）
+            color_value = get('color')
+            color = _DEFAULT_COLOR if color_value is None else DRAW_COLOR_BY_VALUE.get(color_value)
+            if color is None:
+                logger.error(f"从字典创建图形失败: 无效的颜色值 {color_value!r}")
+                return None
+            width_value = get('pen_width')
+            pen_width = _DEFAULT_WIDTH if width_value is None else PEN_WIDTH_BY_VALUE.get(width_value)
+            if pen_width is None:
+                logger.error(f"从字典创建图形失败: 无效的线宽值 {width_value!r}")
+                return None
+            z_order = get('z_order')
+            
+            shape = parse(shape_data, color, pen_width, z_order)
+            shape._restore_shape_id(shape_data)
+            
             # 设置metadata（如果存在）
-            if shape and 'metadata' in shape_data:
-                metadata = shape_data['metadata']
-                if isinstance(metadata, dict):
-                    shape.update_metadata(metadata)
+            metadata = get('metadata')
+            if shape and isinstance(metadata, dict):
+                shape.update_metadata(metadata)
             
             return shape
                 
@@ -180,9 +172,9 @@ class ShapeFactory:
     @staticmethod
     def get_supported_types() -> list:
         """获取支持的图形类型列表"""
-        return [DrawType.POINT, DrawType.RECTANGLE, DrawType.ELLIPSE, DrawType.POLYGON]
+        return list(_CTOR)
     
     @staticmethod
     def is_supported_type(shape_type: DrawType) -> bool:
         """检查是否支持指定的图形类型"""
-        return shape_type in ShapeFactory.get_supported_types()
+        return shape_type in _CTOR
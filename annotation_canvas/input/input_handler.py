@@ -2,13 +2,14 @@
 输入处理器 - 将原始输入转换为语义化事件
 """
 
-from typing import Optional
-from PySide6.QtCore import QPointF
+from typing import Optional, Tuple, Any
+from PySide6.QtCore import QPointF, QTimer
 from PySide6.QtGui import QMouseEvent, QKeyEvent, QWheelEvent
 from PySide6.QtCore import Qt
 
-from ..events import EventBus, Event, EventType
+from ..events import EventBus, Event, EventType, MouseMoveData, MouseButtonData
 from ..core import DrawType, DrawColor, PenWidth
+from ..utils.constants import InteractionConstants
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,6 +18,15 @@ logger = get_logger(__name__)
 class InputHandler:
     """输入处理器 - 将原始输入转换为语义化事件"""
     
+    # 每次鼠标事件都会读取这些属性（__weakref__ 供信号连接与事件总线弱引用订阅使用）
+    __slots__ = (
+        'event_bus', 'canvas_context',
+        'left_button_pressed', 'right_button_pressed', 'middle_button_pressed',
+        '_view_box_getter', '_cached_pixel_size', 'last_mouse_pos', 'mouse_dragging',
+        '_pending_move', '_move_timer', '_move_payload', '_press_payload', '_release_payload',
+        'ctrl_pressed', 'shift_pressed', 'alt_pressed', '__weakref__',
+    )
+    
     def __init__(self, event_bus: EventBus, canvas_context=None):
         """
         初始化输入处理器
@@ -31,24 +41,57 @@ class InputHandler:
         self.right_button_pressed = False
         self.middle_button_pressed = False
         
+        # 像素大小缓存：视图范围或尺寸变化时失效
+        self._view_box_getter = getattr(canvas_context, 'getViewBox', None) if canvas_context else None
+        self._cached_pixel_size: Optional[float] = None
+        self._connect_view_signals()
+        
         # 鼠标状态跟踪
         self.last_mouse_pos: Optional[QPointF] = None
         self.mouse_dragging = False
         
+        # 鼠标移动合并：输入频率远高于刷新率，只在定时器触发时处理最新位置
+        self._pending_move: Optional[Tuple[QPointF, Any]] = None
+        self._move_timer = QTimer()
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(InteractionConstants.MOUSE_MOVE_COALESCE_MS)
+        self._move_timer.timeout.connect(self.flush_pending_move)
+        # 移动事件载荷（每次发布前原地更新，分发是同步或合并到最新一次的，无需每次新建）
+        self._move_payload = MouseMoveData()
+        # 按下/释放事件同步分发，同样复用载荷
+        self._press_payload = MouseButtonData()
+        self._release_payload = MouseButtonData()
+        
         # 键盘状态跟踪
         self.ctrl_pressed = False
         self.shift_pressed = False
         self.alt_pressed = False
     
+    def _connect_view_signals(self) -> None:
+        """视图范围或尺寸变化时使像素大小缓存失效"""
+        if self._view_box_getter is not None:
+            view_box = self._view_box_getter()
+            view_box.sigRangeChanged.connect(self.invalidate_pixel_size)
+            view_box.sigResized.connect(self.invalidate_pixel_size)
+    
+    def invalidate_pixel_size(self, *args) -> None:
+        """使缓存的像素大小失效（下次使用时重新计算）"""
+        self._cached_pixel_size = None
+    
     def _get_pixel_size(self) -> float:
-        """获取当前像素大小"""
-        if self.canvas_context and hasattr(self.canvas_context, 'getViewBox'):
-            try:
-                return self.canvas_context.getViewBox().viewPixelSize()[0]
-            except:
-                pass
-        from ..utils.constants import InteractionConstants
-        return InteractionConstants.DEFAULT_PIXEL_SIZE
+        """获取当前像素大小（缓存到视图变化为止）"""
+        pixel_size = self._cached_pixel_size
+        if pixel_size is not None:
+            return pixel_size
+        
+        if self._view_box_getter is None:
+            pixel_size = InteractionConstants.DEFAULT_PIXEL_SIZE
+        else:
+            pixel_size = self._view_box_getter().viewPixelSize()[0]
+            if pixel_size <= 0:
+                return InteractionConstants.DEFAULT_PIXEL_SIZE  # 视图尚未布局，不缓存默认值
+        self._cached_pixel_size = pixel_size
+        return pixel_size
     
     def handle_mouse_press(self, event: QMouseEvent, world_pos: QPointF) -> None:
         """
@@ -58,6 +101,9 @@ class InputHandler:
             event: 鼠标事件
             world_pos: 世界坐标位置
         """
+        # 先处理尚未发布的移动，保证事件顺序
+        self.flush_pending_move()
+        
         button = event.button()
         
         # 更新按钮状态
@@ -72,21 +118,23 @@ class InputHandler:
         self.last_mouse_pos = world_pos
         
         # 发布鼠标按下事件
-        self.event_bus.publish(Event(
-            EventType.MOUSE_PRESS,
-            {
-                'position': world_pos,
-                'button': button,
-                'left_button_pressed': self.left_button_pressed,
-                'right_button_pressed': self.right_button_pressed,
-                'middle_button_pressed': self.middle_button_pressed,
-                'modifiers': event.modifiers(),
-                'ctrl_pressed': self.ctrl_pressed,
-                'shift_pressed': self.shift_pressed,
-                'alt_pressed': self.alt_pressed,
-                'pixel_size': self._get_pixel_size()
-            }
-        ))
+        self._publish_button(EventType.MOUSE_PRESS, self._press_payload, world_pos, button, event.modifiers())
+    
+    def _publish_button(self, event_type: EventType, payload: MouseButtonData,
+                        world_pos: QPointF, button, modifiers) -> None:
+        """填充复用的按键载荷并发布（对象池中的事件）"""
+        payload.position = world_pos
+        payload.button = button
+        payload.left_button_pressed = self.left_button_pressed
+        payload.right_button_pressed = self.right_button_pressed
+        payload.middle_button_pressed = self.middle_button_pressed
+        payload.dragging = self.mouse_dragging
+        payload.modifiers = modifiers
+        payload.ctrl_pressed = self.ctrl_pressed
+        payload.shift_pressed = self.shift_pressed
+        payload.alt_pressed = self.alt_pressed
+        payload.pixel_size = self._get_pixel_size()
+        self.event_bus.publish_transient(event_type, payload)
     
     def handle_mouse_move(self, event: QMouseEvent, world_pos: QPointF) -> None:
         """
@@ -100,23 +148,44 @@ class InputHandler:
         if self.left_button_pressed and not self.mouse_dragging:
             self.mouse_dragging = True
         
-        # 发布鼠标移动事件
-        self.event_bus.publish(Event(
-            EventType.MOUSE_MOVE,
-            {
-                'position': world_pos,
-                'last_position': self.last_mouse_pos,
-                'left_button_pressed': self.left_button_pressed,
-                'right_button_pressed': self.right_button_pressed,
-                'middle_button_pressed': self.middle_button_pressed,
-                'dragging': self.mouse_dragging,
-                'modifiers': event.modifiers(),
-                'ctrl_pressed': self.ctrl_pressed,
-                'shift_pressed': self.shift_pressed,
-                'alt_pressed': self.alt_pressed,
-                'pixel_size': self._get_pixel_size()
-            }
-        ))
+        # 没有订阅者时只跟踪位置，不合并也不发布
+        if not self.event_bus.has_subscribers(EventType.MOUSE_MOVE):
+            self._pending_move = None
+            self.last_mouse_pos = world_pos
+            return
+        
+        # 只记录最新位置，定时器触发时统一发布
+        self._pending_move = (world_pos, event.modifiers())
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+    
+    def flush_pending_move(self) -> None:
+        """立即发布合并中的鼠标移动事件（若有）"""
+        self._move_timer.stop()
+        pending = self._pending_move
+        if pending is None:
+            return
+        self._pending_move = None
+        
+        world_pos, modifiers = pending
+        # 位置未变化时不重复发布
+        if world_pos == self.last_mouse_pos:
+            return
+        
+        # 发布鼠标移动事件（高频事件，使用对象池与复用的载荷）
+        payload = self._move_payload
+        payload.position = world_pos
+        payload.last_position = self.last_mouse_pos
+        payload.left_button_pressed = self.left_button_pressed
+        payload.right_button_pressed = self.right_button_pressed
+        payload.middle_button_pressed = self.middle_button_pressed
+        payload.dragging = self.mouse_dragging
+        payload.modifiers = modifiers
+        payload.ctrl_pressed = self.ctrl_pressed
+        payload.shift_pressed = self.shift_pressed
+        payload.alt_pressed = self.alt_pressed
+        payload.pixel_size = self._get_pixel_size()
+        self.event_bus.publish_transient(EventType.MOUSE_MOVE, payload)
         
         # 更新鼠标位置
         self.last_mouse_pos = world_pos
@@ -129,6 +198,9 @@ class InputHandler:
             event: 鼠标事件
             world_pos: 世界坐标位置
         """
+        # 先处理尚未发布的移动，保证拖拽结束位置正确
+        self.flush_pending_move()
+        
         button = event.button()
         
         # 更新按钮状态
@@ -140,21 +212,7 @@ class InputHandler:
             self.middle_button_pressed = False
         
         # 发布鼠标释放事件
-        self.event_bus.publish(Event(
-            EventType.MOUSE_RELEASE,
-            {
-                'position': world_pos,
-                'button': button,
-                'left_button_pressed': self.left_button_pressed,
-                'right_button_pressed': self.right_button_pressed,
-                'middle_button_pressed': self.middle_button_pressed,
-                'dragging': self.mouse_dragging,
-                'modifiers': event.modifiers(),
-                'ctrl_pressed': self.ctrl_pressed,
-                'shift_pressed': self.shift_pressed,
-                'alt_pressed': self.alt_pressed
-            }
-        ))
+        self._publish_button(EventType.MOUSE_RELEASE, self._release_payload, world_pos, button, event.modifiers())
         
         # 重置拖拽状态
         self.mouse_dragging = False
@@ -189,6 +247,9 @@ class InputHandler:
         Args:
             event: 键盘事件
         """
+        # 快捷键可能依赖悬停状态，先处理尚未发布的移动
+        self.flush_pending_move()
+        
         key = event.key()
         modifiers = event.modifiers()
         
@@ -231,6 +292,8 @@ class InputHandler:
     
     def reset_state(self) -> None:
         """重置输入状态"""
+        self._move_timer.stop()
+        self._pending_move = None
         self.left_button_pressed = False
         self.right_button_pressed = False
         self.middle_button_pressed = False
@@ -260,9 +323,6 @@ class InputHandler:
     
     def cleanup(self) -> None:
         """清理资源"""
-        from ..utils.logger import get_logger
-        logger = get_logger(__name__)
-        
         # 取消所有事件订阅
         if hasattr(self, '_event_handlers') and self._event_handlers:
             for event_type, handler in self._event_handlers.items():
@@ -10,8 +10,10 @@ from .rectangle import RectangleShape
 from .ellipse import EllipseShape
 from .polygon import PolygonShape
 from .control_point import ControlPoint
+from .control_point_array import ControlPointArray
+from .shape_store import ShapeStore
 
 __all__ = [
     'BaseShape', 'PointShape', 'RectangleShape', 
-    'EllipseShape', 'PolygonShape', 'ControlPoint'
+    'EllipseShape', 'PolygonShape', 'ControlPoint', 'ControlPointArray', 'ShapeStore'
 ]
@@ -3,48 +3,113 @@
 """
 
 from typing import Optional, Tuple
+import numpy as np
 from PySide6.QtCore import QPointF, QRectF
 from ..core.enums import ControlPointType
+from ..utils.constants import ColorConstants, InteractionConstants
+
+# 控制点类型 -> 颜色 / 样式（拖拽、悬停状态的颜色优先）
+_COLOR_BY_TYPE = {
+    ControlPointType.CENTER: ColorConstants.CONTROL_POINT_CENTER,
+    ControlPointType.CORNER: ColorConstants.CONTROL_POINT_CORNER,
+    ControlPointType.EDGE: ColorConstants.CONTROL_POINT_EDGE,
+    ControlPointType.VERTEX: ColorConstants.CONTROL_POINT_VERTEX,
+}
+_STYLE_BY_TYPE = {
+    ControlPointType.CENTER: "circle",
+    ControlPointType.CORNER: "square",
+    ControlPointType.EDGE: "diamond",
+    ControlPointType.VERTEX: "triangle",
+}
+_COLOR_DRAGGING = ColorConstants.CONTROL_POINT_DRAGGING
+_COLOR_HOVER = ColorConstants.CONTROL_POINT_HOVER
+_COLOR_DEFAULT = ColorConstants.CONTROL_POINT_DEFAULT
+
 
 class ControlPoint:
     """控制点类"""
     
+    # 多边形的每个顶点都有一个控制点，固定实例属性以减少内存占用
+    __slots__ = (
+        'position', 'control_type', 'index', 'size', 'visible', 'hovered', 'dragging',
+        'original_position', 'graphics_item', '_array', '_row', '_bounds_cache',
+    )
+    
     def __init__(self, position: QPointF, control_type: ControlPointType, 
                  index: int = 0, size: float = None):
         self.position = position
         self.control_type = control_type
         self.index = index
-        from ..utils.constants import InteractionConstants
         self.size = size if size is not None else InteractionConstants.CONTROL_POINT_DEFAULT_SIZE
         self.visible = True
         self.hovered = False
         self.dragging = False
         self.original_position = position
         self.graphics_item = None  # PyQtGraph图形项引用
+        # 所属SoA存储及行号（由ControlPointArray维护）
+        self._array = None
+        self._row = -1
+        self._bounds_cache: Optional[QRectF] = None  # 边界矩形缓存，位置变化时失效
+    
+    def _sync(self):
+        """位置或状态变化后写回所属存储"""
+        if self._array is not None:
+            self._array.sync_row(self._row)
     
     def contains_point(self, point: QPointF, tolerance: float = None) -> bool:
         """检查点是否在控制点范围内"""
-        from ..utils.geometry import GeometryUtils
-        from ..utils.constants import InteractionConstants
-        
-        distance = GeometryUtils.distance_between_points(point, self.position)
         if tolerance is None:
             tolerance = InteractionConstants.CONTROL_POINT_TOLERANCE
-        return distance <= tolerance
+        # 比较距离平方，省去开方
+        position = self.position
+        dx = point.x() - position.x()
+        dy = point.y() - position.y()
+        return dx * dx + dy * dy <= tolerance * tolerance
+    
+    @staticmethod
+    def find_containing(positions: np.ndarray, x: float, y: float, tolerance: float) -> int:
+        """
+        批量命中检测：在控制点坐标数组中查找距离查询点最近且在容差内的控制点
+        
+        Args:
+            positions: 控制点坐标数组 (k, 2)
+            x, y: 查询点坐标
+            tolerance: 距离容差
+            
+        Returns:
+            命中控制点的下标，没有命中时返回 -1
+        """
+        if not len(positions):
+            return -1
+        dx = positions[:, 0] - x
+        dy = positions[:, 1] - y
+        dist_sq = dx * dx + dy * dy  # 比较距离平方，无需开方
+        index = int(np.argmin(dist_sq))
+        return index if dist_sq[index] <= tolerance * tolerance else -1
     
     def get_bounds(self) -> QRectF:
-        """获取控制点边界矩形"""
-        half_size = self.size / 2
-        return QRectF(
-            self.position.x() - half_size,
-            self.position.y() - half_size,
-            self.size,
-            self.size
-        )
+        """
+        获取控制点边界矩形（带缓存）
+        
+        Note:
+            返回的是缓存对象，调用方不应原地修改
+        """
+        bounds = self._bounds_cache
+        if bounds is None:
+            half_size = self.size / 2
+            bounds = self._bounds_cache = QRectF(
+                self.position.x() - half_size,
+                self.position.y() - half_size,
+                self.size,
+                self.size
+            )
+        return bounds
     
     def set_position(self, position: QPointF):
         """设置控制点位置"""
         self.position = position
+        self._bounds_cache = None
+        self._sync()
         if self.graphics_item:
             self.graphics_item.setData([position.x()], [position.y()])
     
@@ -56,10 +121,12 @@ class ControlPoint:
         """开始拖拽"""
         self.dragging = True
         self.original_position = self.position
+        self._sync()
     
     def stop_dragging(self):
         """停止拖拽"""
         self.dragging = False
+        self._sync()
     
     def is_dragging(self) -> bool:
         """检查是否正在拖拽"""
@@ -68,6 +135,7 @@ class ControlPoint:
     def set_visible(self, visible: bool):
         """设置可见性"""
         self.visible = visible
+        self._sync()
         if self.graphics_item:
             self.graphics_item.setVisible(visible)
     
@@ -78,6 +146,7 @@ class ControlPoint:
     def set_hovered(self, hovered: bool):
         """设置悬停状态"""
         self.hovered = hovered
+        self._sync()
     
     def is_hovered(self) -> bool:
         """检查是否悬停"""
@@ -85,35 +154,15 @@ class ControlPoint:
     
     def get_color(self) -> Tuple[int, int, int]:
         """获取控制点颜色"""
-        from ..utils.constants import ColorConstants
-        
         if self.dragging:
-            return ColorConstants.CONTROL_POINT_DRAGGING
-        elif self.hovered:
-            return ColorConstants.CONTROL_POINT_HOVER
-        elif self.control_type == ControlPointType.CENTER:
-            return ColorConstants.CONTROL_POINT_CENTER
-        elif self.control_type == ControlPointType.CORNER:
-            return ColorConstants.CONTROL_POINT_CORNER
-        elif self.control_type == ControlPointType.EDGE:
-            return ColorConstants.CONTROL_POINT_EDGE
-        elif self.control_type == ControlPointType.VERTEX:
-            return ColorConstants.CONTROL_POINT_VERTEX
-        else:
-            return ColorConstants.CONTROL_POINT_DEFAULT
+            return _COLOR_DRAGGING
+        if self.hovered:
+            return _COLOR_HOVER
+        return _COLOR_BY_TYPE.get(self.control_type, _COLOR_DEFAULT)
     
     def get_style(self) -> str:
         """获取控制点样式"""
-        if self.control_type == ControlPointType.CENTER:
-            return "circle"
-        elif self.control_type == ControlPointType.CORNER:
-            return "square"
-        elif self.control_type == ControlPointType.EDGE:
-            return "diamond"
-        elif self.control_type == ControlPointType.VERTEX:
-            return "triangle"
-        else:
-            return "circle"
+        return _STYLE_BY_TYPE.get(self.control_type, "circle")
     
     def to_dict(self) -> dict:
         """转换为字典格式，用于序列化"""
@@ -131,7 +180,6 @@ class ControlPoint:
         position = QPointF(data['position'][0], data['position'][1])
         control_type = ControlPointType(data['control_type'])
         index = data.get('index', 0)
-        from ..utils.constants import InteractionConstants
         size = data.get('size', InteractionConstants.CONTROL_POINT_DEFAULT_SIZE)
         visible = data.get('visible', True)
         
@@ -0,0 +1,143 @@
+# This Python file uses the following encoding: utf-8
+
+"""
+控制点SoA存储 - 以并行数组保存图形控制点的坐标、类型与状态，用于批量命中检测与边界计算
+"""
+
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
+from PySide6.QtCore import QRectF
+
+from .control_point import ControlPoint
+
+
+class ControlPointArray:
+    """
+    控制点SoA存储
+
+    每行对应一个控制点，行顺序即控制点顺序。控制点对象本身保持不变（渲染层以其为键），
+    通过 _array/_row 反向引用所在行，位置或状态变化时写回该行，
+    批量操作直接使用 positions/types/flags 数组，无需逐个访问控制点对象。
+    """
+
+    # 状态位
+    FLAG_VISIBLE = 1
+    FLAG_HOVERED = 2
+    FLAG_DRAGGING = 4
+
+    _INITIAL_CAPACITY = 4
+
+    __slots__ = ('_points', '_positions', '_types', '_flags', '_capacity')
+
+    def __init__(self, points: Iterable[ControlPoint] = ()):
+        """
+        初始化存储
+
+        Args:
+            points: 初始控制点
+        """
+        self._points: List[ControlPoint] = list(points)
+        self._capacity = 0
+        self._positions = None
+        self._types = None
+        self._flags = None
+        self._allocate(max(len(self._points), self._INITIAL_CAPACITY))
+        for row, cp in enumerate(self._points):
+            self._attach(row, cp)
+
+    def _allocate(self, capacity: int) -> None:
+        """分配（或扩容）并行数组"""
+        count = len(self._points)
+        positions = np.zeros((capacity, 2), dtype=np.float64)
+        types = np.zeros(capacity, dtype=np.uint8)
+        flags = np.zeros(capacity, dtype=np.uint8)
+        if self._positions is not None:
+            positions[:count] = self._positions[:count]
+            types[:count] = self._types[:count]
+            flags[:count] = self._flags[:count]
+        self._positions, self._types, self._flags = positions, types, flags
+        self._capacity = capacity
+
+    def _attach(self, row: int, cp: ControlPoint) -> None:
+        """建立控制点与行的关联并写入该行"""
+        cp._array = self
+        cp._row = row
+        self.sync_row(row)
+
+    def sync_row(self, row: int) -> None:
+        """将控制点的当前位置与状态写入所在行"""
+        cp = self._points[row]
+        position = cp.position
+        self._positions[row] = (position.x(), position.y())
+        self._types[row] = cp.control_type
+        self._flags[row] = (
+            (self.FLAG_VISIBLE if cp.visible else 0)
+            | (self.FLAG_HOVERED if cp.hovered else 0)
+            | (self.FLAG_DRAGGING if cp.dragging else 0)
+        )
+
+    @property
+    def positions(self) -> np.ndarray:
+        """控制点坐标数组 (k, 2)（内部数组的视图，调用方不应修改）"""
+        return self._positions[:len(self._points)]
+
+    @property
+    def types(self) -> np.ndarray:
+        """控制点类型数组 (k,)"""
+        return self._types[:len(self._points)]
+
+    @property
+    def flags(self) -> np.ndarray:
+        """控制点状态位数组 (k,)"""
+        return self._flags[:len(self._points)]
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __iter__(self) -> Iterator[ControlPoint]:
+        return iter(self._points)
+
+    def __getitem__(self, index):
+        return self._points[index]
+
+    def view(self, index: int) -> ControlPoint:
+        """获取指定行的控制点"""
+        return self._points[index]
+
+    def append(self, cp: ControlPoint) -> None:
+        """追加控制点到末尾"""
+        row = len(self._points)
+        if row >= self._capacity:
+            self._allocate(self._capacity * 2)
+        self._points.append(cp)
+        self._attach(row, cp)
+
+    def pop(self, index: int = -1) -> ControlPoint:
+        """移除并返回控制点，后续行整体前移"""
+        count = len(self._points)
+        row = index if index >= 0 else count + index
+        cp = self._points.pop(row)
+        for array in (self._positions, self._types, self._flags):
+            array[row:count - 1] = array[row + 1:count]
+        for i in range(row, count - 1):
+            self._points[i]._row = i
+        cp._array = None
+        cp._row = -1
+        return cp
+
+    def clear(self) -> None:
+        """清空存储"""
+        for cp in self._points:
+            cp._array = None
+            cp._row = -1
+        self._points.clear()
+
+    def get_bounds(self) -> Optional[QRectF]:
+        """所有控制点坐标的外接矩形（没有控制点时返回None）"""
+        positions = self.positions
+        if not len(positions):
+            return None
+        min_x, min_y = positions.min(axis=0).tolist()
+        max_x, max_y = positions.max(axis=0).tolist()
+        return QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
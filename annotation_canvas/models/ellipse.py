@@ -6,13 +6,17 @@
 
 from typing import List, Dict, Any, Tuple
 from PySide6.QtCore import QPointF, QRectF
-from ..core.enums import DrawType, DrawColor, PenWidth, ControlPointType
+from ..core.enums import DrawType, DrawColor, PenWidth, ControlPointType, DRAW_COLOR_BY_VALUE, PEN_WIDTH_BY_VALUE
+from ..utils.constants import InteractionConstants
 from .shape import BaseShape
 from .control_point import ControlPoint
+from .control_point_array import ControlPointArray
 
 class EllipseShape(BaseShape):
     """椭圆图形类 - 矩形内接椭圆"""
     
+    __slots__ = ('start_point', 'end_point', '_radii', '_hit_params')
+    
     def __init__(self, start_point: QPointF, end_point: QPointF, 
                  color: DrawColor = DrawColor.RED, pen_width: PenWidth = PenWidth.MEDIUM, z_order: int = None):
         self.start_point = start_point
@@ -37,119 +41,138 @@ class EllipseShape(BaseShape):
             size=8.0
         )
         
-        self.control_points = [top_left_cp, bottom_right_cp]
-    
-    def get_bounds(self) -> QRectF:
-        """获取图形边界矩形"""
-        min_x = min(self.start_point.x(), self.end_point.x())
-        min_y = min(self.start_point.y(), self.end_point.y())
-        max_x = max(self.start_point.x(), self.end_point.x())
-        max_y = max(self.start_point.y(), self.end_point.y())
+        self.control_points = ControlPointArray((top_left_cp, bottom_right_cp))
+    
+    def _calculate_bounds(self) -> QRectF:
+        """计算图形边界矩形"""
+        sx, sy = self.start_point.x(), self.start_point.y()
+        ex, ey = self.end_point.x(), self.end_point.y()
+        min_x, max_x = (sx, ex) if sx < ex else (ex, sx)
+        min_y, max_y = (sy, ey) if sy < ey else (ey, sy)
         
         return QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
     
-    def get_center(self) -> QPointF:
-        """获取椭圆中心"""
-        bounds = self.get_bounds()
+    def _calculate_center(self) -> QPointF:
+        """计算椭圆中心"""
+        bounds = self._bounds_cache
         return QPointF(
             bounds.x() + bounds.width() / 2,
             bounds.y() + bounds.height() / 2
         )
     
+    def _refresh_geometry_cache(self) -> None:
+        """重新计算几何缓存（半径随边界一起缓存，纯平移时保持不变）"""
+        super()._refresh_geometry_cache()
+        bounds = self._bounds_cache
+        center = self._center_cache
+        radius_x = bounds.width() / 2
+        radius_y = bounds.height() / 2
+        self._radii = (radius_x, radius_y)
+        # 命中检测参数 (中心x, 中心y, 1/rx, 1/ry, 1/min(rx, ry))，退化椭圆的倒数记为0
+        if radius_x > 0 and radius_y > 0:
+            self._hit_params = (center.x(), center.y(), 1.0 / radius_x, 1.0 / radius_y,
+                                1.0 / min(radius_x, radius_y))
+        else:
+            self._hit_params = (center.x(), center.y(), 0.0, 0.0, 0.0)
+    
+    def _translate_geometry_cache(self, offset: QPointF) -> None:
+        """纯平移时同步平移命中检测参数中的中心"""
+        was_dirty = self._geometry_dirty
+        super()._translate_geometry_cache(offset)
+        if not was_dirty:
+            cx, cy, inv_rx, inv_ry, inv_min_r = self._hit_params
+            self._hit_params = (cx + offset.x(), cy + offset.y(), inv_rx, inv_ry, inv_min_r)
+    
+    def get_radii(self) -> Tuple[float, float]:
+        """获取 (X轴半径, Y轴半径)（带缓存）"""
+        if self._geometry_dirty:
+            self._refresh_geometry_cache()
+        return self._radii
     
     def get_radius_x(self) -> float:
         """获取X轴半径"""
-        return abs(self.end_point.x() - self.start_point.x()) / 2
+        return self.get_radii()[0]
     
     def get_radius_y(self) -> float:
         """获取Y轴半径"""
-        return abs(self.end_point.y() - self.start_point.y()) / 2
+        return self.get_radii()[1]
     
     def contains_point(self, point: QPointF, tolerance: float = None) -> bool:
         """检查点是否在图形内"""
-        from ..utils.constants import InteractionConstants
         if tolerance is None:
             tolerance = InteractionConstants.SHAPE_DEFAULT_TOLERANCE
-            
-        center = self.get_center()
-        radius_x = self.get_radius_x()
-        radius_y = self.get_radius_y()
+        
+        if self._geometry_dirty:
+            self._refresh_geometry_cache()
+        cx, cy, inv_rx, inv_ry, inv_min_r = self._hit_params
         
         # 检查半径是否有效
-        if radius_x <= 0 or radius_y <= 0:
-            # 如果椭圆无效，使用矩形判定
-            bounds = self.get_bounds()
-            expanded_bounds = QRectF(
-                bounds.x() - tolerance,
-                bounds.y() - tolerance,
-                bounds.width() + 2 * tolerance,
-                bounds.height() + 2 * tolerance
-            )
-            return expanded_bounds.contains(point)
+        if not inv_min_r:
+            # 如果椭圆无效，使用矩形判定（直接比较坐标，不构造扩展矩形）
+            sx, sy = self.start_point.x(), self.start_point.y()
+            ex, ey = self.end_point.x(), self.end_point.y()
+            px, py = point.x(), point.y()
+            return ((sx if sx < ex else ex) - tolerance <= px <= (sx if sx > ex else ex) + tolerance
+                    and (sy if sy < ey else ey) - tolerance <= py <= (sy if sy > ey else ey) + tolerance)
         
-        # 计算点到椭圆中心的距离
-        dx = (point.x() - center.x()) / radius_x
-        dy = (point.y() - center.y()) / radius_y
+        # 计算点到椭圆中心的归一化距离
+        dx = (point.x() - cx) * inv_rx
+        dy = (point.y() - cy) * inv_ry
         distance = dx * dx + dy * dy
         
         # 在椭圆边界附近（考虑容差）
-        tolerance_factor = tolerance / min(radius_x, radius_y) if min(radius_x, radius_y) > 0 else 1.0
+        tolerance_factor = tolerance * inv_min_r
         return distance <= (1.0 + tolerance_factor) ** 2
     
     
     def contains_point_on_boundary(self, point: QPointF, tolerance: float = None) -> bool:
         """检查点是否在椭圆轮廓线上（仅轮廓线，不包括内部）"""
-        from ..utils.constants import InteractionConstants
         if tolerance is None:
             tolerance = InteractionConstants.SHAPE_DEFAULT_TOLERANCE
-            
-        center = self.get_center()
-        radius_x = self.get_radius_x()
-        radius_y = self.get_radius_y()
+        
+        if self._geometry_dirty:
+            self._refresh_geometry_cache()
+        cx, cy, inv_rx, inv_ry, inv_min_r = self._hit_params
         
         # 检查半径是否有效
-        if radius_x <= 0 or radius_y <= 0:
+        if not inv_min_r:
             # 如果椭圆无效，使用矩形边界判定
-            bounds = self.get_bounds()
-            left = bounds.left()
-            right = bounds.right()
-            top = bounds.top()
-            bottom = bounds.bottom()
+            sx, sy = self.start_point.x(), self.start_point.y()
+            ex, ey = self.end_point.x(), self.end_point.y()
+            left, right = (sx, ex) if sx < ex else (ex, sx)
+            top, bottom = (sy, ey) if sy < ey else (ey, sy)
+            px, py = point.x(), point.y()
             
             # 检查是否在矩形边界附近
-            if left - tolerance <= point.x() <= right + tolerance:
-                if abs(point.y() - top) <= tolerance or abs(point.y() - bottom) <= tolerance:
+            if left - tolerance <= px <= right + tolerance:
+                if abs(py - top) <= tolerance or abs(py - bottom) <= tolerance:
                     return True
             
-            if top - tolerance <= point.y() <= bottom + tolerance:
-                if abs(point.x() - left) <= tolerance or abs(point.x() - right) <= tolerance:
+            if top - tolerance <= py <= bottom + tolerance:
+                if abs(px - left) <= tolerance or abs(px - right) <= tolerance:
                     return True
             
             return False
         
         # 计算点到椭圆中心的归一化距离
-        dx = (point.x() - center.x()) / radius_x
-        dy = (point.y() - center.y()) / radius_y
+        dx = (point.x() - cx) * inv_rx
+        dy = (point.y() - cy) * inv_ry
         distance = dx * dx + dy * dy
         
         # 计算容差因子
-        tolerance_factor = tolerance / min(radius_x, radius_y) if min(radius_x, radius_y) > 0 else 1.0
+        tolerance_factor = tolerance * inv_min_r
         
         # 检查是否在椭圆边界附近（在边界上或略超出边界，但不在内部）
         return 1.0 - tolerance_factor <= distance <= 1.0 + tolerance_factor
     
     def move_by(self, offset: QPointF):
         """移动图形"""
-        self.start_point = QPointF(
-            self.start_point.x() + offset.x(),
-            self.start_point.y() + offset.y()
-        )
-        self.end_point = QPointF(
-            self.end_point.x() + offset.x(),
-            self.end_point.y() + offset.y()
-        )
-        # 更新控制点位置
-        self.update_control_points()
+        # 端点对象可能被操作记录（如缩放撤销）引用，不原地修改，用一次 Qt 加法生成新点
+        self.start_point = self.start_point + offset
+        self.end_point = self.end_point + offset
+        self._translate_geometry_cache(offset)
+        # 控制点延迟到下次访问时更新
+        self._mark_control_points_dirty()
     
     def scale_by_control_point(self, control_point: ControlPoint, new_position: QPointF):
         """通过控制点缩放图形"""
@@ -160,11 +183,14 @@ class EllipseShape(BaseShape):
             # 保持左上角不变，移动右下角
             self.end_point = new_position
         
+        self._invalidate_geometry_cache()
         # 更新控制点位置
         self.update_control_points()
     
     def update_control_points(self):
         """更新控制点位置"""
+        if self.control_points is None:
+            return  # 尚未创建，创建时即为最新位置
         self.control_points[0].set_position(self.start_point)
         self.control_points[1].set_position(self.end_point)
     
@@ -179,11 +205,13 @@ class EllipseShape(BaseShape):
     def set_start_point(self, point: QPointF):
         """设置起始点"""
         self.start_point = point
+        self._invalidate_geometry_cache()
         self.update_control_points()
     
     def set_end_point(self, point: QPointF):
         """设置结束点"""
         self.end_point = point
+        self._invalidate_geometry_cache()
         self.update_control_points()
     
     def get_width(self) -> float:
@@ -208,11 +236,13 @@ class EllipseShape(BaseShape):
         """从字典创建实例，用于反序列化"""
         start_point = QPointF(data['start_point'][0], data['start_point'][1])
         end_point = QPointF(data['end_point'][0], data['end_point'][1])
-        color = DrawColor(data.get('color', DrawColor.RED.value))
-        pen_width = PenWidth(data.get('pen_width', PenWidth.MEDIUM.value))
+        color = DRAW_COLOR_BY_VALUE[data.get('color', DrawColor.RED.value)]
+        pen_width = PEN_WIDTH_BY_VALUE[data.get('pen_width', PenWidth.MEDIUM.value)]
         z_order = data.get('z_order', None)
         
-        return cls(start_point, end_point, color, pen_width, z_order)
+        shape = cls(start_point, end_point, color, pen_width, z_order)
+        shape._restore_shape_id(data)
+        return shape
     
     def __str__(self) -> str:
         return f"EllipseShape(start=({self.start_point.x():.1f}, {self.start_point.y():.1f}), " \
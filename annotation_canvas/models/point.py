@@ -6,13 +6,17 @@
 
 from typing import List, Dict, Any, Tuple
 from PySide6.QtCore import QPointF, QRectF
-from ..core.enums import DrawType, DrawColor, PenWidth, ControlPointType
+from ..core.enums import DrawType, DrawColor, PenWidth, ControlPointType, DRAW_COLOR_BY_VALUE, PEN_WIDTH_BY_VALUE
+from ..utils.constants import InteractionConstants
 from .shape import BaseShape
 from .control_point import ControlPoint
+from .control_point_array import ControlPointArray
 
 class PointShape(BaseShape):
     """点图形类"""
     
+    __slots__ = ('position',)
+    
     def __init__(self, position: QPointF, color: DrawColor = DrawColor.RED, 
                  pen_width: PenWidth = PenWidth.MEDIUM, z_order: int = None):
         self.position = position
@@ -26,10 +30,10 @@ class PointShape(BaseShape):
             index=0,
             size=8.0
         )
-        self.control_points = [center_cp]
+        self.control_points = ControlPointArray((center_cp,))
     
-    def get_bounds(self) -> QRectF:
-        """获取图形边界矩形"""
+    def _calculate_bounds(self) -> QRectF:
+        """计算图形边界矩形"""
         # 点图形的边界是一个小正方形
         size = 10.0  # 点的显示大小
         half_size = size / 2
@@ -42,14 +46,15 @@ class PointShape(BaseShape):
     
     def contains_point(self, point: QPointF, tolerance: float = None) -> bool:
         """检查点是否在图形内"""
-        from ..utils.geometry import GeometryUtils
-        from ..utils.constants import InteractionConstants
         
         if tolerance is None:
             tolerance = InteractionConstants.SHAPE_DEFAULT_TOLERANCE
             
-        distance = GeometryUtils.distance_between_points(point, self.position)
-        return distance <= tolerance
+        # 比较距离平方，省去开方
+        position = self.position
+        dx = point.x() - position.x()
+        dy = point.y() - position.y()
+        return dx * dx + dy * dy <= tolerance * tolerance
     
     
     def contains_point_on_boundary(self, point: QPointF, tolerance: float = None) -> bool:
@@ -58,21 +63,27 @@ class PointShape(BaseShape):
     
     def move_by(self, offset: QPointF):
         """移动图形"""
-        self.position = QPointF(
-            self.position.x() + offset.x(),
-            self.position.y() + offset.y()
-        )
-        # 更新控制点位置
-        self.control_points[0].set_position(self.position)
+        # 位置对象可能被拖拽状态或操作记录引用，不原地修改
+        self.position = self.position + offset
+        self._translate_geometry_cache(offset)
+        # 控制点延迟到下次访问时更新
+        self._mark_control_points_dirty()
     
     def scale_by_control_point(self, control_point: ControlPoint, new_position: QPointF):
         """通过控制点缩放图形 - 点图形不支持缩放，只支持移动"""
         # 点图形不支持缩放，直接移动
         self.position = new_position
+        self._invalidate_geometry_cache()
+        self.update_control_points()
+    
+    def update_control_points(self):
+        """更新控制点位置"""
+        if self.control_points is None:
+            return  # 尚未创建，创建时即为最新位置
         self.control_points[0].set_position(self.position)
     
-    def get_center(self) -> QPointF:
-        """获取点中心（点图形的中心就是位置）"""
+    def _calculate_center(self) -> QPointF:
+        """计算点中心（点图形的中心就是位置）"""
         return self.position
     
     def get_position(self) -> QPointF:
@@ -82,7 +93,8 @@ class PointShape(BaseShape):
     def set_position(self, position: QPointF):
         """设置点位置"""
         self.position = position
-        self.control_points[0].set_position(position)
+        self._invalidate_geometry_cache()
+        self.update_control_points()
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式，用于序列化"""
@@ -96,11 +108,13 @@ class PointShape(BaseShape):
     def from_dict(cls, data: Dict[str, Any]) -> 'PointShape':
         """从字典创建实例，用于反序列化"""
         position = QPointF(data['position'][0], data['position'][1])
-        color = DrawColor(data.get('color', DrawColor.RED.value))
-        pen_width = PenWidth(data.get('pen_width', PenWidth.MEDIUM.value))
+        color = DRAW_COLOR_BY_VALUE[data.get('color', DrawColor.RED.value)]
+        pen_width = PEN_WIDTH_BY_VALUE[data.get('pen_width', PenWidth.MEDIUM.value)]
         z_order = data.get('z_order', None)
         
-        return cls(position, color, pen_width, z_order)
+        shape = cls(position, color, pen_width, z_order)
+        shape._restore_shape_id(data)
+        return shape
     
     def __str__(self) -> str:
         return f"PointShape(pos=({self.position.x():.1f}, {self.position.y():.1f}))"
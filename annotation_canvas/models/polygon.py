@@ -4,223 +4,313 @@
 多边形图形类 - 实现多边形图形的数据结构和行为
 """
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Union
+import numpy as np
 from PySide6.QtCore import QPointF, QRectF
-from ..core.enums import DrawType, DrawColor, PenWidth, ControlPointType
+from ..core.enums import DrawType, DrawColor, PenWidth, ControlPointType, DRAW_COLOR_BY_VALUE, PEN_WIDTH_BY_VALUE
 from ..utils.constants import InteractionConstants
 from .shape import BaseShape
 from .control_point import ControlPoint
+from .control_point_array import ControlPointArray
+from .polygon_math import (
+    HAS_NUMBA, point_in_polygon, points_in_polygon, polygon_edges, boundary_distance_sq
+)
+from ..utils.serialization import unpack_points
 
 class PolygonShape(BaseShape):
-    """多边形图形类"""
+    """
+    多边形图形类
     
-    def __init__(self, vertices: List[QPointF], color: DrawColor = DrawColor.RED, 
+    顶点以 (n, 2) 的 numpy 数组保存，边界、重心与命中检测均按数组整体计算；
+    vertices 属性按需生成 QPointF 列表（缓存至下次顶点变化）。
+    """
+    
+    __slots__ = ('_verts', '_vertex_list', '_closed_flag', '_bbox', '_edges', 'closed')
+    
+    def __init__(self, vertices: Union[List[QPointF], np.ndarray], color: DrawColor = DrawColor.RED, 
                  pen_width: PenWidth = PenWidth.MEDIUM, z_order: int = None):
-        self.vertices = vertices.copy() if vertices else []
+        self._verts = self._to_array(vertices)
+        self._vertex_list = None  # QPointF列表缓存
+        self._edges = None  # 边向量缓存（平移不变，顶点变化时清除）
+        self._closed_flag = self._compute_closed(self._verts)  # 首尾顶点是否重合（顶点变化时更新）
         self.closed = True  # 默认闭合
         super().__init__(DrawType.POLYGON, color, pen_width, z_order)
     
+    @staticmethod
+    def _to_array(vertices: Union[List[QPointF], np.ndarray]) -> np.ndarray:
+        """将顶点列表（或 (n, 2) 坐标数组，复制后使用）转换为 (n, 2) 数组"""
+        if isinstance(vertices, np.ndarray):
+            return np.array(vertices, dtype=np.float64).reshape(-1, 2)
+        if not vertices:
+            return np.empty((0, 2), dtype=np.float64)
+        return np.array([(v.x(), v.y()) for v in vertices], dtype=np.float64)
+    
+    @property
+    def vertices(self) -> List[QPointF]:
+        """顶点列表（缓存对象，调用方不应原地修改，修改请使用 set_vertex/set_vertices）"""
+        if self._vertex_list is None:
+            self._vertex_list = [QPointF(x, y) for x, y in self._verts.tolist()]
+        return self._vertex_list
+    
+    @vertices.setter
+    def vertices(self, vertices: List[QPointF]):
+        self.set_vertices(vertices)
+    
+    @staticmethod
+    def _compute_closed(verts: np.ndarray) -> bool:
+        """判断首尾顶点是否重合"""
+        if len(verts) < 3:
+            return False
+        return bool((np.abs(verts[0] - verts[-1]) < 1e-6).all())
+    
+    def _on_vertices_changed(self):
+        """顶点数组变化后清理缓存"""
+        self._vertex_list = None
+        self._edges = None
+        self._closed_flag = self._compute_closed(self._verts)
+        self._invalidate_geometry_cache()
+    
     def _initialize_control_points(self):
         """初始化控制点 - 多边形每个顶点一个控制点"""
-        self.control_points = []
-        for i, vertex in enumerate(self.vertices):
-            from ..utils.constants import InteractionConstants
-            cp = ControlPoint(
+        self.control_points = ControlPointArray(
+            ControlPoint(
                 position=vertex,
                 control_type=ControlPointType.VERTEX,
                 index=i,
                 size=InteractionConstants.CONTROL_POINT_DEFAULT_SIZE
             )
-            self.control_points.append(cp)
+            for i, vertex in enumerate(self.vertices)
+        )
     
-    def get_bounds(self) -> QRectF:
-        """获取图形边界矩形"""
-        if not self.vertices:
+    def _calculate_bounds(self) -> QRectF:
+        """计算图形边界矩形"""
+        verts = self._verts
+        if not len(verts):
             return QRectF()
         
-        x_coords = [v.x() for v in self.vertices]
-        y_coords = [v.y() for v in self.vertices]
-        
-        min_x, max_x = min(x_coords), max(x_coords)
-        min_y, max_y = min(y_coords), max(y_coords)
+        min_x, min_y = verts.min(axis=0).tolist()
+        max_x, max_y = verts.max(axis=0).tolist()
         
         return QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
     
-    def get_center(self) -> QPointF:
-        """获取多边形重心"""
-        if not self.vertices:
+    def _refresh_geometry_cache(self) -> None:
+        """重新计算几何缓存，同时缓存边界的浮点坐标 (left, top, right, bottom) 供命中检测快速排除"""
+        super()._refresh_geometry_cache()
+        bounds = self._bounds_cache
+        self._bbox = (bounds.left(), bounds.top(), bounds.right(), bounds.bottom())
+    
+    def _translate_geometry_cache(self, offset: QPointF) -> None:
+        """纯平移时同步平移边界坐标"""
+        was_dirty = self._geometry_dirty
+        super()._translate_geometry_cache(offset)
+        if not was_dirty:
+            ox, oy = offset.x(), offset.y()
+            left, top, right, bottom = self._bbox
+            self._bbox = (left + ox, top + oy, right + ox, bottom + oy)
+    
+    def _outside_bbox(self, px: float, py: float, margin: float) -> bool:
+        """点是否在（外扩 margin 的）边界矩形之外"""
+        if self._geometry_dirty:
+            self._refresh_geometry_cache()
+        left, top, right, bottom = self._bbox
+        return px < left - margin or px > right + margin or py < top - margin or py > bottom + margin
+    
+    def _calculate_center(self) -> QPointF:
+        """计算多边形重心（顶点均值）"""
+        verts = self._verts
+        if not len(verts):
             return QPointF(0, 0)
         
-        x_sum = sum(v.x() for v in self.vertices)
-        y_sum = sum(v.y() for v in self.vertices)
-        n = len(self.vertices)
-        
-        return QPointF(x_sum / n, y_sum / n)
+        x, y = verts.mean(axis=0).tolist()
+        return QPointF(x, y)
     
     def get_vertices(self) -> List[QPointF]:
         """获取多边形顶点列表"""
-        return self.vertices.copy()
+        return list(self.vertices)
     
+    def get_vertex_array(self) -> np.ndarray:
+        """获取顶点数组（只读视图）"""
+        view = self._verts.view()
+        view.flags.writeable = False
+        return view
     
     def contains_point(self, point: QPointF, tolerance: float = None) -> bool:
         """检查点是否在图形内（射线法）"""
-        from ..utils.constants import InteractionConstants
         if tolerance is None:
             tolerance = InteractionConstants.SHAPE_DEFAULT_TOLERANCE
         
-        if len(self.vertices) < InteractionConstants.POLYGON_MIN_VERTICES:
+        verts = self._verts
+        if len(verts) < InteractionConstants.POLYGON_MIN_VERTICES:
             return False
         
-        x, y = point.x(), point.y()
-        n = len(self.vertices)
-        inside = False
-        
-        p1x, p1y = self.vertices[0].x(), self.vertices[0].y()
-        for i in range(1, n + 1):
-            p2x, p2y = self.vertices[i % n].x(), self.vertices[i % n].y()
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
+        # 边界矩形之外的点不可能在多边形内
+        px, py = point.x(), point.y()
+        if self._outside_bbox(px, py, 0.0):
+            return False
         
-        return inside
+        return point_in_polygon(verts, px, py)
     
+    def contains_points(self, pts: np.ndarray) -> np.ndarray:
+        """
+        批量检查多个点是否在图形内（射线法，向量化）
+        
+        Args:
+            pts: (m, 2) 点坐标数组
+        
+        Returns:
+            np.ndarray: (m,) 布尔数组
+        """
+        verts = self._verts
+        if len(verts) < InteractionConstants.POLYGON_MIN_VERTICES:
+            return np.zeros(len(pts), dtype=bool)
+        return points_in_polygon(verts, pts)
     
     def contains_point_on_boundary(self, point: QPointF, tolerance: float = None) -> bool:
         """检查点是否在多边形轮廓线上（仅轮廓线，不包括内部）"""
-        from ..utils.constants import InteractionConstants
         if tolerance is None:
             tolerance = InteractionConstants.SHAPE_DEFAULT_TOLERANCE
         
-        if len(self.vertices) < 2:
+        verts = self._verts
+        if len(verts) < 2:
             return False
         
-        x, y = point.x(), point.y()
-        n = len(self.vertices)
-        
-        # 检查是否在任何一条边上
-        for i in range(n):
-            p1 = self.vertices[i]
-            p2 = self.vertices[(i + 1) % n]
-            
-            # 计算点到线段的距离
-            from ..utils.geometry import GeometryUtils
-            if GeometryUtils.point_to_line_distance(point, p1, p2) <= tolerance:
-                return True
+        # 轮廓位于边界矩形内，距边界矩形超过容差的点不可能命中轮廓
+        px, py = point.x(), point.y()
+        if self._outside_bbox(px, py, tolerance):
+            return False
         
-        return False
-    
+        edges = None
+        if not HAS_NUMBA:
+            edges = self._edges
+            if edges is None:
+                edges = self._edges = polygon_edges(verts)
+        return boundary_distance_sq(verts, px, py, edges) <= tolerance * tolerance
     
     def move_by(self, offset: QPointF):
         """移动图形"""
-        for i, vertex in enumerate(self.vertices):
-            self.vertices[i] = QPointF(
-                vertex.x() + offset.x(),
-                vertex.y() + offset.y()
-            )
+        self._verts += (offset.x(), offset.y())
+        self._vertex_list = None
+        self._translate_geometry_cache(offset)
         
-        # 更新控制点位置
-        self.update_control_points()
+        # 控制点延迟到下次访问时更新
+        self._mark_control_points_dirty()
     
     def scale_by_control_point(self, control_point: ControlPoint, new_position: QPointF):
         """通过控制点缩放图形"""
-        if 0 <= control_point.index < len(self.vertices):
-            self.vertices[control_point.index] = new_position
-            # 更新控制点位置
-            self.update_control_points()
+        index = control_point.index
+        if 0 <= index < len(self._verts):
+            x, y = new_position.x(), new_position.y()
+            self._verts[index] = (x, y)
+            self._on_vertices_changed()
+            # 只有该顶点移动，只更新对应的控制点（无需为全部顶点重建QPointF）
+            control_points = self.control_points
+            if control_points is not None and not self._cp_dirty:
+                control_points[index].set_position(QPointF(x, y))
     
     def update_control_points(self):
         """更新控制点位置"""
+        control_points = self.control_points
+        if control_points is None:
+            return  # 尚未创建，创建时即为最新位置
+        count = len(self._verts)
+        
         # 确保控制点数量与顶点数量一致
-        while len(self.control_points) < len(self.vertices):
+        while len(control_points) < count:
             cp = ControlPoint(
                 position=QPointF(0, 0),
                 control_type=ControlPointType.VERTEX,
-                index=len(self.control_points),
+                index=len(control_points),
                 size=8.0
             )
-            self.control_points.append(cp)
+            control_points.append(cp)
         
         # 移除多余的控制点
-        while len(self.control_points) > len(self.vertices):
-            self.control_points.pop()
+        while len(control_points) > count:
+            control_points.pop()
         
-        # 更新控制点位置
-        for i, vertex in enumerate(self.vertices):
-            if i < len(self.control_points):
-                self.control_points[i].set_position(vertex)
+        # 更新控制点位置（两者数量已一致）
+        for cp, vertex in zip(control_points, self.vertices):
+            cp.set_position(vertex)
     
     def add_vertex(self, vertex: QPointF, index: int = -1):
         """添加顶点"""
+        row = (vertex.x(), vertex.y())
         if index == -1:
-            self.vertices.append(vertex)
-        else:
-            self.vertices.insert(index, vertex)
+            index = len(self._verts)
+        self._verts = np.insert(self._verts, index, row, axis=0)
+        self._on_vertices_changed()
         
-        # 重新初始化控制点
-        self._initialize_control_points()
+        # 顶点数变化，控制点在下次访问时重新创建
+        self._reset_control_points()
     
     def remove_vertex(self, index: int):
         """移除顶点"""
-        if 0 <= index < len(self.vertices):
-            self.vertices.pop(index)
-            # 重新初始化控制点
-            self._initialize_control_points()
+        if 0 <= index < len(self._verts):
+            self._verts = np.delete(self._verts, index, axis=0)
+            self._on_vertices_changed()
+            # 顶点数变化，控制点在下次访问时重新创建
+            self._reset_control_points()
     
     def get_vertex(self, index: int) -> QPointF:
         """获取顶点"""
-        if 0 <= index < len(self.vertices):
+        if 0 <= index < len(self._verts):
             return self.vertices[index]
         return QPointF(0, 0)
     
     def set_vertex(self, index: int, vertex: QPointF):
         """设置顶点"""
-        if 0 <= index < len(self.vertices):
-            self.vertices[index] = vertex
+        if 0 <= index < len(self._verts):
+            self._verts[index] = (vertex.x(), vertex.y())
+            self._on_vertices_changed()
             # 更新控制点位置
             self.update_control_points()
     
+    def set_vertices(self, vertices: List[QPointF]):
+        """整体替换顶点列表"""
+        self._verts = self._to_array(vertices)
+        self._on_vertices_changed()
+        self.update_control_points()
+    
     def get_vertex_count(self) -> int:
         """获取顶点数量"""
-        return len(self.vertices)
+        return len(self._verts)
     
     def is_closed(self) -> bool:
-        """检查多边形是否闭合"""
-        if len(self.vertices) < 3:
-            return False
-        
-        # 检查第一个和最后一个顶点是否相同
-        first = self.vertices[0]
-        last = self.vertices[-1]
-        return abs(first.x() - last.x()) < 1e-6 and abs(first.y() - last.y()) < 1e-6
+        """检查多边形是否闭合（首尾顶点重合，由顶点变化时维护）"""
+        return self._closed_flag
     
     def close_polygon(self):
         """闭合多边形"""
-        if len(self.vertices) >= InteractionConstants.POLYGON_MIN_VERTICES and not self.is_closed():
-            self.vertices.append(self.vertices[0])
-            self._initialize_control_points()
+        if len(self._verts) >= InteractionConstants.POLYGON_MIN_VERTICES and not self.is_closed():
+            self._verts = np.vstack((self._verts, self._verts[:1]))
+            self._on_vertices_changed()
+            self._reset_control_points()
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式，用于序列化"""
         base_dict = super().to_dict()
         base_dict.update({
-            'vertices': [(v.x(), v.y()) for v in self.vertices]
+            'vertices': [tuple(v) for v in self._verts.tolist()]
         })
         return base_dict
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PolygonShape':
         """从字典创建实例，用于反序列化"""
-        vertices = [QPointF(v[0], v[1]) for v in data.get('vertices', [])]
-        color = DrawColor(data.get('color', DrawColor.RED.value))
-        pen_width = PenWidth(data.get('pen_width', PenWidth.MEDIUM.value))
+        vertices_data = data.get('vertices', ())
+        if isinstance(vertices_data, str):
+            # base64 压缩格式（见 DataManager.export_data(compact=True)）
+            vertices = unpack_points(vertices_data)
+        else:
+            # JSON 中的 [[x, y], ...] 一次转换为坐标数组，不逐个构造 QPointF
+            vertices = np.asarray(vertices_data, dtype=np.float64).reshape(-1, 2)
+        color = DRAW_COLOR_BY_VALUE[data.get('color', DrawColor.RED.value)]
+        pen_width = PEN_WIDTH_BY_VALUE[data.get('pen_width', PenWidth.MEDIUM.value)]
         z_order = data.get('z_order', None)
         
-        return cls(vertices, color, pen_width, z_order)
+        shape = cls(vertices, color, pen_width, z_order)
+        shape._restore_shape_id(data)
+        return shape
     
     def __str__(self) -> str:
-        return f"PolygonShape(vertices={len(self.vertices)}, closed={self.is_closed()})"
+        return f"PolygonShape(vertices={len(self._verts)}, closed={self.is_closed()})"
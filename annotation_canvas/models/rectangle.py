@@ -6,13 +6,17 @@
 
 from typing import List, Dict, Any, Tuple
 from PySide6.QtCore import QPointF, QRectF
-from ..core.enums import DrawType, DrawColor, PenWidth, ControlPointType
+from ..core.enums import DrawType, DrawColor, PenWidth, ControlPointType, DRAW_COLOR_BY_VALUE, PEN_WIDTH_BY_VALUE
+from ..utils.constants import InteractionConstants
 from .shape import BaseShape
 from .control_point import ControlPoint
+from .control_point_array import ControlPointArray
 
 class RectangleShape(BaseShape):
     """矩形图形类"""
     
+    __slots__ = ('start_point', 'end_point')
+    
     def __init__(self, start_point: QPointF, end_point: QPointF, 
                  color: DrawColor = DrawColor.RED, pen_width: PenWidth = PenWidth.MEDIUM, z_order: int = None):
         self.start_point = start_point
@@ -37,20 +41,19 @@ class RectangleShape(BaseShape):
             size=8.0
         )
         
-        self.control_points = [top_left_cp, bottom_right_cp]
-    
-    def get_bounds(self) -> QRectF:
-        """获取图形边界矩形"""
-        min_x = min(self.start_point.x(), self.end_point.x())
-        min_y = min(self.start_point.y(), self.end_point.y())
-        max_x = max(self.start_point.x(), self.end_point.x())
-        max_y = max(self.start_point.y(), self.end_point.y())
+        self.control_points = ControlPointArray((top_left_cp, bottom_right_cp))
+    
+    def _calculate_bounds(self) -> QRectF:
+        """计算图形边界矩形"""
+        sx, sy = self.start_point.x(), self.start_point.y()
+        ex, ey = self.end_point.x(), self.end_point.y()
+        min_x, max_x = (sx, ex) if sx < ex else (ex, sx)
+        min_y, max_y = (sy, ey) if sy < ey else (ey, sy)
         
         return QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
     
     def contains_point(self, point: QPointF, tolerance: float = None) -> bool:
         """检查点是否在图形内"""
-        from ..utils.constants import InteractionConstants
         if tolerance is None:
             tolerance = InteractionConstants.SHAPE_DEFAULT_TOLERANCE
             
@@ -59,9 +62,9 @@ class RectangleShape(BaseShape):
         # 如果矩形太小，使用圆形检测
         if bounds.width() < tolerance * 2 and bounds.height() < tolerance * 2:
             center = bounds.center()
-            from ..utils.geometry import GeometryUtils
-            distance = GeometryUtils.distance_between_points(point, center)
-            return distance <= tolerance
+            dx = point.x() - center.x()
+            dy = point.y() - center.y()
+            return dx * dx + dy * dy <= tolerance * tolerance
         
         # 对于正常大小的矩形，检查是否在边界内（考虑容差）
         return bounds.contains(point) or self._is_point_near_boundary(point, bounds, tolerance)
@@ -88,7 +91,6 @@ class RectangleShape(BaseShape):
     
     def contains_point_on_boundary(self, point: QPointF, tolerance: float = None) -> bool:
         """检查点是否在图形轮廓线上（仅轮廓线，不包括内部）"""
-        from ..utils.constants import InteractionConstants
         if tolerance is None:
             tolerance = InteractionConstants.SHAPE_DEFAULT_TOLERANCE
             
@@ -97,9 +99,9 @@ class RectangleShape(BaseShape):
         # 如果矩形太小，使用圆形检测
         if bounds.width() < tolerance * 2 and bounds.height() < tolerance * 2:
             center = bounds.center()
-            from ..utils.geometry import GeometryUtils
-            distance = GeometryUtils.distance_between_points(point, center)
-            return distance <= tolerance
+            dx = point.x() - center.x()
+            dy = point.y() - center.y()
+            return dx * dx + dy * dy <= tolerance * tolerance
         
         # 检查是否在矩形边界附近，但不在内部
         left = bounds.left()
@@ -121,16 +123,12 @@ class RectangleShape(BaseShape):
     
     def move_by(self, offset: QPointF):
         """移动图形"""
-        self.start_point = QPointF(
-            self.start_point.x() + offset.x(),
-            self.start_point.y() + offset.y()
-        )
-        self.end_point = QPointF(
-            self.end_point.x() + offset.x(),
-            self.end_point.y() + offset.y()
-        )
-        # 更新控制点位置
-        self.update_control_points()
+        # 端点对象可能被操作记录（如缩放撤销）引用，不原地修改，用一次 Qt 加法生成新点
+        self.start_point = self.start_point + offset
+        self.end_point = self.end_point + offset
+        self._translate_geometry_cache(offset)
+        # 控制点延迟到下次访问时更新
+        self._mark_control_points_dirty()
     
     def scale_by_control_point(self, control_point: ControlPoint, new_position: QPointF):
         """通过控制点缩放图形"""
@@ -141,11 +139,14 @@ class RectangleShape(BaseShape):
             # 保持左上角不变，移动右下角
             self.end_point = new_position
         
+        self._invalidate_geometry_cache()
         # 更新控制点位置
         self.update_control_points()
     
     def update_control_points(self):
         """更新控制点位置"""
+        if self.control_points is None:
+            return  # 尚未创建，创建时即为最新位置
         self.control_points[0].set_position(self.start_point)
         self.control_points[1].set_position(self.end_point)
     
@@ -160,11 +161,13 @@ class RectangleShape(BaseShape):
     def set_start_point(self, point: QPointF):
         """设置起始点"""
         self.start_point = point
+        self._invalidate_geometry_cache()
         self.update_control_points()
     
     def set_end_point(self, point: QPointF):
         """设置结束点"""
         self.end_point = point
+        self._invalidate_geometry_cache()
         self.update_control_points()
     
     def get_width(self) -> float:
@@ -175,9 +178,9 @@ class RectangleShape(BaseShape):
         """获取高度"""
         return abs(self.end_point.y() - self.start_point.y())
     
-    def get_center(self) -> QPointF:
-        """获取中心点"""
-        bounds = self.get_bounds()
+    def _calculate_center(self) -> QPointF:
+        """计算中心点"""
+        bounds = self._bounds_cache
         return QPointF(
             bounds.x() + bounds.width() / 2,
             bounds.y() + bounds.height() / 2
@@ -198,11 +201,13 @@ class RectangleShape(BaseShape):
         """从字典创建实例，用于反序列化"""
         start_point = QPointF(data['start_point'][0], data['start_point'][1])
         end_point = QPointF(data['end_point'][0], data['end_point'][1])
-        color = DrawColor(data.get('color', DrawColor.RED.value))
-        pen_width = PenWidth(data.get('pen_width', PenWidth.MEDIUM.value))
+        color = DRAW_COLOR_BY_VALUE[data.get('color', DrawColor.RED.value)]
+        pen_width = PEN_WIDTH_BY_VALUE[data.get('pen_width', PenWidth.MEDIUM.value)]
         z_order = data.get('z_order', None)
         
-        return cls(start_point, end_point, color, pen_width, z_order)
+        shape = cls(start_point, end_point, color, pen_width, z_order)
+        shape._restore_shape_id(data)
+        return shape
     
     def __str__(self) -> str:
         return f"RectangleShape(start=({self.start_point.x():.1f}, {self.start_point.y():.1f}), " \
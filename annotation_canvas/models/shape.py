@@ -3,33 +3,93 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
 from PySide6.QtCore import QPointF, QRectF
 from ..core.enums import DrawType, DrawColor, PenWidth, ControlPointType
 from .control_point import ControlPoint
-from ..utils.constants import ZAxisConstants
+from .control_point_array import ControlPointArray
+from ..utils.constants import ZAxisConstants, InteractionConstants
+from ..utils.z_axis_utils import validate_z_order
+
+# 颜色 -> RGB、线宽 -> 数值（模块级常量，查询时不再每次构造映射表）
+_COLOR_RGB = {
+    DrawColor.RED: (255, 0, 0),
+    DrawColor.GREEN: (0, 255, 0),
+    DrawColor.BLUE: (0, 0, 255),
+    DrawColor.YELLOW: (255, 255, 0),
+    DrawColor.PURPLE: (128, 0, 128),
+    DrawColor.ORANGE: (255, 165, 0),
+    DrawColor.BLACK: (0, 0, 0),
+    DrawColor.WHITE: (255, 255, 255),
+}
+_DEFAULT_RGB = (255, 0, 0)
+
+_LINE_WIDTH = {
+    PenWidth.THIN: 1,
+    PenWidth.MEDIUM: 2,
+    PenWidth.THICK: 3,
+    PenWidth.ULTRA_THIN: 0.5,
+    PenWidth.ULTRA_THICK: 5,
+}
+_DEFAULT_LINE_WIDTH = 2
+
+# 已分配的最大图形编号（新图形在此基础上递增；加载带编号的图形时推进到其编号之后）
+_last_shape_id = 0
+
+
+def next_shape_id() -> int:
+    """分配新的图形编号"""
+    global _last_shape_id
+    _last_shape_id += 1
+    return _last_shape_id
+
+
+def reserve_shape_id(shape_id: int) -> None:
+    """登记已使用的图形编号，之后新分配的编号都大于它"""
+    global _last_shape_id
+    if shape_id > _last_shape_id:
+        _last_shape_id = shape_id
 
 class BaseShape(ABC):
     """图形基类"""
     
+    # 固定实例属性，避免每个实例携带 __dict__（保留 __weakref__，外部仍可弱引用图形）
+    __slots__ = (
+        'shape_id', 'shape_type', 'type_id', 'color', 'pen_width', 'visible', 'selected', 'hovered',
+        'control_points', 'graphics_item', 'metadata', 'z_order',
+        '_bounds_cache', '_center_cache', '_geometry_dirty', '_geometry_version', '_cp_dirty',
+        '_store', '_store_index', '__weakref__',
+    )
+    
     def __init__(self, shape_type: DrawType, color: DrawColor = DrawColor.RED, 
                  pen_width: PenWidth = PenWidth.MEDIUM, z_order: int = None):
+        self.shape_id = next_shape_id()  # 图形编号（随图形序列化，操作序列化时以编号引用图形）
         self.shape_type = shape_type
+        self.type_id = int(shape_type)  # 原始整数类型，供热路径分派使用
         self.color = color
         self.pen_width = pen_width
         self.visible = True
         self.selected = False
         self.hovered = False
-        self.control_points: List[ControlPoint] = []
+        self.control_points: Optional[ControlPointArray] = None  # 控制点（首次访问时创建）
         self.graphics_item = None  # PyQtGraph图形项引用
         self.metadata: Dict[str, Any] = {}  # 额外数据存储
         
+        # 几何缓存（边界矩形、中心点），几何变化时置脏
+        self._bounds_cache: Optional[QRectF] = None
+        self._center_cache: Optional[QPointF] = None
+        self._geometry_dirty = True
+        self._geometry_version = 0  # 几何版本号，每次几何变化递增（供渲染层判断是否需要重建数据）
+        self._cp_dirty = True  # 控制点尚未创建或尚未同步（访问控制点时再处理）
+        
+        # 所属SoA存储及行号（由ShapeStore维护）
+        self._store = None
+        self._store_index = -1
+        
         # Z轴层级管理
         self.z_order = z_order if z_order is not None else ZAxisConstants.DEFAULT_Z_ORDER
         self._validate_z_order()
-        
-        # 初始化控制点
-        self._initialize_control_points()
     
     @abstractmethod
     def _initialize_control_points(self):
@@ -37,10 +97,47 @@ class BaseShape(ABC):
         pass
     
     @abstractmethod
-    def get_bounds(self) -> QRectF:
-        """获取图形边界矩形 - 子类必须实现"""
+    def _calculate_bounds(self) -> QRectF:
+        """计算图形边界矩形 - 子类必须实现"""
         pass
     
+    def get_bounds(self) -> QRectF:
+        """
+        获取图形边界矩形（带缓存）
+        
+        Note:
+            返回的是缓存对象，调用方不应原地修改
+        """
+        if self._geometry_dirty:
+            self._refresh_geometry_cache()
+        return self._bounds_cache
+    
+    def get_geometry_version(self) -> int:
+        """获取几何版本号"""
+        return self._geometry_version
+    
+    def _refresh_geometry_cache(self) -> None:
+        """重新计算几何缓存"""
+        self._bounds_cache = self._calculate_bounds()
+        self._center_cache = self._calculate_center()
+        self._geometry_dirty = False
+    
+    def _invalidate_geometry_cache(self) -> None:
+        """几何数据变化后使缓存失效"""
+        self._geometry_dirty = True
+        self._geometry_version += 1
+        if self._store is not None:
+            self._store.mark_dirty(self._store_index)
+    
+    def _translate_geometry_cache(self, offset: QPointF) -> None:
+        """纯平移时直接平移缓存，避免重新计算"""
+        self._geometry_version += 1
+        if not self._geometry_dirty:
+            self._bounds_cache = self._bounds_cache.translated(offset)
+            self._center_cache = self._center_cache + offset
+        if self._store is not None:
+            self._store.mark_dirty(self._store_index)
+    
     @abstractmethod
     def contains_point(self, point: QPointF, tolerance: float = None) -> bool:
         """检查点是否在图形内 - 子类必须实现"""
@@ -58,39 +155,97 @@ class BaseShape(ABC):
         pass
     
     @abstractmethod
-    def get_center(self) -> QPointF:
-        """获取图形中心点 - 子类必须实现"""
+    def _calculate_center(self) -> QPointF:
+        """计算图形中心点 - 子类必须实现"""
         pass
     
+    def get_center(self) -> QPointF:
+        """获取图形中心点（带缓存，调用方不应原地修改）"""
+        if self._geometry_dirty:
+            self._refresh_geometry_cache()
+        return self._center_cache
+    
     def set_center(self, center: QPointF) -> None:
         """设置图形中心点（通用实现）"""
         current_center = self.get_center()
         offset = center - current_center
         self.move_by(offset)
     
-    def get_control_points(self) -> List[ControlPoint]:
-        """获取控制点列表"""
+    def _mark_control_points_dirty(self) -> None:
+        """
+        标记控制点待同步
+        
+        控制点只在图形被选中时显示和命中检测，批量平移未选中的图形时
+        不逐个更新控制点，由下次访问控制点时统一同步
+        """
+        self._cp_dirty = True
+    
+    def _reset_control_points(self) -> None:
+        """丢弃控制点（如顶点数变化），下次访问时按当前几何重新创建"""
+        self.control_points = None
+        self._cp_dirty = True
+    
+    def _sync_control_points(self) -> None:
+        """
+        创建或同步控制点
+        
+        控制点在首次访问时才创建（导入的大量图形多数从未被选中），
+        创建时即为当前位置，无需再同步
+        """
+        if self._cp_dirty:
+            self._cp_dirty = False
+            if self.control_points is None:
+                self._initialize_control_points()
+            else:
+                self.update_control_points()
+    
+    def get_control_points(self) -> ControlPointArray:
+        """获取控制点（可按下标访问和迭代）"""
+        if self._cp_dirty:
+            self._sync_control_points()
         return self.control_points
     
+    def get_control_point_positions(self) -> np.ndarray:
+        """
+        获取控制点坐标数组 (k, 2)
+        
+        Note:
+            返回的是控制点存储的内部数组视图，调用方不应原地修改
+        """
+        if self._cp_dirty:
+            self._sync_control_points()
+        return self.control_points.positions
+    
+    def find_control_point(self, position: QPointF, tolerance: float) -> Optional[ControlPoint]:
+        """
+        查找距离指定位置最近且在容差内的控制点
+        
+        Args:
+            position: 查询位置（世界坐标）
+            tolerance: 距离容差（世界坐标）
+        """
+        index = ControlPoint.find_containing(
+            self.get_control_point_positions(), position.x(), position.y(), tolerance
+        )
+        return self.control_points[index] if index >= 0 else None
+    
     def get_control_point_at_position(self, position: QPointF, tolerance: float = None) -> Optional[ControlPoint]:
         """获取指定位置的控制点"""
-        from ..utils.constants import InteractionConstants
         if tolerance is None:
             tolerance = InteractionConstants.CONTROL_POINT_TOLERANCE
-            
-        for cp in self.control_points:
-            if cp.contains_point(position, tolerance):
-                return cp
-        return None
+        
+        return self.find_control_point(position, tolerance)
     
     def update_control_points(self):
-        """更新控制点位置 - 子类可以重写"""
+        """更新控制点位置 - 子类可以重写（控制点尚未创建时应直接返回）"""
         pass
     
     def set_selected(self, selected: bool):
         """设置选中状态"""
         self.selected = selected
-        for cp in self.control_points:
+        if not selected and self.control_points is None:
+            return  # 从未创建过控制点，无需为取消选中而创建
+        for cp in self.get_control_points():
             cp.set_visible(selected)
     
     def is_selected(self) -> bool:
@@ -131,7 +286,6 @@ class BaseShape(ABC):
     
     def _validate_z_order(self) -> None:
         """验证并修正z轴层级值"""
-        from ..utils.z_axis_utils import validate_z_order
         self.z_order = validate_z_order(self.z_order)
     
     def set_z_order(self, z_order: int) -> None:
@@ -160,46 +314,38 @@ class BaseShape(ABC):
             使用ZAxisManager统一处理Z轴设置
         """
         if self.graphics_item is not None:
-            from ..render import ZAxisManager
+            from ..render import ZAxisManager  # render 依赖 models，只能延迟导入（仅在设置层级时执行）
             ZAxisManager.set_z_order(self.graphics_item, self.z_order)
     
     def get_color_rgb(self) -> Tuple[int, int, int]:
         """获取颜色RGB值"""
-        color_map = {
-            DrawColor.RED: (255, 0, 0),
-            DrawColor.GREEN: (0, 255, 0),
-            DrawColor.BLUE: (0, 0, 255),
-            DrawColor.YELLOW: (255, 255, 0),
-            DrawColor.PURPLE: (128, 0, 128),
-            DrawColor.ORANGE: (255, 165, 0),
-            DrawColor.BLACK: (0, 0, 0),
-            DrawColor.WHITE: (255, 255, 255),
-        }
-        return color_map.get(self.color, (255, 0, 0))
+        return _COLOR_RGB.get(self.color, _DEFAULT_RGB)
     
     def get_line_width(self) -> int:
         """获取线宽数值"""
-        width_map = {
-            PenWidth.THIN: 1,
-            PenWidth.MEDIUM: 2,
-            PenWidth.THICK: 3,
-            PenWidth.ULTRA_THIN: 0.5,
-            PenWidth.ULTRA_THICK: 5,
-        }
-        return width_map.get(self.pen_width, 2)
+        return _LINE_WIDTH.get(self.pen_width, _DEFAULT_LINE_WIDTH)
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式，用于序列化"""
+        # 枚举均为 IntEnum，int() 走C层转换，比 .value 描述符访问快；类型值已缓存在 type_id
         return {
-            'shape_type': self.shape_type.value,
-            'color': self.color.value,
-            'pen_width': self.pen_width.value,
+            'id': self.shape_id,
+            'shape_type': self.type_id,
+            'color': int(self.color),
+            'pen_width': int(self.pen_width),
             'visible': self.visible,
             'selected': self.selected,
             'z_order': self.z_order,
             'metadata': self.metadata,
         }
     
+    def _restore_shape_id(self, data: Dict[str, Any]) -> None:
+        """沿用序列化数据中的图形编号（没有编号的旧数据保留新分配的编号）"""
+        shape_id = data.get('id')
+        if isinstance(shape_id, int) and shape_id > 0:
+            self.shape_id = shape_id
+            reserve_shape_id(shape_id)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BaseShape':
         """从字典创建实例，用于反序列化"""
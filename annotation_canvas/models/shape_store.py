@@ -0,0 +1,183 @@
+# This Python file uses the following encoding: utf-8
+
+"""
+图形SoA存储 - 以并行数组保存图形边界与样式，用于批量命中检测与视口裁剪
+"""
+
+from typing import List, Set, Callable, Optional
+
+import numpy as np
+
+from .shape import BaseShape
+
+
+class ShapeStore:
+    """
+    图形SoA存储
+
+    每行对应一个图形，行顺序与添加顺序一致（即绘制层叠顺序）。
+    图形通过 _store/_store_index 反向引用所在行，几何变化时只标记该行为脏，
+    查询前再批量同步，避免每次查询都遍历全部Python对象。
+
+    边界以 float32 存储，写入时向外取整，
+    保证存储的边界始终包含真实边界，查询结果只会多出候选、不会遗漏。
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self, on_sync: Optional[Callable[[BaseShape], None]] = None):
+        """
+        初始化存储
+        
+        Args:
+            on_sync: 脏行同步后的回调（供空间索引等增量更新）
+        """
+        self._shapes: List[BaseShape] = []
+        self._on_sync = on_sync
+        self._dirty_rows: Set[int] = set()
+        self._capacity = 0
+        self._allocate(self._INITIAL_CAPACITY)
+
+    def _allocate(self, capacity: int) -> None:
+        """分配（或扩容）并行数组"""
+        count = len(self._shapes)
+
+        def grow(old, dtype):
+            new = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                new[:count] = old[:count]
+            return new
+
+        self.xs = grow(getattr(self, 'xs', None), np.float32)
+        self.ys = grow(getattr(self, 'ys', None), np.float32)
+        self.x2s = grow(getattr(self, 'x2s', None), np.float32)
+        self.y2s = grow(getattr(self, 'y2s', None), np.float32)
+        self.types = grow(getattr(self, 'types', None), np.uint8)
+        self.colors = grow(getattr(self, 'colors', None), np.uint8)
+        self.widths = grow(getattr(self, 'widths', None), np.uint8)
+        self._capacity = capacity
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def get_shapes(self) -> List[BaseShape]:
+        """获取按行顺序排列的图形列表（内部列表，调用方不应修改）"""
+        return self._shapes
+
+    def add(self, shape: BaseShape) -> None:
+        """追加图形到末尾"""
+        row = len(self._shapes)
+        if row >= self._capacity:
+            self._allocate(self._capacity * 2)
+
+        self._shapes.append(shape)
+        shape._store = self
+        shape._store_index = row
+        self.types[row] = shape.shape_type
+        self.colors[row] = shape.color
+        self.widths[row] = shape.pen_width
+        self._write_bounds(row)
+
+    def remove(self, shape: BaseShape) -> bool:
+        """移除图形，后续行整体前移以保持层叠顺序"""
+        if shape._store is not self:
+            return False
+
+        row = shape._store_index
+        count = len(self._shapes)
+        for array in (self.xs, self.ys, self.x2s, self.y2s, self.types, self.colors, self.widths):
+            array[row:count - 1] = array[row + 1:count]
+
+        del self._shapes[row]
+        for i in range(row, count - 1):
+            self._shapes[i]._store_index = i
+
+        # 脏行索引同样前移
+        self._dirty_rows = {i if i < row else i - 1 for i in self._dirty_rows if i != row}
+
+        shape._store = None
+        shape._store_index = -1
+        return True
+
+    def clear(self) -> None:
+        """清空存储"""
+        for shape in self._shapes:
+            shape._store = None
+            shape._store_index = -1
+        self._shapes.clear()
+        self._dirty_rows.clear()
+
+    def mark_dirty(self, row: int) -> None:
+        """标记某行几何数据已过期"""
+        self._dirty_rows.add(row)
+
+    def sync(self) -> None:
+        """将脏行的边界数据同步到数组"""
+        if not self._dirty_rows:
+            return
+        on_sync = self._on_sync
+        for row in self._dirty_rows:
+            self._write_bounds(row)
+            if on_sync is not None:
+                on_sync(self._shapes[row])
+        self._dirty_rows.clear()
+
+    def _write_bounds(self, row: int) -> None:
+        """写入单行边界（向外取整量化）"""
+        bounds = self._shapes[row].get_bounds()
+        x0, y0, x1, y1 = bounds.left(), bounds.top(), bounds.right(), bounds.bottom()
+        self.xs[row] = self._round_down(x0)
+        self.ys[row] = self._round_down(y0)
+        self.x2s[row] = self._round_up(x1)
+        self.y2s[row] = self._round_up(y1)
+
+    @staticmethod
+    def _round_down(value: float) -> np.float32:
+        """取不大于 value 的最近 float32"""
+        result = np.float32(value)
+        if result > value:
+            result = np.nextafter(result, np.float32(-np.inf))
+        return result
+
+    @staticmethod
+    def _round_up(value: float) -> np.float32:
+        """取不小于 value 的最近 float32"""
+        result = np.float32(value)
+        if result < value:
+            result = np.nextafter(result, np.float32(np.inf))
+        return result
+
+    def query_rect_mask(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """
+        计算每行边界是否与矩形相交
+
+        Args:
+            x0, y0, x1, y1: 查询矩形（x0<=x1, y0<=y1）
+
+        Returns:
+            长度为图形数量的布尔数组
+        """
+        self.sync()
+        n = len(self._shapes)
+        return (self.x2s[:n] >= x0) & (self.xs[:n] <= x1) & (self.y2s[:n] >= y0) & (self.ys[:n] <= y1)
+
+    def query_rect_indices(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """
+        查询边界与矩形相交的行号（升序，即从底层到顶层）
+
+        Args:
+            x0, y0, x1, y1: 查询矩形（x0<=x1, y0<=y1）
+
+        Returns:
+            行号数组
+        """
+        return np.flatnonzero(self.query_rect_mask(x0, y0, x1, y1))
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> List[BaseShape]:
+        """查询边界与矩形相交的图形（按层叠顺序）"""
+        shapes = self._shapes
+        return [shapes[i] for i in self.query_rect_indices(x0, y0, x1, y1)]
+
+    def query_point(self, x: float, y: float, tolerance: float = 0.0) -> List[BaseShape]:
+        """查询边界（含容差）包含指定点的候选图形（按层叠顺序）"""
+        return self.query_rect(x - tolerance, y - tolerance, x + tolerance, y + tolerance)
@@ -0,0 +1,76 @@
+# This Python file uses the following encoding: utf-8
+
+"""
+操作历史编解码 - 历史文件的二进制格式
+
+安装 msgpack 时以 MessagePack 保存操作历史（比缩进 JSON 体积更小、解析更快），
+文件以魔数开头；未安装时退回 JSON。读取时按文件头识别格式，旧版 JSON 文件仍可加载。
+"""
+
+from typing import Any
+
+import numpy as np
+
+from ..utils.serialization import dumps as json_dumps, loads as json_loads
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    msgpack = None
+    HAS_MSGPACK = False
+
+# MessagePack 历史文件的文件头（魔数 + 格式版本）
+MAGIC = b'ACOP\x01'
+
+
+def _default(obj: Any) -> Any:
+    """msgpack 无法直接编码的对象：枚举转为整数，坐标数组转为扁平列表"""
+    if isinstance(obj, np.ndarray):
+        return obj.ravel().tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if hasattr(obj, 'x') and hasattr(obj, 'y'):
+        return [obj.x(), obj.y()]  # QPointF
+    raise TypeError(f"无法编码的类型: {type(obj).__name__}")
+
+
+def encode(data: Any) -> bytes:
+    """
+    编码操作历史数据
+    
+    Args:
+        data: 操作历史字典（OperationManager.to_dict 的结果）
+    
+    Returns:
+        安装 msgpack 时为带文件头的 MessagePack 字节串，否则为 JSON 字节串
+    """
+    if HAS_MSGPACK:
+        return MAGIC + msgpack.packb(data, use_bin_type=True, default=_default)
+    return json_dumps(data)
+
+
+def decode(raw: bytes) -> Any:
+    """
+    解码操作历史数据（按文件头区分 MessagePack 与旧版 JSON）
+    
+    Raises:
+        ValueError: 数据为 MessagePack 格式但未安装 msgpack
+    """
+    if raw.startswith(MAGIC):
+        if not HAS_MSGPACK:
+            raise ValueError("历史文件为 MessagePack 格式，需要安装 msgpack")
+        return msgpack.unpackb(memoryview(raw)[len(MAGIC):], raw=False, strict_map_key=False)
+    return json_loads(raw)
+
+
+def save_file(file_path: str, data: Any) -> None:
+    """将操作历史数据写入文件"""
+    with open(file_path, 'wb') as f:
+        f.write(encode(data))
+
+
+def load_file(file_path: str) -> Any:
+    """从文件读取操作历史数据"""
+    with open(file_path, 'rb') as f:
+        return decode(f.read())
@@ -3,15 +3,25 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
-from PySide6.QtCore import QPointF
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from PySide6.QtCore import QPointF, QRectF
 
 class BaseOperation(ABC):
     """操作基类"""
     
-    def __init__(self, description: str = ""):
-        self.description = description
+    def __init__(self, description: Union[str, Callable[[], str]] = ""):
+        """
+        Args:
+            description: 操作描述，或首次读取描述时才调用的生成函数（避免格式化无人读取的描述）
+        """
+        if callable(description):
+            self._description: Optional[str] = None
+            self._description_factory: Optional[Callable[[], str]] = description
+        else:
+            self._description = description
+            self._description_factory = None
         self.timestamp = None
+        self.dirty_rect: Optional[QRectF] = None  # 最近一次执行/撤销影响的区域
     
     @abstractmethod
     def execute(self) -> bool:
@@ -36,6 +46,34 @@ class BaseOperation(ABC):
         """检查是否可以重做"""
         return True
     
+    @property
+    def description(self) -> str:
+        """操作描述（由生成函数提供时在首次读取时生成并缓存）"""
+        description = self._description
+        if description is None:
+            description = self._description = self._description_factory() or ""
+            self._description_factory = None
+        return description
+    
+    @description.setter
+    def description(self, description: str) -> None:
+        self._description = description
+        self._description_factory = None
+    
+    def merge(self, other: 'BaseOperation') -> bool:
+        """
+        尝试把紧随其后执行的操作合并到本操作中
+        
+        合并后撤销本操作即撤销两者，other 不再进入历史记录；默认不合并
+        
+        Args:
+            other: 刚执行成功的操作
+            
+        Returns:
+            是否已合并
+        """
+        return False
+    
     def get_description(self) -> str:
         """获取操作描述"""
         return self.description
@@ -44,6 +82,25 @@ class BaseOperation(ABC):
         """设置操作描述"""
         self.description = description
     
+    def get_dirty_rect(self) -> Optional[QRectF]:
+        """获取最近一次执行/撤销影响的区域（旧边界∪新边界），None表示未知"""
+        return self.dirty_rect
+    
+    @staticmethod
+    def _united_bounds(shapes: List[Any]) -> QRectF:
+        """计算多个图形边界的并集"""
+        rect = QRectF()
+        for shape in shapes:
+            rect = rect.united(shape.get_bounds())
+        return rect
+    
+    @staticmethod
+    def _united_rects(a: Optional[QRectF], b: Optional[QRectF]) -> Optional[QRectF]:
+        """合并两个影响区域（任一未知则结果未知）"""
+        if a is None or b is None:
+            return None
+        return a.united(b)
+    
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式，用于序列化"""
         return {
@@ -70,15 +127,31 @@ class CompositeOperation(BaseOperation):
     def __init__(self, description: str = "", operations: List[BaseOperation] = None):
         super().__init__(description)
         self.operations = operations or []
+        self._ops: Optional[Tuple[BaseOperation, ...]] = None  # 子操作的冻结元组（添加子操作后失效）
     
     def add_operation(self, operation: BaseOperation):
         """添加子操作"""
         self.operations.append(operation)
+        self._ops = None
+    
+    def finalize(self) -> Tuple[BaseOperation, ...]:
+        """
+        冻结子操作列表（添加完最后一个子操作后调用）
+        
+        执行、撤销、重做遍历冻结的元组；之后再添加子操作会自动重新冻结
+        
+        Note:
+            子操作的 can_undo/can_redo 随执行状态变化，因此不缓存其结果
+        """
+        ops = self._ops
+        if ops is None:
+            ops = self._ops = tuple(self.operations)
+        return ops
     
     def execute(self) -> bool:
         """执行所有子操作"""
         success = True
-        for operation in self.operations:
+        for operation in self.finalize():
             if not operation.execute():
                 success = False
         return success
@@ -86,7 +159,7 @@ class CompositeOperation(BaseOperation):
     def undo(self) -> bool:
         """撤销所有子操作（逆序）"""
         success = True
-        for operation in reversed(self.operations):
+        for operation in reversed(self.finalize()):
             if not operation.undo():
                 success = False
         return success
@@ -94,18 +167,18 @@ class CompositeOperation(BaseOperation):
     def redo(self) -> bool:
         """重做所有子操作"""
         success = True
-        for operation in self.operations:
+        for operation in self.finalize():
             if not operation.redo():
                 success = False
         return success
     
     def can_undo(self) -> bool:
         """检查是否可以撤销"""
-        return all(op.can_undo() for op in self.operations)
+        return all(op.can_undo() for op in self.finalize())
     
     def can_redo(self) -> bool:
         """检查是否可以重做"""
-        return all(op.can_redo() for op in self.operations)
+        return all(op.can_redo() for op in self.finalize())
     
     def get_operation_count(self) -> int:
         """获取子操作数量"""
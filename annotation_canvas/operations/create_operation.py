@@ -2,16 +2,28 @@
 创建操作 - 处理图形创建操作
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 from PySide6.QtCore import QPointF
 from .stateful_operation import StatefulOperation
 from ..models.shape import BaseShape
+from ..models.point import PointShape
+from ..models.rectangle import RectangleShape
+from ..models.ellipse import EllipseShape
+from ..models.polygon import PolygonShape
 from ..core.enums import DrawType
 
+# 图形类型 -> 反序列化函数（DrawType 为 IntEnum，序列化的整数类型值可直接查表）
+_SHAPE_CTORS = {
+    DrawType.POINT: PointShape.from_dict,
+    DrawType.RECTANGLE: RectangleShape.from_dict,
+    DrawType.ELLIPSE: EllipseShape.from_dict,
+    DrawType.POLYGON: PolygonShape.from_dict,
+}
+
 class CreateOperation(StatefulOperation):
     """创建操作类"""
     
-    def __init__(self, shape: BaseShape, data_manager, description: str = ""):
+    def __init__(self, shape: BaseShape, data_manager, description: Union[str, Callable[[], str]] = ""):
         super().__init__(description or f"创建{shape.shape_type.name}图形")
         self.shape = shape
         self.data_manager = data_manager
@@ -44,22 +56,12 @@ class CreateOperation(StatefulOperation):
         """从字典创建实例，用于反序列化"""
         # 根据图形类型创建相应的图形实例
         shape_data = data['shape']
-        shape_type = DrawType(shape_data['shape_type'])
+        shape_type = shape_data['shape_type']
         
-        if shape_type == DrawType.POINT:
-            from ..models.point import PointShape
-            shape = PointShape.from_dict(shape_data)
-        elif shape_type == DrawType.RECTANGLE:
-            from ..models.rectangle import RectangleShape
-            shape = RectangleShape.from_dict(shape_data)
-        elif shape_type == DrawType.ELLIPSE:
-            from ..models.ellipse import EllipseShape
-            shape = EllipseShape.from_dict(shape_data)
-        elif shape_type == DrawType.POLYGON:
-            from ..models.polygon import PolygonShape
-            shape = PolygonShape.from_dict(shape_data)
-        else:
+        ctor = _SHAPE_CTORS.get(shape_type)
+        if ctor is None:
             raise ValueError(f"不支持的图形类型: {shape_type}")
+        shape = ctor(shape_data)
         
         operation = cls(shape, data_manager, data.get('description', ''))
         operation.executed = data.get('executed', False)
@@ -69,30 +71,27 @@ class CreatePointOperation(CreateOperation):
     """创建点操作"""
     
     def __init__(self, position: QPointF, color, pen_width, data_manager):
-        from ..models.point import PointShape
         shape = PointShape(position, color, pen_width)
-        super().__init__(shape, data_manager, f"创建点({position.x():.1f}, {position.y():.1f})")
+        super().__init__(shape, data_manager, lambda: f"创建点({position.x():.1f}, {position.y():.1f})")
 
 class CreateRectangleOperation(CreateOperation):
     """创建矩形操作"""
     
     def __init__(self, start_point: QPointF, end_point: QPointF, color, pen_width, data_manager):
-        from ..models.rectangle import RectangleShape
         shape = RectangleShape(start_point, end_point, color, pen_width)
-        super().__init__(shape, data_manager, f"创建矩形({start_point.x():.1f}, {start_point.y():.1f}) -> ({end_point.x():.1f}, {end_point.y():.1f})")
+        super().__init__(shape, data_manager, lambda: f"创建矩形({start_point.x():.1f}, {start_point.y():.1f}) -> ({end_point.x():.1f}, {end_point.y():.1f})")
 
 class CreateEllipseOperation(CreateOperation):
     """创建椭圆操作"""
     
     def __init__(self, start_point: QPointF, end_point: QPointF, color, pen_width, data_manager):
-        from ..models.ellipse import EllipseShape
         shape = EllipseShape(start_point, end_point, color, pen_width)
-        super().__init__(shape, data_manager, f"创建椭圆({start_point.x():.1f}, {start_point.y():.1f}) -> ({end_point.x():.1f}, {end_point.y():.1f})")
+        super().__init__(shape, data_manager, lambda: f"创建椭圆({start_point.x():.1f}, {start_point.y():.1f}) -> ({end_point.x():.1f}, {end_point.y():.1f})")
 
 class CreatePolygonOperation(CreateOperation):
     """创建多边形操作"""
     
     def __init__(self, vertices: list, color, pen_width, data_manager):
-        from ..models.polygon import PolygonShape
         shape = PolygonShape(vertices, color, pen_width)
-        super().__init__(shape, data_manager, f"创建多边形({len(vertices)}个顶点)")
+        count = len(vertices)
+        super().__init__(shape, data_manager, lambda: f"创建多边形({count}个顶点)")
@@ -2,11 +2,21 @@
 导入操作 - 支持撤销的图形数据导入
 """
 
-from typing import Dict, Any, List
+import os
+from typing import Dict, Any, Iterable, List, Optional
 from .base_operation import BaseOperation
 from ..models import BaseShape
 from ..core import DrawType, DrawColor, PenWidth
+from ..factories import ShapeFactory
 from ..utils.logger import get_logger
+from ..utils.serialization import load_json
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    ijson = None
+    HAS_IJSON = False
 
 logger = get_logger(__name__)
 
@@ -29,15 +39,43 @@ class ImportOperation(BaseOperation):
         self.operation_manager = operation_manager
         
         # 保存导入前的状态
-        self.original_shapes: List[BaseShape] = []
+        self.original_shapes = None  # ShapeListSnapshot，执行时获取
         self.original_settings: Dict[str, Any] = {}
         
         # 保存导入的图形
         self.imported_shapes: List[BaseShape] = []
         
+        # 流式导入的源文件（由 from_path 设置，此时 import_data 只含设置）
+        self._source_path: Optional[str] = None
+        
         # 操作描述
         self.description = f"导入 {len(import_data.get('shapes', []))} 个图形"
     
+    @classmethod
+    def from_path(cls, path: str, data_manager, operation_manager) -> 'ImportOperation':
+        """
+        从JSON文件创建导入操作
+        
+        安装 ijson 时执行导入才逐个流式解析图形，不在内存中保留完整的图形数据列表；
+        未安装时整体读取文件。设置从文件开头读取（export_data 将 settings 写在 shapes 之前，
+        旧文件 settings 在末尾时需要扫描整个文件）
+        
+        Args:
+            path: JSON文件路径
+            data_manager: 数据管理器
+            operation_manager: 操作管理器
+        """
+        if not HAS_IJSON:
+            return cls(load_json(path), data_manager, operation_manager)
+        
+        # 设置很小且位于文件开头，单独解析；图形在执行时再流式读取
+        with open(path, 'rb') as f:
+            settings = next(ijson.items(f, 'settings', use_float=True), {})
+        operation = cls({'settings': settings}, data_manager, operation_manager)
+        operation._source_path = path
+        operation.description = f"导入 {os.path.basename(path)}"
+        return operation
+    
     def execute(self) -> bool:
         """
         执行导入操作
@@ -45,21 +83,27 @@ class ImportOperation(BaseOperation):
         Returns:
             是否成功执行
         """
+        cleared = False
         try:
+            # 先解析并创建全部图形：文件截断或格式错误时在清空现有数据之前失败
+            if self._source_path is not None:
+                with open(self._source_path, 'rb') as f:
+                    shapes = self._create_shapes(ijson.items(f, 'shapes.item', use_float=True))
+            else:
+                shapes = self._create_shapes(self.import_data.get('shapes', []))
+            
             # 保存当前状态
             self._save_current_state()
             
             # 清空现有数据
             self.data_manager.clear_all_shapes()
+            cleared = True
             
-            # 导入图形数据
-            imported_count = 0
-            for shape_data in self.import_data.get('shapes', []):
-                shape = self._create_shape_from_dict(shape_data)
-                if shape:
-                    self.data_manager.add_shape(shape)
-                    self.imported_shapes.append(shape)
-                    imported_count += 1
+            # 添加图形
+            add_shape = self.data_manager.add_shape
+            for shape in shapes:
+                add_shape(shape)
+            self.imported_shapes = shapes
             
             # 导入设置
             self._import_settings()
@@ -68,8 +112,22 @@ class ImportOperation(BaseOperation):
             
         except Exception as e:
             logger.error(f"导入操作执行失败: {e}")
+            if cleared:
+                # 操作未记录到历史，无法撤销，需在此恢复导入前的状态
+                self.data_manager.restore_shapes(self.original_shapes)
+                self._restore_settings()
             return False
     
+    def _create_shapes(self, shape_items: Iterable[Dict[str, Any]]) -> List[BaseShape]:
+        """逐个创建图形（shape_items 可以是流式解析的迭代器，不保留图形数据字典）"""
+        create_shape = self._create_shape_from_dict
+        shapes = []
+        for shape_data in shape_items:
+            shape = create_shape(shape_data)
+            if shape:
+                shapes.append(shape)
+        return shapes
+    
     def undo(self) -> bool:
         """
         撤销导入操作
@@ -78,12 +136,8 @@ class ImportOperation(BaseOperation):
             是否成功撤销
         """
         try:
-            # 清空当前数据
-            self.data_manager.clear_all_shapes()
-            
-            # 恢复原始图形
-            for shape in self.original_shapes:
-                self.data_manager.add_shape(shape)
+            # 恢复原始图形（快照共享导入前的列表，无需逐个添加）
+            self.data_manager.restore_shapes(self.original_shapes)
             
             # 恢复原始设置
             self._restore_settings()
@@ -109,8 +163,8 @@ class ImportOperation(BaseOperation):
     
     def _save_current_state(self) -> None:
         """保存当前状态"""
-        # 保存当前图形
-        self.original_shapes = self.data_manager.get_shapes().copy()
+        # 保存当前图形（写时复制快照，不复制列表）
+        self.original_shapes = self.data_manager.snapshot_shapes()
         
         # 保存当前设置
         self.original_settings = {
@@ -145,7 +199,6 @@ class ImportOperation(BaseOperation):
     
     def _create_shape_from_dict(self, shape_data: Dict[str, Any]) -> BaseShape:
         """从字典数据创建图形"""
-        from ..factories import ShapeFactory
         return ShapeFactory.create_from_dict(shape_data)
     
     def get_description(self) -> str:
@@ -166,6 +219,7 @@ class ImportOperation(BaseOperation):
             'operation_type': 'import',
             'description': self.description,
             'import_data': self.import_data,
+            'source_path': self._source_path,
             'imported_count': self.get_imported_count()
         }
     
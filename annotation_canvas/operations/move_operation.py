@@ -6,7 +6,6 @@ from typing import Any, Dict, List
 from PySide6.QtCore import QPointF
 from .preview_operation import PreviewOperation
 from ..models.shape import BaseShape
-from ..utils.coordinate_utils_functions import qpointf_to_dict, dict_to_qpointf
 
 class MoveOperation(PreviewOperation):
     """移动操作类"""
@@ -16,16 +15,30 @@ class MoveOperation(PreviewOperation):
         self.shapes = shapes.copy()  # 创建副本
         self.offset = offset
         
+        # 已在预览中执行：当前边界为新边界，反向平移得到旧边界
+        if already_executed:
+            new_bounds = self._united_bounds(self.shapes)
+            self.dirty_rect = new_bounds.united(new_bounds.translated(-offset))
+        
         # 设置操作函数
         self.set_execute_function(self._execute_with_preview_check)
         self.set_undo_function(self._undo_move)
         self.set_redo_function(self._redo_always)
     
+    def merge(self, other) -> bool:
+        """合并紧随其后对同一组图形的移动（偏移量累加）"""
+        if not self._can_merge(other) or len(other.shapes) != len(self.shapes):
+            return False
+        if any(a is not b for a, b in zip(self.shapes, other.shapes)):
+            return False
+        self.offset = self.offset + other.offset
+        self.dirty_rect = self._united_rects(self.dirty_rect, other.dirty_rect)
+        self._last_change = other._last_change
+        return True
+    
     def _do_execute(self) -> bool:
         """实际执行移动操作"""
-        for shape in self.shapes:
-            shape.move_by(self.offset)
-        return True
+        return self._translate(self.offset)
     
     def _undo_move(self) -> bool:
         """撤销移动操作"""
@@ -33,33 +46,51 @@ class MoveOperation(PreviewOperation):
     
     def _do_undo(self) -> bool:
         """实际撤销移动操作"""
-        reverse_offset = QPointF(-self.offset.x(), -self.offset.y())
+        return self._translate(QPointF(-self.offset.x(), -self.offset.y()))
+    
+    def _translate(self, offset: QPointF) -> bool:
+        """
+        平移全部图形
+        
+        平移不改变图形尺寸，新边界即旧边界平移所得，只需在移动前遍历一次边界
+        """
+        old_bounds = self._united_bounds(self.shapes)
         for shape in self.shapes:
-            shape.move_by(reverse_offset)
+            shape.move_by(offset)
+        self.dirty_rect = old_bounds.united(old_bounds.translated(offset))
         return True
     
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典格式，用于序列化"""
+        """
+        转换为字典格式，用于序列化
+        
+        只记录图形编号与偏移量，不重复保存图形几何数据
+        """
         base_dict = super().to_dict()
         base_dict.update({
-            'shapes': [shape.to_dict() for shape in self.shapes],
-            'offset': qpointf_to_dict(self.offset),
+            'ids': [shape.shape_id for shape in self.shapes],
+            'dx': self.offset.x(),
+            'dy': self.offset.y(),
             'executed': self.executed
         })
         return base_dict
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any], data_manager) -> 'MoveOperation':
-        """从字典创建实例，用于反序列化"""
-        # 重建图形列表
+        """
+        从字典创建实例，用于反序列化（按编号在数据管理器中查找图形）
+        
+        Raises:
+            ValueError: 引用的图形不存在
+        """
         shapes = []
-        for shape_data in data.get('shapes', []):
-            # 这里需要根据图形类型创建相应的图形实例
-            # 简化处理，实际应用中需要更复杂的工厂模式
-            pass
+        for shape_id in data.get('ids', []):
+            shape = data_manager.get_shape_by_id(shape_id)
+            if shape is None:
+                raise ValueError(f"移动操作引用的图形不存在: {shape_id}")
+            shapes.append(shape)
         
-        offset_data = data.get('offset', {'x': 0, 'y': 0})
-        offset = dict_to_qpointf(offset_data)
+        offset = QPointF(data.get('dx', 0.0), data.get('dy', 0.0))
         
         operation = cls(shapes, offset, data.get('description', ''))
         operation.executed = data.get('executed', False)
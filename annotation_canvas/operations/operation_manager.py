@@ -2,90 +2,142 @@
 操作管理器 - 管理操作历史和撤销恢复
 """
 
+from collections import deque
 from typing import List, Optional, Dict, Any
 from .base_operation import BaseOperation, CompositeOperation
-import json
+from ..events import Event, EventType
+from ..utils.constants import OperationConstants
+from ._codec import load_file, save_file
 import time
 
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    psutil = None
+    HAS_PSUTIL = False
+
 class OperationManager:
-    """操作管理器"""
+    """
+    操作管理器
+    
+    已执行的操作保存在有界的撤销栈（deque）中，超出容量时自动丢弃最早的操作；
+    撤销的操作移入重做栈，执行新操作时清空重做栈
+    """
     
-    def __init__(self, event_bus=None):
-        self.operation_history: List[BaseOperation] = []
-        self.current_index = -1
+    def __init__(self, event_bus=None, max_operations: Optional[int] = None):
+        """
+        初始化操作管理器
+        
+        Args:
+            event_bus: 事件总线
+            max_operations: 撤销历史容量；为None时使用默认容量，安装 psutil 时按可用内存定期调整
+        """
+        self._auto_resize = max_operations is None
+        capacity = OperationConstants.HISTORY_DEFAULT_SIZE if max_operations is None else max_operations
+        self._history: deque = deque(maxlen=capacity)  # 可撤销的操作（末尾为最近执行的）
+        self._redo: deque = deque()  # 可重做的操作（末尾为最近撤销的）
+        self._executed_count = 0
         self.event_bus = event_bus
     
+    @property
+    def current_index(self) -> int:
+        """当前操作在历史中的索引（没有可撤销操作时为-1）"""
+        return len(self._history) - 1
+    
+    @property
+    def operation_history(self) -> List[BaseOperation]:
+        """全部操作（已执行的在前，随后为可重做的）"""
+        return self.get_operation_list()
+    
     def execute_operation(self, operation: BaseOperation) -> bool:
         """执行操作"""
         if operation.execute():
-            # 如果当前不在历史记录末尾，删除后面的操作
-            if self.current_index < len(self.operation_history) - 1:
-                self.operation_history = self.operation_history[:self.current_index + 1]
+            # 新操作使重做分支失效
+            self._redo.clear()
+            
+            # 能与上一条记录合并（如连续拖动同一图形）时不新增记录
+            if self._history and self._history[-1].merge(operation):
+                return True
             
-            # 添加到历史记录
-            self.operation_history.append(operation)
-            self.current_index = len(self.operation_history) - 1
+            # 撤销栈满时deque自动丢弃最早的操作
+            self._history.append(operation)
             
+            self._executed_count += 1
+            if self._auto_resize and self._executed_count % OperationConstants.HISTORY_RESIZE_INTERVAL == 0:
+                self._recompute_capacity()
             return True
         return False
     
+    def _recompute_capacity(self) -> None:
+        """按当前可用内存重新估算撤销历史容量（需要 psutil）"""
+        if not HAS_PSUTIL:
+            return
+        available = psutil.virtual_memory().available
+        capacity = available // OperationConstants.HISTORY_AVG_OPERATION_BYTES
+        capacity = max(OperationConstants.HISTORY_MIN_SIZE, min(OperationConstants.HISTORY_MAX_SIZE, capacity))
+        if capacity != self._history.maxlen:
+            # deque的容量不可修改，按新容量重建（保留最近的操作）
+            self._history = deque(self._history, maxlen=capacity)
+    
     def undo(self) -> bool:
         """撤销操作"""
-        if not self.can_undo():
+        if not self._history:
             return False
         
         # 获取当前操作
-        current_operation = self.operation_history[self.current_index]
+        current_operation = self._history[-1]
         
         # 撤销操作
         if current_operation.undo():
             # 发送撤销信号
             self._emit_undo_signals(current_operation)
             
-            # 更新当前索引
-            self.current_index -= 1
+            # 移入重做栈
+            self._history.pop()
+            self._redo.append(current_operation)
             return True
         
         return False
     
     def redo(self) -> bool:
         """重做操作"""
-        if not self.can_redo():
+        if not self._redo:
             return False
         
         # 获取下一个操作
-        next_operation = self.operation_history[self.current_index + 1]
+        next_operation = self._redo[-1]
         
         # 重做操作
         if next_operation.redo():
             # 发送重做信号
             self._emit_redo_signals(next_operation)
             
-            # 更新当前索引
-            self.current_index += 1
+            # 移回撤销栈
+            self._redo.pop()
+            self._history.append(next_operation)
             return True
         
         return False
     
     def can_undo(self) -> bool:
         """检查是否可以撤销"""
-        return (self.current_index >= 0 and 
-                self.current_index < len(self.operation_history))
+        return bool(self._history)
     
     def can_redo(self) -> bool:
         """检查是否可以重做"""
-        return (self.current_index + 1 < len(self.operation_history))
+        return bool(self._redo)
     
     def get_undo_description(self) -> Optional[str]:
         """获取可撤销操作的描述"""
-        if self.can_undo():
-            return self.operation_history[self.current_index].get_description()
+        if self._history:
+            return self._history[-1].get_description()
         return None
     
     def get_redo_description(self) -> Optional[str]:
         """获取可重做操作的描述"""
-        if self.can_redo():
-            return self.operation_history[self.current_index + 1].get_description()
+        if self._redo:
+            return self._redo[-1].get_description()
         return None
     
     def _emit_undo_signals(self, operation: BaseOperation) -> None:
@@ -93,8 +145,6 @@ class OperationManager:
         if not self.event_bus:
             return
         
-        from ..events import Event, EventType
-        
         # 获取图形列表
         shapes = []
         if hasattr(operation, 'shapes') and operation.shapes:
@@ -112,7 +162,8 @@ class OperationManager:
                     update_type = 'move' if operation.__class__.__name__ == 'MoveOperation' else 'modify'
                     self.event_bus.publish(Event(EventType.SHAPE_UPDATED, {
                         'shape': shape, 
-                        'update_type': update_type
+                        'update_type': update_type,
+                        'dirty_rect': operation.get_dirty_rect()
                     }))
     
     def _emit_redo_signals(self, operation: BaseOperation) -> None:
@@ -120,8 +171,6 @@ class OperationManager:
         if not self.event_bus:
             return
         
-        from ..events import Event, EventType
-        
         # 获取图形列表
         shapes = []
         if hasattr(operation, 'shapes') and operation.shapes:
@@ -139,17 +188,18 @@ class OperationManager:
                     update_type = 'move' if operation.__class__.__name__ == 'MoveOperation' else 'modify'
                     self.event_bus.publish(Event(EventType.SHAPE_UPDATED, {
                         'shape': shape, 
-                        'update_type': update_type
+                        'update_type': update_type,
+                        'dirty_rect': operation.get_dirty_rect()
                     }))
     
     def clear_history(self):
         """清空历史记录"""
-        self.operation_history.clear()
-        self.current_index = -1
+        self._history.clear()
+        self._redo.clear()
     
     def get_history_size(self) -> int:
         """获取历史记录大小"""
-        return len(self.operation_history)
+        return len(self._history) + len(self._redo)
     
     def get_current_index(self) -> int:
         """获取当前索引"""
@@ -157,13 +207,23 @@ class OperationManager:
     
     def get_operation_at(self, index: int) -> Optional[BaseOperation]:
         """获取指定索引的操作"""
-        if 0 <= index < len(self.operation_history):
-            return self.operation_history[index]
+        executed = len(self._history)
+        if 0 <= index < executed:
+            return self._history[index]
+        redo_index = index - executed
+        if 0 <= redo_index < len(self._redo):
+            return self._redo[-1 - redo_index]
         return None
     
     def get_operation_list(self) -> List[BaseOperation]:
         """获取操作列表"""
-        return self.operation_history.copy()
+        operations = list(self._history)
+        operations.extend(reversed(self._redo))
+        return operations
+    
+    def get_history(self) -> List[BaseOperation]:
+        """获取已执行（可撤销）的操作列表"""
+        return list(self._history)
     
     def create_composite_operation(self, description: str = "") -> CompositeOperation:
         """创建复合操作"""
@@ -174,21 +234,20 @@ class OperationManager:
         if composite_operation.get_operation_count() == 0:
             return False
         
+        composite_operation.finalize()
         return self.execute_operation(composite_operation)
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式，用于序列化"""
         return {
             'current_index': self.current_index,
-            'operation_history': [op.to_dict() for op in self.operation_history]
+            'operation_history': [op.to_dict() for op in self.get_operation_list()]
         }
     
     def from_dict(self, data: Dict[str, Any], context):
         """从字典创建实例，用于反序列化"""
-        self.current_index = data.get('current_index', -1)
-        
         # 清空现有数据
-        self.operation_history.clear()
+        self.clear_history()
         
         # 重建操作历史
         for op_data in data.get('operation_history', []):
@@ -199,22 +258,20 @@ class OperationManager:
     def save_to_file(self, filename: str):
         """保存到文件"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            save_file(filename, self.to_dict())
         except Exception as e:
             pass
     
     def load_from_file(self, filename: str, context):
         """从文件加载"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_file(filename)
             self.from_dict(data, context)
         except Exception as e:
             pass
     
     def __str__(self) -> str:
-        return f"OperationManager(history_size={len(self.operation_history)}, current_index={self.current_index})"
+        return f"OperationManager(history_size={self.get_history_size()}, current_index={self.current_index})"
     
     def __repr__(self) -> str:
         return self.__str__()
@@ -2,10 +2,12 @@
 预览操作基类 - 处理实时预览相关的操作逻辑
 """
 
+import time
 from abc import abstractmethod
 from typing import Any, Dict
 from PySide6.QtCore import QPointF
 from .stateful_operation import StatefulOperation
+from ..utils.constants import OperationConstants
 
 
 class PreviewOperation(StatefulOperation):
@@ -14,6 +16,12 @@ class PreviewOperation(StatefulOperation):
     def __init__(self, description: str = "", already_executed: bool = False):
         super().__init__(description)
         self.already_executed = already_executed  # 标记是否已经执行过（实时预览中）
+        self._last_change = time.monotonic()  # 最近一次（含合并进来的）操作的时间
+    
+    def _can_merge(self, other: 'PreviewOperation') -> bool:
+        """other 与本操作同类、均已执行且在合并时间窗口内"""
+        return (type(other) is type(self) and self.executed and other.executed
+                and other._last_change - self._last_change < OperationConstants.HISTORY_MERGE_WINDOW)
     
     def _execute_with_preview_check(self) -> bool:
         """执行操作（带预览检查）"""
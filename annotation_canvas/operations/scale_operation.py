@@ -24,9 +24,22 @@ class ScaleOperation(PreviewOperation):
         self.set_undo_function(self._undo_scale)
         self.set_redo_function(self._redo_always)
     
+    def merge(self, other) -> bool:
+        """合并紧随其后对同一控制点的拖动（保留起始位置，采用最终位置）"""
+        if not self._can_merge(other):
+            return False
+        if other.shape is not self.shape or other.control_point is not self.control_point:
+            return False
+        self.new_position = other.new_position
+        self.dirty_rect = self._united_rects(self.dirty_rect, other.dirty_rect)
+        self._last_change = other._last_change
+        return True
+    
     def _do_execute(self) -> bool:
         """实际执行缩放操作"""
+        old_bounds = self.shape.get_bounds()
         self.shape.scale_by_control_point(self.control_point, self.new_position)
+        self.dirty_rect = old_bounds.united(self.shape.get_bounds())
         return True
     
     def _undo_scale(self) -> bool:
@@ -35,15 +48,21 @@ class ScaleOperation(PreviewOperation):
     
     def _do_undo(self) -> bool:
         """实际撤销缩放操作"""
+        old_bounds = self.shape.get_bounds()
         self.shape.scale_by_control_point(self.control_point, self.old_position)
+        self.dirty_rect = old_bounds.united(self.shape.get_bounds())
         return True
     
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典格式，用于序列化"""
+        """
+        转换为字典格式，用于序列化
+        
+        以图形编号和控制点序号引用图形，不重复保存图形几何数据
+        """
         base_dict = super().to_dict()
         base_dict.update({
-            'shape': self.shape.to_dict(),
-            'control_point': self.control_point.to_dict(),
+            'shape_id': self.shape.shape_id,
+            'control_point_index': self.control_point.index,
             'old_position': qpointf_to_dict(self.old_position),
             'new_position': qpointf_to_dict(self.new_position),
             'executed': self.executed
@@ -52,21 +71,24 @@ class ScaleOperation(PreviewOperation):
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any], data_manager) -> 'ScaleOperation':
-        """从字典创建实例，用于反序列化"""
-        # 重建图形和控制点
-        shape_data = data.get('shape', {})
-        control_point_data = data.get('control_point', {})
+        """
+        从字典创建实例，用于反序列化
+        
+        Raises:
+            ValueError: 图形已不存在或控制点序号无效
+        """
+        shape = data_manager.get_shape_by_id(data.get('shape_id'))
+        if shape is None:
+            raise ValueError(f"缩放操作引用的图形不存在: {data.get('shape_id')}")
         
-        # 这里需要根据图形类型创建相应的图形实例
-        # 简化处理，实际应用中需要更复杂的工厂模式
-        shape = None
-        control_point = None
+        control_points = shape.get_control_points()
+        index = data.get('control_point_index', -1)
+        if not 0 <= index < len(control_points):
+            raise ValueError(f"缩放操作引用的控制点无效: {index}")
         
-        old_pos_data = data.get('old_position', {'x': 0, 'y': 0})
-        new_pos_data = data.get('new_position', {'x': 0, 'y': 0})
-        old_position = dict_to_qpointf(old_pos_data)
-        new_position = dict_to_qpointf(new_pos_data)
+        old_position = dict_to_qpointf(data.get('old_position', {'x': 0, 'y': 0}))
+        new_position = dict_to_qpointf(data.get('new_position', {'x': 0, 'y': 0}))
         
-        operation = cls(shape, control_point, old_position, new_position, data.get('description', ''))
+        operation = cls(shape, control_points[index], old_position, new_position, data.get('description', ''))
         operation.executed = data.get('executed', False)
         return operation
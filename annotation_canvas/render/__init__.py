@@ -8,7 +8,8 @@ from .canvas_renderer import CanvasRenderer
 from .z_axis_manager import ZAxisManager
 from .render_utils import (
     get_color_rgb, get_line_width, create_pen, create_brush, 
-    create_hover_pen, get_point_size, get_point_width
+    create_hover_pen, get_point_size, get_point_width, make_pen, make_brush,
+    set_sprite_cache, StylePalette, StyleRecord
 )
 from .base_render_strategy import BaseRenderStrategy
 from .optimized_render_factory import OptimizedRenderFactory
@@ -17,7 +18,8 @@ __all__ = [
     'CanvasRenderer',
     'ZAxisManager',
     'get_color_rgb', 'get_line_width', 'create_pen', 'create_brush', 
-    'create_hover_pen', 'get_point_size', 'get_point_width',
+    'create_hover_pen', 'get_point_size', 'get_point_width', 'make_pen', 'make_brush',
+    'set_sprite_cache', 'StylePalette', 'StyleRecord',
     'BaseRenderStrategy',
     'OptimizedRenderFactory'
 ]
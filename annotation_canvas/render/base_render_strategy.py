@@ -9,7 +9,7 @@ from PySide6.QtCore import QPointF
 from ..core import DrawType
 from ..models import BaseShape
 from .z_axis_manager import ZAxisManager
-from .render_utils import create_hover_pen
+from .render_utils import create_hover_pen, set_sprite_cache
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -21,6 +21,17 @@ T = TypeVar('T', bound=BaseShape)
 class BaseRenderStrategy(ABC, Generic[T]):
     """基础渲染策略 - 使用泛型降低耦合度"""
     
+    # 悬停高亮画笔（所有策略共享，首次使用时创建）
+    _HOVER_PEN = None
+    
+    @classmethod
+    def _hover_pen(cls) -> Any:
+        """获取共享的悬停高亮画笔"""
+        pen = BaseRenderStrategy._HOVER_PEN
+        if pen is None:
+            pen = BaseRenderStrategy._HOVER_PEN = create_hover_pen()
+        return pen
+    
     def create_graphics_item(self, shape: T) -> Optional[Any]:
         """
         创建图形项
@@ -31,15 +42,17 @@ class BaseRenderStrategy(ABC, Generic[T]):
         Returns:
             Optional[Any]: 创建的图形项
         """
-        try:
-            graphics_item = self._create_graphics_item_impl(shape)
-            if graphics_item is not None:
-                # 统一设置Z轴
-                ZAxisManager.set_z_order(graphics_item, shape.get_z_order())
-            return graphics_item
-        except Exception as e:
-            logger.error(f"创建图形项失败: {e}")
-            return None
+        # Qt对象构造的异常由各策略的 _create_graphics_item_impl 捕获（失败时返回None），此处不再包裹
+        graphics_item = self._create_graphics_item_impl(shape)
+        if graphics_item is not None:
+            # 统一设置Z轴
+            z_order = shape.get_z_order()
+            ZAxisManager.set_z_order(graphics_item, z_order)
+            graphics_item._synced_z = z_order
+            # 按设备坐标缓存绘制结果，几何未变时重绘直接复用缓存
+            set_sprite_cache(graphics_item, True)
+            self._mark_geometry_synced(shape, graphics_item)
+        return graphics_item
     
     def update_graphics_item(self, shape: T, graphics_item: Any) -> bool:
         """
@@ -52,15 +65,15 @@ class BaseRenderStrategy(ABC, Generic[T]):
         Returns:
             bool: 更新是否成功
         """
-        try:
-            success = self._update_graphics_item_impl(shape, graphics_item)
-            if success and graphics_item is not None:
-                # 统一更新Z轴
-                ZAxisManager.set_z_order(graphics_item, shape.get_z_order())
-            return success
-        except Exception as e:
-            logger.error(f"更新图形项失败: {e}")
-            return False
+        # 异常由各策略的 _update_graphics_item_impl 捕获（失败时返回False）
+        success = self._update_graphics_item_impl(shape, graphics_item)
+        if success and graphics_item is not None:
+            # 层级未变化时不再重复设置Z轴
+            z_order = shape.get_z_order()
+            if getattr(graphics_item, '_synced_z', None) != z_order:
+                ZAxisManager.set_z_order(graphics_item, z_order)
+                graphics_item._synced_z = z_order
+        return success
     
     @abstractmethod
     def _create_graphics_item_impl(self, shape: T) -> Optional[Any]:
@@ -99,6 +112,33 @@ class BaseRenderStrategy(ABC, Generic[T]):
         """
         pass
     
+    def get_outline_data(self, shape: T) -> Optional[tuple]:
+        """
+        获取图形轮廓线数据（供按样式批量绘制使用）
+        
+        Args:
+            shape: 图形对象
+            
+        Returns:
+            Optional[tuple]: (x_data, y_data)，非轮廓类图形（如点）返回None
+        """
+        return None
+    
+    def _geometry_changed(self, shape: T, graphics_item: Any, extra: Any = None) -> bool:
+        """
+        检查图形几何是否在上次同步后发生变化
+        
+        Args:
+            shape: 图形对象
+            graphics_item: 图形项
+            extra: 参与比较的额外几何状态（如多边形是否闭合）
+        """
+        return getattr(graphics_item, '_synced_geometry', None) != (shape.get_geometry_version(), extra)
+    
+    def _mark_geometry_synced(self, shape: T, graphics_item: Any, extra: Any = None) -> None:
+        """记录图形项已同步到的几何版本"""
+        graphics_item._synced_geometry = (shape.get_geometry_version(), extra)
+    
     def _apply_hover_effect(self, graphics_item: Any, is_hovered: bool) -> None:
         """
         应用悬停效果
@@ -112,7 +152,6 @@ class BaseRenderStrategy(ABC, Generic[T]):
             
         try:
             if is_hovered and hasattr(graphics_item, 'setPen'):
-                hover_pen = create_hover_pen()
-                graphics_item.setPen(hover_pen)
+                graphics_item.setPen(self._hover_pen())
         except Exception as e:
             logger.warning(f"应用悬停效果失败: {e}")
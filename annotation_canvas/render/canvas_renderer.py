@@ -3,7 +3,7 @@
 """
 
 from typing import Optional, Any
-from PySide6.QtCore import QPointF
+from PySide6.QtCore import QPointF, QTimer
 
 import pyqtgraph as pg
 from pyqtgraph import PlotDataItem, ScatterPlotItem
@@ -12,9 +12,14 @@ from ..events import EventBus, Event, EventType, EventHandlerBase
 from ..data import DataManager
 from ..models import BaseShape
 from .optimized_render_factory import OptimizedRenderFactory
+from .render_utils import make_pen, make_brush, set_sprite_cache
+from .z_axis_manager import ZAxisManager
 from ..utils.constants import (
-    InteractionConstants, DisplayConstants, ColorConstants
+    InteractionConstants, DisplayConstants, ColorConstants, ZAxisConstants
 )
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class CanvasRenderer(EventHandlerBase):
@@ -37,6 +42,11 @@ class CanvasRenderer(EventHandlerBase):
         self._shape_graphics_items = {}  # shape -> graphics_item
         self._control_point_items = {}   # control_point -> graphics_item
         self._temp_graphics_item = None  # 临时图形项（类似旧版本）
+        
+        # 按样式合并绘制的静态图形（见 batch_static_shapes）
+        self._batched_shapes = set()
+        self._batch_items = []
+        self._batch_rebuild_pending = False
     
     def _register_event_handlers(self) -> None:
         """注册事件处理器"""
@@ -83,6 +93,22 @@ class CanvasRenderer(EventHandlerBase):
         """处理图形更新事件"""
         shape = event.data['shape']
         self._update_shape_display(shape)
+        
+        update_type = event.data.get('update_type')
+        dirty_rect = event.data.get('dirty_rect')
+        
+        # 拖拽预览中（有重绘区域但无更新类型）的图形每帧都变化，暂停位图缓存；结束后恢复
+        graphics_item = self._shape_graphics_items.get(shape)
+        if graphics_item is not None:
+            set_sprite_cache(graphics_item, update_type is not None or dirty_rect is None)
+        
+        # 移动/修改完成后同步选中图形的控制点
+        if update_type and shape is self.data_manager.get_selected_shape():
+            self._render_control_points(shape)
+        
+        # 只重绘受影响的区域（旧边界∪新边界）
+        if dirty_rect is not None and hasattr(self.canvas, 'update_region'):
+            self.canvas.update_region(dirty_rect)
     
     def _on_hover_changed(self, event: Event) -> None:
         """处理悬停变化事件"""
@@ -133,6 +159,10 @@ class CanvasRenderer(EventHandlerBase):
                 del self._shape_graphics_items[shape]
                 if hasattr(shape, 'graphics_item'):
                     shape.graphics_item = None
+            
+            # 批量项中可能残留已删除的图形
+            if self._batched_shapes:
+                self._schedule_batch_rebuild()
         
         # 更新所有显示
         self.update_all_display()
@@ -153,6 +183,7 @@ class CanvasRenderer(EventHandlerBase):
     
     def _remove_shape_from_display(self, shape: BaseShape) -> None:
         """从显示中移除图形"""
+        self._unbatch_shape(shape)
         if shape in self._shape_graphics_items:
             graphics_item = self._shape_graphics_items[shape]
             self.canvas.removeItem(graphics_item)
@@ -169,6 +200,9 @@ class CanvasRenderer(EventHandlerBase):
     
     def _update_shape_display(self, shape: BaseShape, selected: bool = None, hovered: bool = None) -> None:
         """更新图形显示"""
+        # 图形开始变化或参与交互，移出批量项改为单独绘制
+        self._unbatch_shape(shape)
+        
         # 如果图形不在缓存中，创建图形项
         if shape not in self._shape_graphics_items:
             graphics_item = self._create_shape_graphics_item(shape)
@@ -243,42 +277,97 @@ class CanvasRenderer(EventHandlerBase):
         # 创建控制点图形项
         graphics_item = ScatterPlotItem(
             [cp.position.x()], [cp.position.y()],
-            size=size, pen=pg.mkPen(color=color, width=width),
-            brush=pg.mkBrush(color=color), symbol='s'
+            size=size, pen=make_pen(color, width),
+            brush=make_brush(color), symbol='s'
         )
         
         # 设置控制点Z轴层级为最高
-        from ..utils.constants import ZAxisConstants
         graphics_item.setZValue(ZAxisConstants.CONTROL_POINT_Z_ORDER)
         
         # 如果悬停，添加黑色边框
         if cp.hovered:
-            border_pen = pg.mkPen(color=ColorConstants.CONTROL_POINT_HOVER, width=1)
+            border_pen = make_pen(ColorConstants.CONTROL_POINT_HOVER, 1)
             graphics_item.setPen(border_pen)
         
         return graphics_item
     
     def update_all_display(self) -> None:
         """更新所有显示"""
-        # 更新所有图形
+        # 更新所有图形（已有图形项的批量更新，缺失的逐个创建）
+        shape_items = self._shape_graphics_items
+        batched = self._batched_shapes
+        pending = []
         for shape in self.data_manager.get_shapes():
-            self._update_shape_display(shape)
+            if shape in batched:
+                continue  # 批量绘制的静态图形无需逐个更新
+            graphics_item = shape_items.get(shape)
+            if graphics_item is None:
+                self._update_shape_display(shape)
+            else:
+                pending.append((shape, graphics_item))
+        if pending:
+            OptimizedRenderFactory.update_graphics_items(pending)
         
         # 更新临时图形（只有在临时图形存在且不在正式图形列表中时才显示）
         temp_shape = self.data_manager.get_temp_shape()
         if temp_shape and temp_shape not in self.data_manager.get_shapes():
             self._update_shape_display(temp_shape)
+            # 预览图形随鼠标每帧变化，不做位图缓存
+            temp_item = self._shape_graphics_items.get(temp_shape)
+            if temp_item is not None:
+                set_sprite_cache(temp_item, False)
         
         # 更新选中图形的控制点
         selected_shape = self.data_manager.get_selected_shape()
         if selected_shape:
             self._render_control_points(selected_shape)
     
+    def batch_static_shapes(self) -> None:
+        """
+        将当前未参与交互的图形按样式合并绘制
+        
+        选中、悬停及自定义Z轴层级的图形保持单独绘制；批量中的图形一旦
+        更新、悬停或删除，会自动移出批量项改为单独绘制。
+        """
+        selected = self.data_manager.get_selected_shape()
+        hovered = self.data_manager.get_hovered_shape()
+        for shape in self.data_manager.get_shapes():
+            if shape is selected or shape is hovered or shape.z_order != ZAxisConstants.DEFAULT_Z_ORDER:
+                continue
+            self._remove_shape_from_display(shape)
+            self._batched_shapes.add(shape)
+        self._rebuild_batches()
+    
+    def _unbatch_shape(self, shape: BaseShape) -> bool:
+        """将图形移出批量项（批量项延迟重建）"""
+        if shape not in self._batched_shapes:
+            return False
+        self._batched_shapes.discard(shape)
+        self._schedule_batch_rebuild()
+        return True
+    
+    def _schedule_batch_rebuild(self) -> None:
+        """在本轮事件处理结束后重建批量项，合并同一轮中的多次变化"""
+        if not self._batch_rebuild_pending:
+            self._batch_rebuild_pending = True
+            QTimer.singleShot(0, self._rebuild_batches)
+    
+    def _rebuild_batches(self) -> None:
+        """重建批量图形项"""
+        self._batch_rebuild_pending = False
+        for item in self._batch_items:
+            self.canvas.removeItem(item)
+        
+        # 按数据顺序收集，同时丢弃已不在数据中的图形
+        shapes = [shape for shape in self.data_manager.get_shapes() if shape in self._batched_shapes]
+        self._batched_shapes = set(shapes)
+        self._batch_items = OptimizedRenderFactory.create_batched_items(shapes) if shapes else []
+        for item in self._batch_items:
+            ZAxisManager.set_z_order(item, ZAxisConstants.DEFAULT_Z_ORDER)
+            self.canvas.addItem(item)
+    
     def cleanup(self) -> None:
         """清理资源"""
-        from ..utils.logger import get_logger
-        logger = get_logger(__name__)
-        
         # 取消所有事件订阅
         if hasattr(self, '_event_handlers') and self._event_handlers:
             for event_type, handler in self._event_handlers.items():
@@ -288,5 +377,7 @@ class CanvasRenderer(EventHandlerBase):
         # 清理图形项缓存
         self._shape_graphics_items.clear()
         self._control_point_items.clear()
+        self._batched_shapes.clear()
+        self._batch_items = []
         self._temp_graphics_item = None
         
\ No newline at end of file
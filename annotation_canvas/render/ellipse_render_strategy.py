@@ -31,21 +31,8 @@ class EllipseRenderStrategy(BaseRenderStrategy[EllipseShape]):
             Optional[PlotDataItem]: 创建的椭圆图形项
         """
         try:
-            # 获取椭圆边界
-            start = shape.get_start_point()
-            end = shape.get_end_point()
-            
-            # 计算椭圆中心点和半径
-            center_x = (start.x() + end.x()) / 2
-            center_y = (start.y() + end.y()) / 2
-            radius_x = abs(end.x() - start.x()) / 2
-            radius_y = abs(end.y() - start.y()) / 2
-            
             # 生成椭圆点
-            points_count = DisplayConstants.ELLIPSE_POINTS_COUNT
-            x_data, y_data = self._generate_ellipse_points(
-                center_x, center_y, radius_x, radius_y, points_count
-            )
+            x_data, y_data = self.get_outline_data(shape)
             
             # 创建画笔
             pen = create_pen(shape.color, shape.pen_width, shape.is_hovered())
@@ -80,24 +67,11 @@ class EllipseRenderStrategy(BaseRenderStrategy[EllipseShape]):
             bool: 更新是否成功
         """
         try:
-            # 获取椭圆边界
-            start = shape.get_start_point()
-            end = shape.get_end_point()
-            
-            # 计算椭圆中心点和半径
-            center_x = (start.x() + end.x()) / 2
-            center_y = (start.y() + end.y()) / 2
-            radius_x = abs(end.x() - start.x()) / 2
-            radius_y = abs(end.y() - start.y()) / 2
-            
-            # 生成椭圆点
-            points_count = DisplayConstants.ELLIPSE_POINTS_COUNT
-            x_data, y_data = self._generate_ellipse_points(
-                center_x, center_y, radius_x, radius_y, points_count
-            )
-            
-            # 更新数据
-            graphics_item.setData(x_data, y_data)
+            # 几何未变化时跳过椭圆点生成，保留已缓存的绘制数据
+            if self._geometry_changed(shape, graphics_item):
+                x_data, y_data = self.get_outline_data(shape)
+                graphics_item.setData(x_data, y_data)
+                self._mark_geometry_synced(shape, graphics_item)
             
             # 更新画笔
             pen = create_pen(shape.color, shape.pen_width, shape.is_hovered())
@@ -112,6 +86,31 @@ class EllipseRenderStrategy(BaseRenderStrategy[EllipseShape]):
             logger.error(f"更新椭圆图形项失败: {e}")
             return False
     
+    def get_outline_data(self, shape: EllipseShape) -> tuple:
+        """
+        生成椭圆轮廓数据
+        
+        Args:
+            shape: 椭圆图形对象
+            
+        Returns:
+            tuple: (x_data, y_data) 椭圆点数据
+        """
+        # 获取椭圆边界
+        start = shape.get_start_point()
+        end = shape.get_end_point()
+        
+        # 计算椭圆中心点和半径
+        center_x = (start.x() + end.x()) / 2
+        center_y = (start.y() + end.y()) / 2
+        radius_x = abs(end.x() - start.x()) / 2
+        radius_y = abs(end.y() - start.y()) / 2
+        
+        # 生成椭圆点
+        return self._generate_ellipse_points(
+            center_x, center_y, radius_x, radius_y, DisplayConstants.ELLIPSE_POINTS_COUNT
+        )
+    
     def _generate_ellipse_points(self, center_x: float, center_y: float, 
                                 radius_x: float, radius_y: float, points_count: int) -> tuple:
         """
@@ -2,12 +2,15 @@
 优化后的渲染策略工厂 - 降低耦合度
 """
 
-from typing import Optional, Dict, Type, Any
-from ..core import DrawType
+from typing import Optional, Dict, Type, Any, List, Tuple
+import numpy as np
+from pyqtgraph import PlotDataItem, ScatterPlotItem
+from ..core import DrawType, DT_POINT, DT_RECTANGLE, DT_ELLIPSE, DT_POLYGON
 from ..models import BaseShape
 from .base_render_strategy import BaseRenderStrategy
 from .point_render_strategy import PointRenderStrategy
 from .rectangle_render_strategy import RectangleRenderStrategy
+from .render_utils import create_pen, create_brush, get_point_size, set_sprite_cache
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -16,16 +19,19 @@ logger = get_logger(__name__)
 class OptimizedRenderFactory:
     """优化后的渲染策略工厂"""
     
-    # 策略注册表 - 延迟导入避免循环依赖
-    _strategies: Optional[Dict[DrawType, Type[BaseRenderStrategy]]] = None
+    # 策略注册表（以原始整数类型为键）- 延迟导入避免循环依赖
+    _strategies: Optional[Dict[int, Type[BaseRenderStrategy]]] = None
+    
+    # 策略实例缓存（策略无状态，按类型复用同一实例）
+    _instances: Dict[int, BaseRenderStrategy] = {}
     
     @classmethod
-    def _get_strategies(cls) -> Dict[DrawType, Type[BaseRenderStrategy]]:
+    def _get_strategies(cls) -> Dict[int, Type[BaseRenderStrategy]]:
         """
         获取策略注册表（延迟加载）
         
         Returns:
-            Dict[DrawType, Type[BaseRenderStrategy]]: 策略注册表
+            Dict[int, Type[BaseRenderStrategy]]: 策略注册表
         """
         if cls._strategies is None:
             # 延迟导入避免循环依赖
@@ -33,13 +39,32 @@ class OptimizedRenderFactory:
             from .polygon_render_strategy import PolygonRenderStrategy
             
             cls._strategies = {
-                DrawType.POINT: PointRenderStrategy,
-                DrawType.RECTANGLE: RectangleRenderStrategy,
-                DrawType.ELLIPSE: EllipseRenderStrategy,
-                DrawType.POLYGON: PolygonRenderStrategy,
+                DT_POINT: PointRenderStrategy,
+                DT_RECTANGLE: RectangleRenderStrategy,
+                DT_ELLIPSE: EllipseRenderStrategy,
+                DT_POLYGON: PolygonRenderStrategy,
             }
         return cls._strategies
     
+    @classmethod
+    def _get_strategy(cls, type_id: int) -> Optional[BaseRenderStrategy]:
+        """
+        获取策略实例（按类型缓存）
+        
+        Args:
+            type_id: 原始整数图形类型
+            
+        Returns:
+            Optional[BaseRenderStrategy]: 策略实例，不支持的类型返回None
+        """
+        strategy = cls._instances.get(type_id)
+        if strategy is None:
+            strategy_class = cls._get_strategies().get(type_id)
+            if strategy_class is None:
+                return None
+            strategy = cls._instances[type_id] = strategy_class()
+        return strategy
+    
     @classmethod
     def create_graphics_item(cls, shape: BaseShape) -> Optional[Any]:
         """
@@ -51,21 +76,13 @@ class OptimizedRenderFactory:
         Returns:
             Optional[Any]: 创建的图形项
         """
-        try:
-            strategies = cls._get_strategies()
-            strategy_class = strategies.get(shape.shape_type)
-            
-            if strategy_class is None:
-                logger.warning(f"不支持的图形类型: {shape.shape_type}")
-                return None
-            
-            # 创建策略实例
-            strategy = strategy_class()
-            return strategy.create_graphics_item(shape)
-            
-        except Exception as e:
-            logger.error(f"创建图形项失败: {e}")
+        strategy = cls._get_strategy(shape.type_id)
+        if strategy is None:
+            logger.warning(f"不支持的图形类型: {shape.shape_type}")
             return None
+        
+        # 策略内部已捕获Qt调用的异常
+        return strategy.create_graphics_item(shape)
     
     @classmethod
     def update_graphics_item(cls, shape: BaseShape, graphics_item: Any) -> bool:
@@ -79,21 +96,92 @@ class OptimizedRenderFactory:
         Returns:
             bool: 更新是否成功
         """
-        try:
-            strategies = cls._get_strategies()
-            strategy_class = strategies.get(shape.shape_type)
+        strategy = cls._get_strategy(shape.type_id)
+        if strategy is None:
+            logger.warning(f"不支持的图形类型: {shape.shape_type}")
+            return False
+        
+        # 策略内部已捕获Qt调用的异常
+        return strategy.update_graphics_item(shape, graphics_item)
+    
+    @classmethod
+    def update_graphics_items(cls, items: List[Tuple[BaseShape, Any]]) -> int:
+        """
+        批量更新图形项
+        
+        Args:
+            items: (图形对象, 图形项) 列表
             
-            if strategy_class is None:
+        Returns:
+            int: 更新成功的数量
+        """
+        # 单图形快速路径：直接更新，不做批量分派
+        if len(items) == 1:
+            shape, graphics_item = items[0]
+            return 1 if cls.update_graphics_item(shape, graphics_item) else 0
+        
+        updated = 0
+        instances = cls._instances
+        for shape, graphics_item in items:
+            strategy = instances.get(shape.type_id) or cls._get_strategy(shape.type_id)
+            if strategy is None:
                 logger.warning(f"不支持的图形类型: {shape.shape_type}")
-                return False
+                continue
+            if strategy.update_graphics_item(shape, graphics_item):
+                updated += 1
+        return updated
+    
+    @classmethod
+    def create_batched_items(cls, shapes: List[BaseShape]) -> List[Any]:
+        """
+        按样式（颜色、线宽）分组批量创建图形项
+        
+        同一样式的轮廓类图形（矩形、椭圆、多边形）合并为一个 PlotDataItem，
+        各轮廓之间以 NaN 断开（connect='finite'），一次绘制调用完成；
+        同一样式的点合并为一个 ScatterPlotItem。
+        
+        Args:
+            shapes: 图形列表（均以常规样式绘制，不含悬停/选中效果）
             
-            # 创建策略实例
-            strategy = strategy_class()
-            return strategy.update_graphics_item(shape, graphics_item)
+        Returns:
+            List[Any]: 批量图形项列表（尚未添加到画布）
+        """
+        outlines: Dict[Tuple, List[np.ndarray]] = {}
+        points: Dict[Tuple, List[Tuple[float, float]]] = {}
+        gap = np.array([[np.nan, np.nan]])
+        
+        for shape in shapes:
+            key = (shape.color, shape.pen_width)
+            if shape.type_id == DT_POINT:
+                points.setdefault(key, []).append((shape.position.x(), shape.position.y()))
+                continue
             
-        except Exception as e:
-            logger.error(f"更新图形项失败: {e}")
-            return False
+            strategy = cls._get_strategy(shape.type_id)
+            data = strategy.get_outline_data(shape) if strategy is not None else None
+            if data is None:
+                continue
+            segments = outlines.setdefault(key, [])
+            segments.append(np.column_stack(data))
+            segments.append(gap)
+        
+        items = []
+        for (color, pen_width), segments in outlines.items():
+            data = np.concatenate(segments)
+            item = PlotDataItem(data[:, 0], data[:, 1], connect='finite')
+            item.setPen(create_pen(color, pen_width))
+            items.append(item)
+        
+        for (color, pen_width), positions in points.items():
+            data = np.array(positions)
+            item = ScatterPlotItem(
+                data[:, 0], data[:, 1], size=get_point_size(),
+                pen=create_pen(color, pen_width), brush=create_brush(color), symbol='o'
+            )
+            items.append(item)
+        
+        for item in items:
+            set_sprite_cache(item, True)
+        return items
     
     @classmethod
     def register_strategy(cls, shape_type: DrawType, strategy_class: Type[BaseRenderStrategy]) -> None:
@@ -105,7 +193,8 @@ class OptimizedRenderFactory:
             strategy_class: 策略类
         """
         strategies = cls._get_strategies()
-        strategies[shape_type] = strategy_class
+        strategies[int(shape_type)] = strategy_class
+        cls._instances.pop(int(shape_type), None)
         logger.info(f"注册渲染策略: {shape_type} -> {strategy_class.__name__}")
     
     @classmethod
@@ -117,7 +206,7 @@ class OptimizedRenderFactory:
             list: 支持的图形类型列表
         """
         strategies = cls._get_strategies()
-        return list(strategies.keys())
+        return [DrawType(type_id) for type_id in strategies]
     
     @classmethod
     def is_supported_type(cls, shape_type: DrawType) -> bool:
@@ -131,4 +220,4 @@ class OptimizedRenderFactory:
             bool: 是否支持
         """
         strategies = cls._get_strategies()
-        return shape_type in strategies
+        return int(shape_type) in strategies
@@ -63,8 +63,10 @@ class PointRenderStrategy(BaseRenderStrategy[PointShape]):
             bool: 更新是否成功
         """
         try:
-            # 更新位置
-            graphics_item.setData([shape.position.x()], [shape.position.y()])
+            # 更新位置（几何未变化时跳过，保留已缓存的绘制数据）
+            if self._geometry_changed(shape, graphics_item):
+                graphics_item.setData([shape.position.x()], [shape.position.y()])
+                self._mark_geometry_synced(shape, graphics_item)
             
             # 更新渲染属性
             size = get_point_size(shape.is_hovered())
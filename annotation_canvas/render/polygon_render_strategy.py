@@ -2,8 +2,8 @@
 多边形图形渲染策略 - 优化版本
 """
 
-from typing import Optional, List
-from PySide6.QtCore import QPointF
+from typing import Optional
+import numpy as np
 import pyqtgraph as pg
 from pyqtgraph import PlotDataItem
 
@@ -31,7 +31,7 @@ class PolygonRenderStrategy(BaseRenderStrategy[PolygonShape]):
         """
         try:
             # 获取多边形顶点
-            vertices = shape.get_vertices()
+            vertices = shape.get_vertex_array()
             if len(vertices) < 2:
                 logger.warning("多边形顶点数量不足")
                 return None
@@ -72,17 +72,20 @@ class PolygonRenderStrategy(BaseRenderStrategy[PolygonShape]):
             bool: 更新是否成功
         """
         try:
-            # 获取多边形顶点
-            vertices = shape.get_vertices()
-            if len(vertices) < 2:
-                logger.warning("多边形顶点数量不足")
-                return False
-            
-            # 生成多边形点数据
-            x_data, y_data = self._generate_polygon_points(vertices, shape.closed)
-            
-            # 更新数据
-            graphics_item.setData(x_data, y_data)
+            # 几何（含闭合状态）未变化时跳过点数据重建，保留已缓存的绘制数据
+            if self._geometry_changed(shape, graphics_item, shape.closed):
+                # 获取多边形顶点
+                vertices = shape.get_vertex_array()
+                if len(vertices) < 2:
+                    logger.warning("多边形顶点数量不足")
+                    return False
+                
+                # 生成多边形点数据
+                x_data, y_data = self._generate_polygon_points(vertices, shape.closed)
+                
+                # 更新数据
+                graphics_item.setData(x_data, y_data)
+                self._mark_geometry_synced(shape, graphics_item, shape.closed)
             
             # 更新画笔
             pen = create_pen(shape.color, shape.pen_width, shape.is_hovered())
@@ -97,26 +100,38 @@ class PolygonRenderStrategy(BaseRenderStrategy[PolygonShape]):
             logger.error(f"更新多边形图形项失败: {e}")
             return False
     
-    def _generate_polygon_points(self, vertices: List[QPointF], is_closed: bool) -> tuple:
+    def get_outline_data(self, shape: PolygonShape) -> Optional[tuple]:
+        """
+        生成多边形轮廓数据
+        
+        Args:
+            shape: 多边形图形对象
+            
+        Returns:
+            Optional[tuple]: (x_data, y_data)，顶点不足时返回None
+        """
+        vertices = shape.get_vertex_array()
+        if len(vertices) < 2:
+            return None
+        return self._generate_polygon_points(vertices, shape.closed)
+    
+    def _generate_polygon_points(self, vertices: np.ndarray, is_closed: bool) -> tuple:
         """
         生成多边形点数据
         
         Args:
-            vertices: 顶点列表
+            vertices: (n, 2) 顶点数组
             is_closed: 是否闭合
             
         Returns:
             tuple: (x_data, y_data) 多边形点数据
         """
-        x_data = [vertex.x() for vertex in vertices]
-        y_data = [vertex.y() for vertex in vertices]
-        
         # 如果闭合，添加起始点
         if is_closed and len(vertices) > 2:
-            x_data.append(vertices[0].x())
-            y_data.append(vertices[0].y())
+            vertices = np.vstack((vertices, vertices[:1]))
         
-        return x_data, y_data
+        # 复制出独立数组，避免图形项引用顶点数组后被原地移动修改
+        return vertices[:, 0].copy(), vertices[:, 1].copy()
     
     def get_shape_type(self) -> DrawType:
         """
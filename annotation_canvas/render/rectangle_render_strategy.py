@@ -30,17 +30,8 @@ class RectangleRenderStrategy(BaseRenderStrategy[RectangleShape]):
             Optional[PlotDataItem]: 创建的矩形图形项
         """
         try:
-            # 获取矩形顶点
-            start = shape.get_start_point()
-            end = shape.get_end_point()
-            
-            # 计算矩形的四个角点
-            x1, y1 = start.x(), start.y()
-            x2, y2 = end.x(), end.y()
-            
             # 创建闭合的矩形路径
-            x_data = [x1, x2, x2, x1, x1]
-            y_data = [y1, y1, y2, y2, y1]
+            x_data, y_data = self.get_outline_data(shape)
             
             # 创建画笔
             pen = create_pen(shape.color, shape.pen_width, shape.is_hovered())
@@ -75,20 +66,11 @@ class RectangleRenderStrategy(BaseRenderStrategy[RectangleShape]):
             bool: 更新是否成功
         """
         try:
-            # 获取矩形顶点
-            start = shape.get_start_point()
-            end = shape.get_end_point()
-            
-            # 计算矩形的四个角点
-            x1, y1 = start.x(), start.y()
-            x2, y2 = end.x(), end.y()
-            
-            # 创建闭合的矩形路径
-            x_data = [x1, x2, x2, x1, x1]
-            y_data = [y1, y1, y2, y2, y1]
-            
-            # 更新数据
-            graphics_item.setData(x_data, y_data)
+            # 几何未变化时跳过路径重建，保留已缓存的绘制数据
+            if self._geometry_changed(shape, graphics_item):
+                x_data, y_data = self.get_outline_data(shape)
+                graphics_item.setData(x_data, y_data)
+                self._mark_geometry_synced(shape, graphics_item)
             
             # 更新画笔
             pen = create_pen(shape.color, shape.pen_width, shape.is_hovered())
@@ -103,6 +85,27 @@ class RectangleRenderStrategy(BaseRenderStrategy[RectangleShape]):
             logger.error(f"更新矩形图形项失败: {e}")
             return False
     
+    def get_outline_data(self, shape: RectangleShape) -> tuple:
+        """
+        生成矩形闭合轮廓数据
+        
+        Args:
+            shape: 矩形图形对象
+            
+        Returns:
+            tuple: (x_data, y_data) 矩形轮廓点数据
+        """
+        # 获取矩形顶点
+        start = shape.get_start_point()
+        end = shape.get_end_point()
+        
+        # 计算矩形的四个角点
+        x1, y1 = start.x(), start.y()
+        x2, y2 = end.x(), end.y()
+        
+        # 创建闭合的矩形路径
+        return [x1, x2, x2, x1, x1], [y1, y1, y2, y2, y1]
+    
     def get_shape_type(self) -> DrawType:
         """
         获取支持的图形类型
@@ -16,6 +16,25 @@ logger = get_logger(__name__)
 class RenderProperties:
     """渲染属性管理器"""
     
+    # 颜色 -> RGB、线宽 -> 数值（类级常量，查询时不再每次构造映射表）
+    _COLOR_RGB = {
+        DrawColor.RED: (255, 0, 0),
+        DrawColor.GREEN: (0, 255, 0),
+        DrawColor.BLUE: (0, 0, 255),
+        DrawColor.YELLOW: (255, 255, 0),
+        DrawColor.PURPLE: (128, 0, 128),
+        DrawColor.ORANGE: (255, 165, 0),
+        DrawColor.BLACK: (0, 0, 0),
+        DrawColor.WHITE: (255, 255, 255),
+    }
+    _LINE_WIDTH = {
+        PenWidth.THIN: 1,
+        PenWidth.MEDIUM: 2,
+        PenWidth.THICK: 3,
+        PenWidth.ULTRA_THIN: 0.5,
+        PenWidth.ULTRA_THICK: 5,
+    }
+    
     @staticmethod
     def get_color_rgb(color: DrawColor) -> Tuple[int, int, int]:
         """
@@ -27,17 +46,7 @@ class RenderProperties:
         Returns:
             Tuple[int, int, int]: RGB值
         """
-        color_map = {
-            DrawColor.RED: (255, 0, 0),
-            DrawColor.GREEN: (0, 255, 0),
-            DrawColor.BLUE: (0, 0, 255),
-            DrawColor.YELLOW: (255, 255, 0),
-            DrawColor.PURPLE: (128, 0, 128),
-            DrawColor.ORANGE: (255, 165, 0),
-            DrawColor.BLACK: (0, 0, 0),
-            DrawColor.WHITE: (255, 255, 255),
-        }
-        return color_map.get(color, (255, 0, 0))
+        return RenderProperties._COLOR_RGB.get(color, (255, 0, 0))
     
     @staticmethod
     def get_line_width(pen_width: PenWidth) -> int:
@@ -50,14 +59,7 @@ class RenderProperties:
         Returns:
             int: 线宽数值
         """
-        width_map = {
-            PenWidth.THIN: 1,
-            PenWidth.MEDIUM: 2,
-            PenWidth.THICK: 3,
-            PenWidth.ULTRA_THIN: 0.5,
-            PenWidth.ULTRA_THICK: 5,
-        }
-        return width_map.get(pen_width, 2)
+        return RenderProperties._LINE_WIDTH.get(pen_width, 2)
     
     @staticmethod
     def create_pen(color: DrawColor, pen_width: PenWidth, is_hovered: bool = False) -> pg.mkPen:
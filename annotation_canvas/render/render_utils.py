@@ -2,8 +2,9 @@
 渲染工具函数 - 简化的渲染相关工具
 """
 
-from typing import Tuple
+from typing import Tuple, Dict, Any
 import pyqtgraph as pg
+from PySide6.QtWidgets import QGraphicsItem
 
 from ..core import DrawColor, PenWidth
 from ..utils.constants import DisplayConstants, ColorConstants
@@ -31,6 +32,94 @@ PEN_WIDTH_MAP = {
 }
 
 
+# 画笔/画刷缓存（hash-consing）：相同样式共享同一个Qt对象，避免每次绘制都重新构造
+_PEN_CACHE: Dict[Tuple[Any, float], Any] = {}
+_BRUSH_CACHE: Dict[Any, Any] = {}
+
+
+def make_pen(color: Any, width: float) -> pg.mkPen:
+    """
+    获取共享画笔
+    
+    Args:
+        color: 可哈希的颜色值（RGB元组、颜色字符串等）
+        width: 线宽
+        
+    Note:
+        返回的画笔被多个图形项共享，调用方不应修改
+    """
+    key = (color, width)
+    pen = _PEN_CACHE.get(key)
+    if pen is None:
+        pen = _PEN_CACHE[key] = pg.mkPen(color=color, width=width)
+    return pen
+
+
+def make_brush(color: Any) -> pg.mkBrush:
+    """获取共享画刷（调用方不应修改）"""
+    brush = _BRUSH_CACHE.get(color)
+    if brush is None:
+        brush = _BRUSH_CACHE[color] = pg.mkBrush(color=color)
+    return brush
+
+
+class StyleRecord:
+    """样式记录 - 一种（颜色, 线宽）组合解析后的绘制参数，由 StylePalette 统一持有"""
+    
+    __slots__ = ('color', 'pen_width', 'rgb', 'width', '_pen', '_hover_pen')
+    
+    def __init__(self, color: DrawColor, pen_width: PenWidth):
+        self.color = color
+        self.pen_width = pen_width
+        self.rgb = COLOR_RGB_MAP.get(color, (255, 0, 0))
+        self.width = PEN_WIDTH_MAP.get(pen_width, 2)
+        # 画笔在首次使用时创建
+        self._pen = None
+        self._hover_pen = None
+    
+    @property
+    def pen(self) -> pg.mkPen:
+        """普通画笔（共享，调用方不应修改）"""
+        pen = self._pen
+        if pen is None:
+            pen = self._pen = make_pen(self.rgb, self.width)
+        return pen
+    
+    @property
+    def hover_pen(self) -> pg.mkPen:
+        """悬停画笔（线宽加粗，共享，调用方不应修改）"""
+        pen = self._hover_pen
+        if pen is None:
+            pen = self._hover_pen = make_pen(self.rgb, self.width + DisplayConstants.HOVER_WIDTH_INCREASE)
+        return pen
+
+
+class StylePalette:
+    """
+    样式调色板（享元）
+    
+    每种（颜色, 线宽）组合只登记一次；
+    绘制时一次字典查找即可取得解析好的RGB、线宽与共享画笔
+    """
+    
+    _records: Dict[Tuple[DrawColor, PenWidth], StyleRecord] = {}
+    
+    @classmethod
+    def intern(cls, color: DrawColor, pen_width: PenWidth) -> StyleRecord:
+        """
+        获取（必要时登记）样式记录
+        
+        Args:
+            color: 颜色
+            pen_width: 线宽
+        """
+        key = (color, pen_width)
+        record = cls._records.get(key)
+        if record is None:
+            record = cls._records[key] = StyleRecord(color, pen_width)
+        return record
+
+
 def get_color_rgb(color: DrawColor) -> Tuple[int, int, int]:
     """获取颜色的RGB值"""
     return COLOR_RGB_MAP.get(color, (255, 0, 0))
@@ -42,25 +131,39 @@ def get_line_width(pen_width: PenWidth) -> int:
 
 
 def create_pen(color: DrawColor, pen_width: PenWidth, is_hovered: bool = False) -> pg.mkPen:
-    """创建画笔"""
-    rgb_color = get_color_rgb(color)
-    width = get_line_width(pen_width)
-    
-    if is_hovered:
-        width += DisplayConstants.HOVER_WIDTH_INCREASE
-    
-    return pg.mkPen(color=rgb_color, width=width)
+    """创建画笔（经样式调色板取共享画笔）"""
+    record = StylePalette.intern(color, pen_width)
+    return record.hover_pen if is_hovered else record.pen
 
 
 def create_brush(color: DrawColor) -> pg.mkBrush:
     """创建画刷"""
     rgb_color = get_color_rgb(color)
-    return pg.mkBrush(color=rgb_color)
+    return make_brush(rgb_color)
 
 
 def create_hover_pen() -> pg.mkPen:
     """创建悬停高亮画笔"""
-    return pg.mkPen(color=ColorConstants.SHAPE_HOVER, width=2)
+    return make_pen(ColorConstants.SHAPE_HOVER, 2)
+
+
+def set_sprite_cache(graphics_item: Any, enabled: bool) -> None:
+    """
+    启用/关闭图形项的位图缓存
+    
+    使用 DeviceCoordinateCache：图形项按设备坐标光栅化为 QPixmap，
+    平移视图或其他图形重绘时直接贴图；图形项调用 update()（数据变化）
+    或视图缩放时由 Qt 自动重建。PlotDataItem 自身不绘制，
+    实际绘制由其子项（curve/scatter）完成，因此子项也需要设置。
+    
+    Args:
+        graphics_item: 图形项
+        enabled: 是否启用缓存（正在拖拽/预览的图形每帧都变化，应关闭）
+    """
+    mode = QGraphicsItem.CacheMode.DeviceCoordinateCache if enabled else QGraphicsItem.CacheMode.NoCache
+    for item in (graphics_item, getattr(graphics_item, 'curve', None), getattr(graphics_item, 'scatter', None)):
+        if item is not None and item.cacheMode() != mode:
+            item.setCacheMode(mode)
 
 
 def get_point_size(is_hovered: bool = False) -> float:
@@ -4,6 +4,7 @@ Z轴层级管理器 - 统一处理图形项的Z轴设置
 
 from typing import Any, Optional
 from ..utils.logger import get_logger
+from ..utils.z_axis_utils import is_valid_z_order, clamp_z_order
 
 logger = get_logger(__name__)
 
@@ -28,7 +29,6 @@ class ZAxisManager:
             return False
         
         # 验证Z轴层级值
-        from ..utils.z_axis_utils import is_valid_z_order, clamp_z_order
         if not is_valid_z_order(z_order):
             logger.warning(f"Z轴层级值 {z_order} 无效，已自动修正")
             z_order = clamp_z_order(z_order)
@@ -3,5 +3,6 @@
 """
 
 from .shape_creation_service import ShapeCreationService
+from .spatial_index import SpatialIndex
 
-__all__ = ['ShapeCreationService']
+__all__ = ['ShapeCreationService', 'SpatialIndex']
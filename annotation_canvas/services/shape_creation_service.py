@@ -6,9 +6,10 @@ from typing import Optional
 from PySide6.QtCore import QPointF
 
 from ..events import EventBus, Event, EventType
-from ..core import DrawType, DrawColor, PenWidth
+from ..core import DrawType, DrawColor, PenWidth, DT_RECTANGLE, DT_ELLIPSE, DT_POLYGON
 from ..models import BaseShape
 from ..factories import ShapeFactory
+from ..operations import CreateOperation
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -50,12 +51,11 @@ class ShapeCreationService:
             
             # 通过操作管理器执行创建操作
             if self.operation_manager:
-                from ..operations import CreateOperation
                 description = self._generate_description(shape_type, shape, **kwargs)
                 create_operation = CreateOperation(shape, self.data_manager, description)
                 self.operation_manager.execute_operation(create_operation)
                 # 触发显示更新
-                self.event_bus.publish(Event(EventType.DISPLAY_UPDATE_REQUESTED))
+                self.event_bus.publish_transient(EventType.DISPLAY_UPDATE_REQUESTED)
                 # 自动选中新创建的图形
                 self.data_manager.select_shape(shape)
             else:
@@ -118,15 +118,16 @@ class ShapeCreationService:
                 return False
             
             # 根据图形类型更新
-            if shape.shape_type == DrawType.RECTANGLE:
+            type_id = shape.type_id
+            if type_id == DT_RECTANGLE:
                 if 'end_point' in kwargs:
                     shape.set_end_point(kwargs['end_point'])
-            elif shape.shape_type == DrawType.ELLIPSE:
+            elif type_id == DT_ELLIPSE:
                 if 'end_point' in kwargs:
                     shape.set_end_point(kwargs['end_point'])
-            elif shape.shape_type == DrawType.POLYGON:
+            elif type_id == DT_POLYGON:
                 if 'vertices' in kwargs:
-                    shape.vertices = kwargs['vertices'].copy()
+                    shape.set_vertices(kwargs['vertices'])
                 if 'closed' in kwargs:
                     shape.closed = kwargs['closed']
             
@@ -158,12 +159,11 @@ class ShapeCreationService:
             
             # 通过操作管理器执行创建操作
             if self.operation_manager:
-                from ..operations import CreateOperation
                 description = self._generate_description(shape.shape_type, shape)
                 create_operation = CreateOperation(shape, self.data_manager, description)
                 self.operation_manager.execute_operation(create_operation)
                 # 触发显示更新
-                self.event_bus.publish(Event(EventType.DISPLAY_UPDATE_REQUESTED))
+                self.event_bus.publish_transient(EventType.DISPLAY_UPDATE_REQUESTED)
                 # 自动选中新创建的图形
                 self.data_manager.select_shape(shape)
             else:
@@ -0,0 +1,122 @@
+"""
+空间索引服务 - 基于均匀网格的图形空间索引，加速命中检测与区域查询
+"""
+
+import math
+from typing import Dict, Set, Tuple, Optional
+
+from ..models import BaseShape
+from ..utils.constants import InteractionConstants
+
+
+class SpatialIndex:
+    """均匀网格空间索引 - 按图形边界把图形登记到覆盖的网格单元中"""
+
+    def __init__(self, cell_size: float = None, max_cells: int = None):
+        """
+        初始化空间索引
+
+        Args:
+            cell_size: 网格单元大小（世界坐标）
+            max_cells: 单个图形最多登记的网格数，超出则视为大图形单独存放
+        """
+        self._cell_size = cell_size or InteractionConstants.SPATIAL_INDEX_CELL_SIZE
+        self._max_cells = max_cells or InteractionConstants.SPATIAL_INDEX_MAX_CELLS
+        self._cells: Dict[Tuple[int, int], Set[BaseShape]] = {}
+        self._shape_cells: Dict[BaseShape, Optional[Tuple[int, int, int, int]]] = {}
+        self._large_shapes: Set[BaseShape] = set()
+
+    def __len__(self) -> int:
+        return len(self._shape_cells)
+
+    def __contains__(self, shape: BaseShape) -> bool:
+        return shape in self._shape_cells
+
+    def _cell_range(self, x0: float, y0: float, x1: float, y1: float) -> Tuple[int, int, int, int]:
+        """计算矩形覆盖的网格范围"""
+        size = self._cell_size
+        return (math.floor(x0 / size), math.floor(y0 / size),
+                math.floor(x1 / size), math.floor(y1 / size))
+
+    def insert(self, shape: BaseShape) -> None:
+        """登记图形"""
+        if shape in self._shape_cells:
+            self.remove(shape)
+
+        bounds = shape.get_bounds()
+        cell_range = self._cell_range(bounds.left(), bounds.top(), bounds.right(), bounds.bottom())
+        cx0, cy0, cx1, cy1 = cell_range
+
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > self._max_cells:
+            self._large_shapes.add(shape)
+            self._shape_cells[shape] = None
+            return
+
+        cells = self._cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    bucket = cells[(cx, cy)] = set()
+                bucket.add(shape)
+        self._shape_cells[shape] = cell_range
+
+    def remove(self, shape: BaseShape) -> bool:
+        """移除图形"""
+        if shape not in self._shape_cells:
+            return False
+
+        cell_range = self._shape_cells.pop(shape)
+        if cell_range is None:
+            self._large_shapes.discard(shape)
+            return True
+
+        cx0, cy0, cx1, cy1 = cell_range
+        cells = self._cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(shape)
+                    if not bucket:
+                        del cells[(cx, cy)]
+        return True
+
+    def update(self, shape: BaseShape) -> None:
+        """图形几何变化后重新登记"""
+        self.insert(shape)
+
+    def clear(self) -> None:
+        """清空索引"""
+        self._cells.clear()
+        self._shape_cells.clear()
+        self._large_shapes.clear()
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> Set[BaseShape]:
+        """
+        查询与矩形所在网格重叠的候选图形
+
+        Note:
+            结果是候选集合，调用方仍需做精确检测
+        """
+        cx0, cy0, cx1, cy1 = self._cell_range(x0, y0, x1, y1)
+        result = set(self._large_shapes)
+        cells = self._cells
+
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(cells):
+            # 查询范围比已占用的网格还多时，直接遍历已占用网格
+            for (cx, cy), bucket in cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    result.update(bucket)
+            return result
+
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    result.update(bucket)
+        return result
+
+    def query_point(self, x: float, y: float, tolerance: float = 0.0) -> Set[BaseShape]:
+        """查询指定点（含容差）附近的候选图形"""
+        return self.query_rect(x - tolerance, y - tolerance, x + tolerance, y + tolerance)
@@ -3,17 +3,21 @@
 """
 
 from typing import Optional, Dict, Any
-from PySide6.QtCore import QPointF
+from PySide6.QtCore import QPointF, QRectF
 
-from ..events import EventBus, Event, EventType, EventHandlerBase
+from ..events import EventBus, Event, EventType, EventHandlerBase, MouseMoveData
 from ..core import OperationState, DrawType, DrawColor, PenWidth
 from ..data import DataManager
 from ..models import BaseShape, PolygonShape
 from ..factories import ShapeFactory
 from ..services import ShapeCreationService
+from ..operations import MoveOperation, ScaleOperation
 from ..utils.constants import InteractionConstants
 from ..utils.geometry import GeometryUtils
 from ..utils.config import Config
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class StateManager(EventHandlerBase):
@@ -42,6 +46,8 @@ class StateManager(EventHandlerBase):
         self.drag_start_control_point: Optional[Any] = None
         self.polygon_vertices: list = []
         self.temp_polygon: Optional[PolygonShape] = None  # 持久的临时多边形对象
+        self.drag_start_bounds: Optional[QRectF] = None  # 拖拽开始时的图形边界（用于局部重绘）
+        self.last_drag_bounds: Optional[QRectF] = None   # 上一帧拖拽预览的图形边界
     
     def _register_event_handlers(self) -> None:
         """注册事件处理器"""
@@ -56,8 +62,9 @@ class StateManager(EventHandlerBase):
     
     def _on_mouse_press(self, event: Event) -> None:
         """处理鼠标按下事件"""
-        pos = event.data['position']
-        pixel_size = event.data.get('pixel_size', InteractionConstants.DEFAULT_PIXEL_SIZE)
+        data = event.data
+        pos = data.position
+        pixel_size = data.pixel_size
         
         # 获取命中目标
         hit_target = self._get_hit_target(pos, pixel_size)
@@ -70,9 +77,10 @@ class StateManager(EventHandlerBase):
     
     def _on_mouse_move(self, event: Event) -> None:
         """处理鼠标移动事件"""
-        pos = event.data['position']
-        dragging = event.data.get('dragging', False)
-        pixel_size = event.data.get('pixel_size', InteractionConstants.DEFAULT_PIXEL_SIZE)
+        data = MouseMoveData.from_data(event.data)  # 滚轮事件仍以字典发布
+        pos = data.position
+        dragging = data.dragging
+        pixel_size = data.pixel_size
         
         # 处理悬停检测（在空闲状态下）
         if self.current_state == OperationState.IDLE:
@@ -93,8 +101,9 @@ class StateManager(EventHandlerBase):
     
     def _on_mouse_release(self, event: Event) -> None:
         """处理鼠标释放事件"""
-        pos = event.data['position']
-        left_pressed = event.data['left_button_pressed']
+        data = event.data
+        pos = data.position
+        left_pressed = data.left_button_pressed
         
         if left_pressed:
             return  # 左键仍然按下，不处理
@@ -135,17 +144,10 @@ class StateManager(EventHandlerBase):
         if not selected_shape:
             return
         
-        # 检查是否有控制点被悬停
-        hovered_control_point = None
-        for cp in selected_shape.get_control_points():
-            # 计算世界坐标距离
-            world_distance = GeometryUtils.distance_between_points(pos, cp.position)
-            # 转换为像素距离
-            pixel_distance = world_distance / pixel_size if pixel_size > 0 else world_distance
-            
-            if pixel_distance <= InteractionConstants.CONTROL_POINT_TOLERANCE:
-                hovered_control_point = cp
-                break
+        # 检查是否有控制点被悬停（像素容差换算为世界坐标容差）
+        pixel_tolerance = InteractionConstants.CONTROL_POINT_TOLERANCE
+        tolerance = pixel_tolerance * pixel_size if pixel_size > 0 else pixel_tolerance
+        hovered_control_point = selected_shape.find_control_point(pos, tolerance)
         
         # 更新控制点悬停状态
         for cp in selected_shape.get_control_points():
@@ -154,10 +156,10 @@ class StateManager(EventHandlerBase):
             
             # 如果悬停状态改变，更新显示
             if was_hovered != cp.hovered:
-                self.event_bus.publish(Event(
+                self.event_bus.publish_transient(
                     EventType.CONTROL_POINT_HOVER_CHANGED,
                     {'control_point': cp, 'hovered': cp.hovered}
-                ))
+                )
     
     def _handle_shape_hover(self, pos: QPointF, pixel_size: float) -> None:
         """处理图形悬停检测"""
@@ -175,18 +177,18 @@ class StateManager(EventHandlerBase):
             # 清除旧图形的悬停状态
             if current_hovered:
                 current_hovered.set_hovered(False)
-                self.event_bus.publish(Event(
+                self.event_bus.publish_transient(
                     EventType.HOVER_CHANGED,
                     {'shape': current_hovered, 'hovered': False}
-                ))
+                )
             
             # 设置新图形的悬停状态
             if hovered_shape:
                 hovered_shape.set_hovered(True)
-                self.event_bus.publish(Event(
+                self.event_bus.publish_transient(
                     EventType.HOVER_CHANGED,
                     {'shape': hovered_shape, 'hovered': True}
-                ))
+                )
             
             # 直接更新数据管理器的内部状态，避免重复发布事件
             self.data_manager._hovered_shape = hovered_shape
@@ -205,6 +207,7 @@ class StateManager(EventHandlerBase):
             self.drag_start_pos = pos
             # 记录缩放开始时的控制点位置
             self.scale_start_pos = self.drag_start_control_point.position
+            self.drag_start_bounds = self.last_drag_bounds = self.drag_start_shape.get_bounds()
             self._change_state(OperationState.SCALING)
             
         elif hit_type == 'shape':
@@ -219,6 +222,7 @@ class StateManager(EventHandlerBase):
                 self.move_start_shape_pos = self.drag_start_shape.get_center()
             else:
                 self.move_start_shape_pos = QPointF(0, 0)
+            self.drag_start_bounds = self.last_drag_bounds = self.drag_start_shape.get_bounds()
             self.data_manager.select_shape(hit_target['target'])
             self._change_state(OperationState.MOVING)
             
@@ -288,10 +292,10 @@ class StateManager(EventHandlerBase):
             elif hasattr(self.drag_start_shape, 'set_center'):
                 self.drag_start_shape.set_center(new_position)
         
-        # 发布图形更新事件
+        # 发布图形更新事件（附带上一帧与当前帧边界的并集作为重绘区域）
         self.event_bus.publish(Event(
             EventType.SHAPE_UPDATED,
-            {'shape': self.drag_start_shape}
+            {'shape': self.drag_start_shape, 'dirty_rect': self._take_drag_dirty_rect()}
         ))
     
     def _handle_scaling(self, pos: QPointF, dragging: bool) -> None:
@@ -316,12 +320,25 @@ class StateManager(EventHandlerBase):
                 snapped_pos
             )
         
-        # 发布图形更新事件
+        # 发布图形更新事件（附带上一帧与当前帧边界的并集作为重绘区域）
         self.event_bus.publish(Event(
             EventType.SHAPE_UPDATED,
-            {'shape': self.drag_start_shape}
+            {'shape': self.drag_start_shape, 'dirty_rect': self._take_drag_dirty_rect()}
         ))
     
+    def _take_drag_dirty_rect(self) -> Optional[QRectF]:
+        """计算拖拽预览的重绘区域，并记录当前边界供下一帧使用"""
+        new_bounds = self.drag_start_shape.get_bounds()
+        dirty_rect = self.last_drag_bounds.united(new_bounds) if self.last_drag_bounds is not None else None
+        self.last_drag_bounds = new_bounds
+        return dirty_rect
+    
+    def _get_drag_total_dirty_rect(self) -> Optional[QRectF]:
+        """计算整个拖拽过程的重绘区域（起始边界∪最终边界）"""
+        if self.drag_start_bounds is None:
+            return None
+        return self.drag_start_bounds.united(self.drag_start_shape.get_bounds())
+    
     def _handle_creating_rect(self, pos: QPointF, dragging: bool) -> None:
         """处理矩形创建"""
         if not dragging or not self.drag_start_pos:
@@ -450,10 +467,10 @@ class StateManager(EventHandlerBase):
         self.data_manager.set_temp_shape(None)
         
         # 强制清理显示缓存
-        self.event_bus.publish(Event(
+        self.event_bus.publish_transient(
             EventType.DISPLAY_UPDATE_REQUESTED,
             {'clear_temp': True, 'force_cleanup': True}
-        ))
+        )
         
         # 回到空闲状态
         self._change_state(OperationState.IDLE)
@@ -516,7 +533,6 @@ class StateManager(EventHandlerBase):
             if total_mouse_offset.x() != 0 or total_mouse_offset.y() != 0:
                 # 通过操作管理器执行移动操作
                 if self.operation_manager:
-                    from ..operations import MoveOperation
                     move_operation = MoveOperation(
                         [self.drag_start_shape], 
                         total_mouse_offset,
@@ -525,21 +541,20 @@ class StateManager(EventHandlerBase):
                     )
                     self.operation_manager.execute_operation(move_operation)
                     
-                    # 发布移动事件
+                    # 发布移动事件（只重绘受影响区域，不再触发全量显示更新）
                     self.event_bus.publish(Event(
                         EventType.SHAPE_UPDATED,
                         {
                             'shape': self.drag_start_shape,
-                            'update_type': 'move'
+                            'update_type': 'move',
+                            'dirty_rect': self._get_drag_total_dirty_rect()
                         }
                     ))
-                    
-                    # 触发显示更新
-                    self.event_bus.publish(Event(EventType.DISPLAY_UPDATE_REQUESTED))
         
         # 清理临时数据
         self.drag_start_shape = None
         self.drag_start_pos = None
+        self.drag_start_bounds = self.last_drag_bounds = None
         if hasattr(self, 'move_start_mouse_pos'):
             self.move_start_mouse_pos = None
         if hasattr(self, 'move_start_shape_pos'):
@@ -559,7 +574,6 @@ class StateManager(EventHandlerBase):
             if scale_offset.x() != 0 or scale_offset.y() != 0:
                 # 通过操作管理器执行缩放操作
                 if self.operation_manager:
-                    from ..operations import ScaleOperation
                     scale_operation = ScaleOperation(
                         self.drag_start_shape,
                         self.drag_start_control_point,
@@ -570,22 +584,21 @@ class StateManager(EventHandlerBase):
                     )
                     self.operation_manager.execute_operation(scale_operation)
                     
-                    # 发布修改事件
+                    # 发布修改事件（只重绘受影响区域，不再触发全量显示更新）
                     self.event_bus.publish(Event(
                         EventType.SHAPE_UPDATED,
                         {
                             'shape': self.drag_start_shape,
-                            'update_type': 'modify'
+                            'update_type': 'modify',
+                            'dirty_rect': self._get_drag_total_dirty_rect()
                         }
                     ))
-                    
-                    # 触发显示更新
-                    self.event_bus.publish(Event(EventType.DISPLAY_UPDATE_REQUESTED))
         
         # 清理临时数据
         self.drag_start_shape = None
         self.drag_start_control_point = None
         self.drag_start_pos = None
+        self.drag_start_bounds = self.last_drag_bounds = None
         if hasattr(self, 'scale_start_pos'):
             self.scale_start_pos = None
     
@@ -619,9 +632,6 @@ class StateManager(EventHandlerBase):
     
     def cleanup(self) -> None:
         """清理资源"""
-        from ..utils.logger import get_logger
-        logger = get_logger(__name__)
-        
         # 取消所有事件订阅
         if hasattr(self, '_event_handlers') and self._event_handlers:
             for event_type, handler in self._event_handlers.items():
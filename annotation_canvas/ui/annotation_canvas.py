@@ -3,12 +3,13 @@
 """
 
 from typing import Optional, List
-from PySide6.QtCore import QPointF, Qt, Signal, QTimer
+from PySide6.QtCore import QPointF, QRectF, Qt, Signal, QTimer
 from PySide6.QtGui import QMouseEvent, QKeyEvent, QWheelEvent
 import pyqtgraph as pg
 
 from ..core import DrawType, DrawColor, PenWidth
 from ..models import BaseShape
+from ..events import EventBus, Event, EventType
 from ..utils.constants import (
     AppConstants, CanvasConstants, InteractionConstants, 
     DisplayConstants, ColorConstants
@@ -53,7 +54,6 @@ class AnnotationCanvas(pg.PlotWidget):
         self.controller = AnnotationController(self, self.container)
         
         # 从容器获取事件总线
-        from ..events import EventBus
         self.event_bus = self.container.get(EventBus)
         
         # 设置事件处理
@@ -117,8 +117,6 @@ class AnnotationCanvas(pg.PlotWidget):
             pos = event  # event本身就是QPointF
             world_pos = self.plotItem.vb.mapSceneToView(pos)
             # 创建一个模拟的QMouseEvent用于InputHandler
-            from PySide6.QtGui import QMouseEvent
-            from PySide6.QtCore import Qt
             mock_event = QMouseEvent(QMouseEvent.MouseMove, pos, Qt.LeftButton, Qt.LeftButton, Qt.NoModifier)
             self.controller.input_handler.handle_mouse_move(mock_event, world_pos)
         # 默认模式：不处理，让PyQtGraph处理（拖拽坐标系）
@@ -182,7 +180,6 @@ class AnnotationCanvas(pg.PlotWidget):
     # 公共API - 使用事件驱动的方式
     def set_draw_tool(self, tool: DrawType) -> None:
         """设置绘制工具"""
-        from ..events import Event, EventType
         self.controller.data_manager.set_current_tool(tool)
         self.controller.event_bus.publish(Event(EventType.TOOL_CHANGED, {
             'tool': tool
@@ -190,7 +187,6 @@ class AnnotationCanvas(pg.PlotWidget):
     
     def set_draw_color(self, color: DrawColor) -> None:
         """设置绘制颜色"""
-        from ..events import Event, EventType
         self.controller.data_manager.set_current_color(color)
         self.controller.event_bus.publish(Event(EventType.COLOR_CHANGED, {
             'color': color
@@ -198,7 +194,6 @@ class AnnotationCanvas(pg.PlotWidget):
     
     def set_pen_width(self, width: PenWidth) -> None:
         """设置画笔宽度"""
-        from ..events import Event, EventType
         self.controller.data_manager.set_current_width(width)
         self.controller.event_bus.publish(Event(EventType.WIDTH_CHANGED, {
             'width': width
@@ -244,10 +239,21 @@ class AnnotationCanvas(pg.PlotWidget):
         """获取指定位置的图形（事件驱动）"""
         return self.controller.get_shape_at_position(position, tolerance)
     
+    def update_region(self, rect: QRectF) -> None:
+        """
+        只重绘指定区域
+        
+        Args:
+            rect: 需要重绘的区域（世界坐标）
+        """
+        if rect.isNull():
+            return
+        scene_rect = self.plotItem.vb.mapViewToScene(rect).boundingRect()
+        self.scene().update(scene_rect)
+    
     # Z轴管理
     def set_shape_z_order(self, shape: BaseShape, z_order: int) -> None:
         """设置图形的z轴层级"""
-        from ..events import Event, EventType
         shape.set_z_order(z_order)
         self.controller.event_bus.publish(Event(EventType.SHAPE_UPDATED, {
             'shape': shape
@@ -255,7 +261,6 @@ class AnnotationCanvas(pg.PlotWidget):
     
     def bring_shape_to_front(self, shape: BaseShape) -> None:
         """将图形置于最前"""
-        from ..events import Event, EventType
         shape.bring_to_front()
         self.controller.event_bus.publish(Event(EventType.SHAPE_UPDATED, {
             'shape': shape
@@ -263,7 +268,6 @@ class AnnotationCanvas(pg.PlotWidget):
     
     def send_shape_to_back(self, shape: BaseShape) -> None:
         """将图形置于最后"""
-        from ..events import Event, EventType
         shape.send_to_back()
         self.controller.event_bus.publish(Event(EventType.SHAPE_UPDATED, {
             'shape': shape
@@ -319,18 +323,19 @@ class AnnotationCanvas(pg.PlotWidget):
         return self.controller.get_operation_history()
     
     # 数据导入导出
-    def export_data(self) -> dict:
-        """导出数据"""
-        return self.controller.data_manager.export_data()
+    def export_data(self, compact: bool = False) -> dict:
+        """导出数据（compact 为 True 时多边形顶点以 base64 编码）"""
+        return self.controller.data_manager.export_data(compact)
     
     def import_data(self, data: dict) -> None:
-        """导入数据"""
+        """导入数据（导入的图形按样式合并绘制）"""
         self.controller.data_manager.import_data(data)
+        self.controller.data_access.invalidate()  # 直接导入不发布图形事件
+        self.controller.renderer.batch_static_shapes()
     
     def _subscribe_events(self) -> None:
         """订阅事件"""
         # 订阅模式改变事件
-        from ..events import EventType
         self.event_bus.subscribe(EventType.MODE_CHANGED, self._on_mode_changed)
     
     def _on_mode_changed(self, event) -> None:
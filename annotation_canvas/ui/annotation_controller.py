@@ -3,10 +3,10 @@
 """
 
 from typing import Optional, List
-from PySide6.QtCore import QPointF, Qt
+from PySide6.QtCore import QPointF, QRectF, Qt
 from PySide6.QtGui import QMouseEvent, QKeyEvent, QWheelEvent
 
-from ..events import EventBus, Event, EventType, EventDataAccess, EventDataProvider
+from ..events import EventBus, Event, EventType, EventDataAccess, EventDataProvider, QueryRegistry
 from ..data import DataManager
 from ..input import InputHandler
 from ..state import StateManager
@@ -15,6 +15,7 @@ from ..core import DrawType, DrawColor, PenWidth, OperationState
 from ..models import BaseShape
 from ..operations import OperationManager
 from ..di import DIContainer
+from ..utils.constants import KeyConstants
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -47,9 +48,10 @@ class AnnotationController:
         self.renderer = self.container.get(CanvasRenderer)
         self.operation_manager = self.container.get(OperationManager)
         
-        # 创建事件数据访问
-        self.data_access = EventDataAccess(self.event_bus)
-        self.data_provider = EventDataProvider(self.event_bus, self.data_manager)
+        # 创建数据查询注册表与数据访问
+        self.query_registry = QueryRegistry()
+        self.data_provider = EventDataProvider(self.query_registry, self.data_manager)
+        self.data_access = EventDataAccess(self.event_bus, self.query_registry)
         
         # 设置调试模式
         self.event_bus.set_debug_mode(False)
@@ -57,6 +59,10 @@ class AnnotationController:
         # 订阅全局事件
         self._subscribe_global_events()
         
+        # 视口裁剪：视图范围变化时只显示与视口相交的图形
+        self._viewport_rect: Optional[QRectF] = None
+        self.canvas.plotItem.vb.sigRangeChanged.connect(self._on_view_range_changed)
+        
     
     def _register_services(self):
         """注册服务到依赖注入容器"""
@@ -81,6 +87,9 @@ class AnnotationController:
         # 注册操作管理器（单例，依赖事件总线）
         self.container.register_singleton(OperationManager, OperationManager, [EventBus])
         
+        # 校验依赖关系并生成解析计划
+        self.container.build()
+        
     
     def _subscribe_global_events(self) -> None:
         """订阅全局事件"""
@@ -105,8 +114,6 @@ class AnnotationController:
     def _on_mode_changed(self, event: Event) -> None:
         """处理模式变化事件"""
         if event.data.get('key_event'):
-            from ..utils.constants import KeyConstants
-            
             key = event.data['key']
             ctrl_pressed = event.data['ctrl_pressed']
             
@@ -154,6 +161,9 @@ class AnnotationController:
         """处理图形添加事件"""
         shape = event.data.get('shape')
         if shape:
+            # 撤销删除等恢复的图形可能位于视口之外
+            self._update_shape_visibility(shape)
+            
             # 发出画布信号
             self.canvas.shape_added.emit(shape)
     
@@ -161,6 +171,9 @@ class AnnotationController:
         """处理图形更新事件"""
         shape = event.data.get('shape')
         if shape:
+            # 图形可能被移入或移出视口
+            self._update_shape_visibility(shape)
+            
             # 发出画布信号
             self.canvas.shape_updated.emit(shape)
     
@@ -203,6 +216,46 @@ class AnnotationController:
         if operation:
             pass
     
+    def _on_view_range_changed(self, *args) -> None:
+        """处理视图范围变化"""
+        self._update_visible_shapes(self.canvas.plotItem.vb.viewRect())
+    
+    def _update_visible_shapes(self, viewport_rect: QRectF) -> None:
+        """
+        按视口裁剪图形：与视口相交的图形显示，其余隐藏
+        
+        Args:
+            viewport_rect: 视口矩形（世界坐标）
+        """
+        self._viewport_rect = QRectF(viewport_rect)
+        store = self.data_manager.get_shape_store()
+        in_view = store.query_rect_mask(
+            viewport_rect.left(), viewport_rect.top(),
+            viewport_rect.right(), viewport_rect.bottom()
+        )
+        
+        for shape, visible in zip(store.get_shapes(), in_view.tolist()):
+            graphics_item = shape.graphics_item
+            if graphics_item is None:
+                continue
+            visible = visible and shape.visible
+            if graphics_item.isVisible() != visible:
+                graphics_item.setVisible(visible)
+    
+    def _update_shape_visibility(self, shape: BaseShape) -> None:
+        """按当前视口更新单个图形的可见性"""
+        graphics_item = shape.graphics_item
+        if graphics_item is None or self._viewport_rect is None:
+            return
+        # 不使用 QRectF.intersects：点图形等零面积边界会被判为不相交
+        view = self._viewport_rect
+        bounds = shape.get_bounds()
+        visible = (shape.visible
+                   and bounds.right() >= view.left() and bounds.left() <= view.right()
+                   and bounds.bottom() >= view.top() and bounds.top() <= view.bottom())
+        if graphics_item.isVisible() != visible:
+            graphics_item.setVisible(visible)
+    
     # 公共方法 - 使用事件驱动的方式
     def get_shape_at_position(self, position: QPointF, tolerance: float = None) -> Optional[BaseShape]:
         """获取指定位置的图形（事件驱动）"""
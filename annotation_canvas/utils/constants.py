@@ -64,6 +64,15 @@ class InteractionConstants:
     # 图形中心区域比例
     SHAPE_CENTER_RATIO = 0.3
     
+    # 空间索引网格单元大小（世界坐标）
+    SPATIAL_INDEX_CELL_SIZE = 50.0
+    
+    # 单个图形最多占用的网格数，超出则放入大图形集合
+    SPATIAL_INDEX_MAX_CELLS = 256
+    
+    # 鼠标移动事件合并间隔（毫秒，约一帧）
+    MOUSE_MOVE_COALESCE_MS = 16
+    
     
     # 默认像素大小
     DEFAULT_PIXEL_SIZE = 0.01
@@ -203,6 +212,19 @@ class ZAxisConstants:
 class OperationConstants:
     """操作相关常量"""
     
+    # 撤销历史容量（未指定容量时使用；安装 psutil 时按可用内存在上下限之间调整）
+    HISTORY_DEFAULT_SIZE = 200
+    HISTORY_MIN_SIZE = 30
+    HISTORY_MAX_SIZE = 500
+    
+    # 按可用内存估算容量时单个操作的平均内存占用（字节）
+    HISTORY_AVG_OPERATION_BYTES = 64 * 1024
+    
+    # 每执行多少个操作重新估算一次历史容量
+    HISTORY_RESIZE_INTERVAL = 50
+    
+    # 同一图形的连续移动/缩放在该时间窗口（秒）内合并为一条历史记录
+    HISTORY_MERGE_WINDOW = 0.5
     
     # 操作描述
     OPERATION_CREATE_POINT = "创建POINT图形"
@@ -8,6 +8,8 @@ from typing import List, Tuple, Optional
 from PySide6.QtCore import QPointF, QRectF
 import math
 
+from .constants import InteractionConstants
+
 class GeometryUtils:
     """几何计算工具类"""
     
@@ -92,19 +94,14 @@ class GeometryUtils:
             return False
         
         x, y = point.x(), point.y()
-        n = len(vertices)
         inside = False
         
-        p1x, p1y = vertices[0].x(), vertices[0].y()
-        for i in range(1, n + 1):
-            p2x, p2y = vertices[i % n].x(), vertices[i % n].y()
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
+        # Franklin交叉数法：每条边一个布尔表达式，水平边不跨越射线（短路求值保证不会除零）
+        last = vertices[-1]
+        p1x, p1y = last.x(), last.y()
+        for vertex in vertices:
+            p2x, p2y = vertex.x(), vertex.y()
+            inside ^= ((p2y > y) != (p1y > y)) and x < (p1x - p2x) * (y - p2y) / (p1y - p2y) + p2x
             p1x, p1y = p2x, p2y
         
         return inside
@@ -189,7 +186,6 @@ class GeometryUtils:
     @staticmethod
     def snap_to_point(point: QPointF, snap_points: List[QPointF], tolerance: float = None) -> Optional[QPointF]:
         """将点吸附到最近的吸附点"""
-        from ..utils.constants import InteractionConstants
         if tolerance is None:
             tolerance = InteractionConstants.SHAPE_DEFAULT_TOLERANCE
             
@@ -0,0 +1,74 @@
+# This Python file uses the following encoding: utf-8
+
+"""
+序列化工具 - JSON 读写与坐标数组编码
+
+安装 orjson 时使用 orjson 编解码（比标准库 json 快数倍），未安装时退回标准库 json，
+两者输出格式一致（UTF-8、两空格缩进）。
+"""
+
+import base64
+import json
+from typing import Any, Union
+
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+# 坐标数组编码使用的字节序与精度（小端 float64，无损）
+_POINTS_DTYPE = np.dtype('<f8')
+
+
+def dumps(data: Any, indent: bool = True) -> bytes:
+    """
+    将数据编码为 UTF-8 JSON 字节串
+
+    Args:
+        data: 要编码的数据
+        indent: 是否缩进（两空格）
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def loads(raw: Union[bytes, str]) -> Any:
+    """解码 JSON 字节串或字符串"""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def save_json(file_path: str, data: Any, indent: bool = True) -> None:
+    """将数据写入 JSON 文件"""
+    with open(file_path, 'wb') as f:
+        f.write(dumps(data, indent))
+
+
+def load_json(file_path: str) -> Any:
+    """从 JSON 文件读取数据"""
+    with open(file_path, 'rb') as f:
+        return loads(f.read())
+
+
+def pack_points(points: np.ndarray) -> str:
+    """
+    将 (n, 2) 坐标数组编码为 base64 字符串
+
+    比嵌套列表体积更小，解析时无需逐个转换数字
+    """
+    return base64.b64encode(np.ascontiguousarray(points, dtype=_POINTS_DTYPE).tobytes()).decode('ascii')
+
+
+def unpack_points(text: str) -> np.ndarray:
+    """将 pack_points 生成的字符串解码为 (n, 2) float64 数组"""
+    buffer = base64.b64decode(text)
+    return np.frombuffer(buffer, dtype=_POINTS_DTYPE).astype(np.float64).reshape(-1, 2)
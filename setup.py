@@ -45,8 +45,16 @@ setup(
     install_requires=[
         "PySide6>=6.0.0",
         "pyqtgraph>=0.12.0",
+        "numpy>=1.17",
     ],
     extras_require={
+        "speedups": [
+            "numba>=0.50",
+            "orjson>=3.0",
+            "msgpack>=1.0",
+            "psutil>=5.0",
+            "ijson>=3.1",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-qt>=4.0",